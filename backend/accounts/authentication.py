@@ -0,0 +1,39 @@
+"""
+유저 조회를 캐시하는 JWT 인증
+
+simplejwt JWTAuthentication은 요청마다 User 행(pref_* 포함 전체 컬럼)을 DB에서 조회합니다.
+CachedJWTAuthentication은 (유저 id, 유저 버전) 키로 캐시된 User를 먼저 찾고, 없을 때만 DB를 조회합니다.
+- 캐시에는 비밀번호 해시 대신 토큰 폐기 검사용 md5만 저장 (accounts.caching)
+- 유저 버전은 User 저장/삭제, 권한 변경(accounts.signals), 선호도/통계 F-update 경로에서 올라감
+- 적중률: manage.py auth_cache_stats
+"""
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .caching import get_auth_user, set_auth_user, record_auth_cache
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        user, password_hash, key = get_auth_user(user_id)
+        record_auth_cache(hit=user is not None)
+        if user is None:
+            # ---- 미스: 기존 조회 + 검사 후 캐시 ----
+            user = super().get_user(validated_token)
+            set_auth_user(key, user)
+            return user
+
+        # ---- 적중: DB 조회 없이 같은 검사만 ----
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != password_hash:
+            raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+        return user
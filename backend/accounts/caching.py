@@ -0,0 +1,129 @@
+"""
+accounts 캐시 키 및 무효화 헬퍼
+
+- 마이페이지: 최근 시청/좋아요 top-10 목록을 유저별로 저장 (시청 기록 반영, 좋아요 토글 시 삭제)
+  키에 홈 카테고리 버전을 포함 → 관리자 영화 수정(제목/포스터) 시 함께 무효화
+- 인증 유저: JWT 인증 시 조회한 User 행을 (유저 id, 유저 버전) 키로 저장
+  비밀번호 해시는 저장하지 않고 토큰 폐기 검사용 md5만 저장 (password는 지연 로딩 필드로 복원)
+  프로필/선호도/권한/통계가 바뀌면 유저 버전을 올려 이전 키를 무효화
+"""
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from home.caching import get_category_version
+
+MYPAGE_LISTS_TIMEOUT = 60 * 60  # 1시간
+
+
+def mypage_lists_key(user_id):
+    return f"accounts:mypage_lists:{get_category_version()}:{user_id}"
+
+
+def get_mypage_lists(user_id):
+    """캐시된 목록 ({"recordmovie": {...}, "mylistmovie": {...}}) 또는 None"""
+    return cache.get(mypage_lists_key(user_id))
+
+
+def set_mypage_lists(user_id, lists):
+    cache.set(mypage_lists_key(user_id), lists, MYPAGE_LISTS_TIMEOUT)
+
+
+def invalidate_mypage_lists(user_ids):
+    """시청 기록 반영 / 좋아요 토글 시 해당 유저들의 목록 캐시 삭제"""
+    cache.delete_many([mypage_lists_key(user_id) for user_id in user_ids])
+
+
+# ========== 유저 버전 ==========
+def user_version_key(user_id):
+    return f"accounts:user_version:{user_id}"
+
+
+def get_user_version(user_id):
+    """현재 유저 버전 (캐시에서 사라졌다면 이전 값과 겹치지 않도록 현재 시각으로 초기화)"""
+    key = user_version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time()), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_user_versions(user_ids):
+    """유저 행이 바뀐 경우 (save, F-update, 권한 변경) 버전을 올려 인증 유저 캐시 무효화"""
+    for user_id in user_ids:
+        try:
+            cache.incr(user_version_key(user_id))
+        except ValueError:
+            get_user_version(user_id)
+            cache.incr(user_version_key(user_id))
+
+
+# ========== 인증 유저 캐시 ==========
+AUTH_CACHE_STATS_KEYS = {True: 'accounts:auth_cache:hits', False: 'accounts:auth_cache:misses'}
+AUTH_CACHE_STATS_FLUSH_EVERY = 100  # 프로세스별 카운터를 공유 캐시에 합산하는 주기 (조회 수)
+
+_auth_cache_stats = {True: 0, False: 0}
+
+
+def auth_user_key(user_id, version):
+    return f"accounts:auth_user:{user_id}:{version}"
+
+
+AUTH_USER_EXCLUDED_FIELDS = ('password',)
+
+
+def get_auth_user(user_id):
+    """(캐시된 User 인스턴스, 비밀번호 md5) 또는 (None, None), 저장할 때 쓸 키"""
+    key = auth_user_key(user_id, get_user_version(user_id))
+    cached = cache.get(key)
+    if cached is None:
+        return None, None, key
+    fields, password_hash = cached
+    # 캐시에 없는 password는 지연 로딩 필드 → 비밀번호 확인/변경처럼 실제로 읽을 때만 조회
+    user = get_user_model().from_db(DEFAULT_DB_ALIAS, list(fields), list(fields.values()))
+    return user, password_hash, key
+
+
+def set_auth_user(key, user):
+    fields = {
+        field.attname: getattr(user, field.attname)
+        for field in user._meta.concrete_fields if field.attname not in AUTH_USER_EXCLUDED_FIELDS
+    }
+    cache.set(key, (fields, get_md5_hash_password(user.password)), settings.AUTH_USER_CACHE_TIMEOUT)
+
+
+def record_auth_cache(hit):
+    """적중/미스를 프로세스별로 세다가 일정 주기마다 공유 캐시에 합산 (요청마다 캐시 쓰기를 하지 않도록)"""
+    _auth_cache_stats[hit] += 1
+    if sum(_auth_cache_stats.values()) >= AUTH_CACHE_STATS_FLUSH_EVERY:
+        flush_auth_cache_stats()
+
+
+def flush_auth_cache_stats():
+    for hit, count in _auth_cache_stats.items():
+        if count:
+            key = AUTH_CACHE_STATS_KEYS[hit]
+            cache.add(key, 0, None)
+            cache.incr(key, count)
+            _auth_cache_stats[hit] = 0
+
+
+def get_auth_cache_stats():
+    """전체 프로세스 합산 적중/미스 수와 적중률 (아직 합산되지 않은 이 프로세스 카운터 포함)"""
+    flush_auth_cache_stats()
+    values = cache.get_many(AUTH_CACHE_STATS_KEYS.values())
+    hits = values.get(AUTH_CACHE_STATS_KEYS[True], 0)
+    misses = values.get(AUTH_CACHE_STATS_KEYS[False], 0)
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_ratio": round(hits / total, 4) if total else None}
+
+
+def reset_auth_cache_stats():
+    for hit in _auth_cache_stats:
+        _auth_cache_stats[hit] = 0
+    cache.delete_many(AUTH_CACHE_STATS_KEYS.values())
@@ -0,0 +1,129 @@
+"""
+회원 탈퇴 처리
+
+UserProfileDeleteView → request_account_deletion(): 즉시 비활성화 (로그인/인증 차단) 후 응답
+purge_deleted_users 작업 → purge_user(): 연관 데이터를 테이블별로 chunk_size개씩 나눠 삭제
+
+- 청크마다 별도 트랜잭션 → 한 번에 오래 잠그지 않음, 중간에 중단돼도 다시 실행하면 이어서 삭제
+- 좋아요/리뷰 청크를 지울 때 같은 트랜잭션에서 영화 like_count / review_count·review_sum·review_average,
+  커뮤니티 리뷰 like_count 보정 (comment_count는 ReviewComment post_delete 시그널이 갱신)
+- 핫 테이블 시청 기록을 지운 뒤 콜드 아카이브(월별 파일)에서도 유저 기록 제거
+- 연관 데이터가 모두 지워지면 마지막으로 User 행 삭제
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from community.caching import invalidate_review_details
+from community.likes import decrement_like_counts
+from community.models import Review, ReviewComment
+from home.caching import invalidate_movie_detail
+from home.models import MovieReview
+from home.views import update_movie_review_stats
+from movies.models import Comment, Movie
+from .caching import invalidate_mypage_lists
+from .history_archive import archive_lock, purge_archived_user
+from .models import User, UserLikeList, UserMovieHistory, UserMyList
+from .watch_history import recover_archived_histories
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def request_account_deletion(user):
+    """탈퇴 요청: 비활성화 + 요청 시각 기록 (저장 시 유저 버전 증가 → 캐시된 인증도 즉시 차단)"""
+    user.is_active = False
+    user.deletion_requested_at = timezone.now()
+    user.save(update_fields=['is_active', 'deletion_requested_at'])
+
+
+def pending_deletion_user_ids():
+    return list(
+        User.objects.filter(deletion_requested_at__isnull=False, is_active=False)
+        .order_by('deletion_requested_at').values_list('id', flat=True)
+    )
+
+
+# ========== 청크 삭제 ==========
+def delete_in_chunks(queryset, chunk_size, on_chunk=None):
+    """
+    queryset을 chunk_size개씩 트랜잭션별로 삭제합니다. → 삭제한 행 수
+    on_chunk(pks): 같은 트랜잭션 안에서 카운터 보정 (삭제 전에 호출)
+    """
+    deleted = 0
+    model = queryset.model
+    while True:
+        pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:chunk_size])
+        if not pks:
+            return deleted
+        with transaction.atomic():
+            if on_chunk:
+                on_chunk(pks)
+            deleted += model.objects.filter(pk__in=pks).delete()[0]
+
+
+def fix_like_counts(pks):
+    """삭제할 좋아요 청크만큼 영화 like_count 감소 (같은 감소량끼리 UPDATE 1회)"""
+    per_movie = Counter(UserLikeList.objects.filter(pk__in=pks).values_list('movie_id', flat=True))
+    by_count = defaultdict(list)
+    for movie_id, count in per_movie.items():
+        by_count[count].append(movie_id)
+    for count, movie_ids in by_count.items():
+        Movie.objects.filter(pk__in=movie_ids).update(like_count=F('like_count') - count, updated_at=timezone.now())
+
+
+def fix_review_like_counts(pks):
+    """삭제할 커뮤니티 리뷰 좋아요 청크만큼 리뷰 like_count 감소 + 상세 캐시 무효화"""
+    review_ids = list(Review.like_users.through.objects.filter(pk__in=pks).values_list('review_id', flat=True))
+    decrement_like_counts(review_ids)
+    transaction.on_commit(lambda: invalidate_review_details(review_ids))
+
+
+def forget_community_reviews(pks):
+    """삭제할 커뮤니티 리뷰 청크의 상세 캐시 무효화"""
+    transaction.on_commit(lambda: invalidate_review_details(pks))
+
+
+def fix_review_stats(pks):
+    """삭제할 리뷰 청크만큼 영화 리뷰 통계 감소 + 상세 캐시 무효화"""
+    stats = defaultdict(lambda: [0, 0])
+    for movie_id, rating in MovieReview.objects.filter(pk__in=pks).values_list('movie_id', 'rating'):
+        stats[movie_id][0] += 1
+        stats[movie_id][1] += rating
+    movies = Movie.objects.filter(pk__in=stats).only('id', 'movie_id')
+    for movie in movies:
+        count, total = stats[movie.pk]
+        update_movie_review_stats(movie, -count, -total)
+    transaction.on_commit(lambda: [invalidate_movie_detail(movie.movie_id) for movie in movies])
+
+
+def purge_user(user_id, chunk_size=DEFAULT_CHUNK_SIZE):
+    """탈퇴 요청된 유저의 연관 데이터를 청크 단위로 삭제한 뒤 User 행 삭제 → 테이블별 삭제 수"""
+    if not User.objects.filter(pk=user_id, deletion_requested_at__isnull=False, is_active=False).exists():
+        return {}
+    like_through = Review.like_users.through
+    steps = [
+        ('liked_movies', UserLikeList.objects.filter(user_id=user_id), fix_like_counts),
+        ('movie_reviews', MovieReview.objects.filter(author_id=user_id), fix_review_stats),
+        ('watch_histories', UserMovieHistory.objects.filter(user_id=user_id), None),
+        ('my_lists', UserMyList.objects.filter(user_id=user_id), None),
+        ('shorts_comments', Comment.objects.filter(user_id=user_id), None),
+        ('review_comments', ReviewComment.objects.filter(user_id=user_id), None),
+        ('review_likes', like_through.objects.filter(user_id=user_id), fix_review_like_counts),
+        # 탈퇴 유저가 쓴 커뮤니티 리뷰에 달린 댓글/좋아요 → 리뷰 순서로 삭제 (리뷰 삭제 cascade가 커지지 않도록)
+        ('comments_on_reviews', ReviewComment.objects.filter(review__user_id=user_id), None),
+        ('likes_on_reviews', like_through.objects.filter(review__user_id=user_id), None),
+        ('community_reviews', Review.objects.filter(user_id=user_id), forget_community_reviews),
+    ]
+    result = {}
+    for name, queryset, on_chunk in steps:
+        result[name] = delete_in_chunks(queryset, chunk_size, on_chunk)
+    # 핫 테이블 기록이 모두 지워진 뒤라 이후 정리 작업이 이 유저 기록을 다시 아카이브하지 않음
+    with archive_lock():
+        recover_archived_histories()
+        result['archived_watch_histories'] = purge_archived_user(user_id)
+
+    User.objects.filter(pk=user_id).delete()
+    invalidate_mypage_lists([user_id])
+    return result
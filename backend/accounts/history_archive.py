@@ -0,0 +1,198 @@
+"""
+시청 기록 콜드 아카이브
+
+trim_watch_history가 보관 한도 밖 기록을 삭제하기 전에 월별 gzip NDJSON 파일에 덧붙입니다.
+    WATCH_HISTORY_ARCHIVE_DIR/2026-10.ndjson.gz
+
+- append-only: 청크마다 gzip member 하나를 파일 끝에 한 번에 씀 (gzip 리더는 이어진 member를 한 스트림으로 읽음)
+- 쓸 때 중복 방지: 덧붙이기 전 저널({월}.journal: 덧붙이기 전 파일 크기 + 기록 id)을 남기고, DB 삭제가 끝나면 지움
+  삭제 전에 중단돼 저널이 남아 있으면 다음 정리 시작 시 recover_archives()가
+  기록이 아직 DB에 있으면(삭제 미완료) 덧붙인 member를 잘라내고, 없으면(삭제 완료) 그대로 둠 → 파일에는 기록이 한 번만
+- 오프라인 작업은 iter_archived_histories()로 핫 테이블을 건드리지 않고 월 단위로 스트리밍 (메모리 일정)
+- 탈퇴 유저 기록은 purge_archived_user()가 월 파일을 그 유저 기록 없이 다시 써서 제거
+  (덧붙이기/저널 복구/다시 쓰기는 archive_lock()으로 직렬화 → 정리 작업과 탈퇴 작업이 동시에 파일을 건드리지 않음)
+"""
+import gzip
+import json
+import os
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows 로컬 개발: 잠금 없이 동작
+    fcntl = None
+
+FILE_SUFFIX = '.ndjson.gz'
+JOURNAL_SUFFIX = '.journal'
+LOCK_NAME = '.lock'
+ARCHIVE_FIELDS = ('id', 'user_id', 'movie_id', 'movie__movie_id', 'watch_time', 'watched_at')
+
+
+def archive_dir():
+    """아카이브 디렉터리 (설정이 비어 있으면 None → 아카이브 안 함)"""
+    path = settings.WATCH_HISTORY_ARCHIVE_DIR
+    return Path(path) if path else None
+
+
+def month_key(dt):
+    """파일 단위 월 (aware datetime은 UTC 기준)"""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(dt_timezone.utc)
+    return dt.strftime('%Y-%m')
+
+
+@contextmanager
+def archive_lock():
+    """아카이브 디렉터리 단위 프로세스 간 배타 잠금 (중첩 호출 금지)"""
+    directory = archive_dir()
+    if directory is None or fcntl is None:
+        yield
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / LOCK_NAME, 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+# ========== 쓰기 ==========
+def archive_histories(rows):
+    """
+    UserMovieHistory.values(*ARCHIVE_FIELDS) 행들을 월별 파일에 덧붙입니다. → 기록한 행 수
+    원본 행을 삭제한 뒤 commit_archives()를 호출해야 저널이 정리됩니다.
+    """
+    directory = archive_dir()
+    if directory is None or not rows:
+        return 0
+    directory.mkdir(parents=True, exist_ok=True)
+
+    lines_by_month, ids_by_month = defaultdict(list), defaultdict(list)
+    for row in rows:
+        record = {
+            "id": row['id'],
+            "user_id": row['user_id'],
+            "movie_id": row['movie_id'],
+            "tmdb_id": row['movie__movie_id'],
+            "watch_time": row['watch_time'],
+            "watched_at": row['watched_at'].isoformat(),
+        }
+        month = month_key(row['watched_at'])
+        lines_by_month[month].append(json.dumps(record, ensure_ascii=False))
+        ids_by_month[month].append(row['id'])
+
+    for month, lines in lines_by_month.items():
+        path = directory / f'{month}{FILE_SUFFIX}'
+        member = gzip.compress(('\n'.join(lines) + '\n').encode('utf-8'))
+        size = path.stat().st_size if path.exists() else 0
+        write_journal(directory / f'{month}{JOURNAL_SUFFIX}', {"size": size, "ids": ids_by_month[month]})
+        with open(path, 'ab') as f:
+            f.write(member)
+    return len(rows)
+
+
+def write_journal(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def commit_archives():
+    """원본 행 삭제가 끝난 뒤 저널 정리"""
+    directory = archive_dir()
+    if directory is None or not directory.exists():
+        return
+    for journal in directory.glob(f'*{JOURNAL_SUFFIX}'):
+        journal.unlink()
+
+
+def recover_archives(still_exists):
+    """
+    중단된 아카이브 복구 (정리 시작 시 호출)
+    still_exists(ids): 저널의 기록이 아직 DB에 남아 있는지 → 남아 있으면 덧붙인 member를 잘라냄 (다시 아카이브됨)
+    - 저널만 쓰고 덧붙이기 전에 중단된 경우(파일 없음 / 크기 그대로)나 저널이 깨진 경우는 자를 것이 없음
+    - 저널은 항상 지움 → 남은 저널 때문에 이후 정리가 계속 실패하지 않도록
+    """
+    directory = archive_dir()
+    if directory is None or not directory.exists():
+        return
+    for journal in directory.glob(f'*{JOURNAL_SUFFIX}'):
+        try:
+            data = json.loads(journal.read_text(encoding='utf-8'))
+        except ValueError:
+            data = None  # 저널 기록 중 중단 → 덧붙이기 전
+        path = directory / f'{journal.name[:-len(JOURNAL_SUFFIX)]}{FILE_SUFFIX}'
+        if data and path.exists() and path.stat().st_size > data["size"] and still_exists(data["ids"]):
+            with open(path, 'r+b') as f:
+                f.truncate(data["size"])
+        journal.unlink()
+
+
+def purge_archived_user(user_id):
+    """
+    탈퇴 유저의 아카이브 기록 제거 (archive_lock 안에서, recover_archives 후 호출) → 제거한 기록 수
+    월 파일을 한 줄씩 임시 파일로 옮겨 쓰며 해당 유저 줄만 빼고, 제거한 줄이 있을 때만 원본을 교체 (메모리 일정)
+    """
+    removed = 0
+    directory = archive_dir()
+    for month in archived_months():
+        path = directory / f'{month}{FILE_SUFFIX}'
+        tmp_path = directory / f'{month}{FILE_SUFFIX}.tmp'
+        month_removed = kept = 0
+        with gzip.open(path, 'rt', encoding='utf-8') as src, gzip.open(tmp_path, 'wt', encoding='utf-8') as dst:
+            for line in src:
+                if json.loads(line)["user_id"] == user_id:
+                    month_removed += 1
+                    continue
+                dst.write(line)
+                kept += 1
+        if not month_removed:
+            tmp_path.unlink()
+            continue
+        if kept:
+            with open(tmp_path, 'rb+') as f:
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        else:
+            tmp_path.unlink()
+            path.unlink()
+        removed += month_removed
+    return removed
+
+
+# ========== 읽기 ==========
+def archived_months():
+    """아카이브가 있는 월 목록 (오름차순, 'YYYY-MM')"""
+    directory = archive_dir()
+    if directory is None or not directory.exists():
+        return []
+    return sorted(path.name[:-len(FILE_SUFFIX)] for path in directory.glob(f'*{FILE_SUFFIX}'))
+
+
+def iter_archived_histories(start=None, end=None, user_id=None):
+    """
+    아카이브된 시청 기록을 월 순서대로 한 줄씩 스트리밍합니다.
+    - start/end: watched_at 범위 (datetime, start 이상 end 미만)
+    - user_id: 특정 유저만
+    yield: {"id", "user_id", "movie_id", "tmdb_id", "watch_time", "watched_at"(datetime)}
+    """
+    directory = archive_dir()
+    for month in archived_months():
+        if (start and month < month_key(start)) or (end and month > month_key(end)):
+            continue
+        with gzip.open(directory / f'{month}{FILE_SUFFIX}', 'rt', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if user_id is not None and record["user_id"] != user_id:
+                    continue
+                record["watched_at"] = datetime.fromisoformat(record["watched_at"])
+                if (start and record["watched_at"] < start) or (end and record["watched_at"] >= end):
+                    continue
+                yield record
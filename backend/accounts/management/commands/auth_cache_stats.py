@@ -0,0 +1,25 @@
+"""
+JWT 인증 유저 캐시 적중률 확인 (전체 프로세스 합산)
+
+사용법:
+    uv run python manage.py auth_cache_stats
+    uv run python manage.py auth_cache_stats --reset   # 출력 후 카운터 초기화
+"""
+from django.core.management.base import BaseCommand
+
+from accounts.caching import get_auth_cache_stats, reset_auth_cache_stats
+
+
+class Command(BaseCommand):
+    help = 'JWT 인증 유저 캐시의 적중/미스 수와 적중률을 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='출력 후 카운터 초기화')
+
+    def handle(self, *args, **options):
+        stats = get_auth_cache_stats()
+        ratio = '-' if stats['hit_ratio'] is None else f"{stats['hit_ratio']:.2%}"
+        self.stdout.write(f"적중 {stats['hits']}회 / 미스 {stats['misses']}회 (적중률 {ratio})")
+        if options['reset']:
+            reset_auth_cache_stats()
+            self.stdout.write(self.style.SUCCESS('카운터를 초기화했습니다.'))
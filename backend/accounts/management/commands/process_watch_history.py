@@ -0,0 +1,78 @@
+"""
+Redis Stream에 적재된 시청 기록 이벤트를 배치로 DB에 반영하는 워커
+
+- 반영에 실패한 배치는 확인(ACK)하지 않고 --retry-delay 뒤 미확인 이벤트를 한 건씩 다시 반영
+  → 문제 이벤트만 전달 횟수가 쌓여 WATCH_EVENT_MAX_DELIVERIES에 이르면 dead letter Stream으로 이동
+
+사용법:
+    uv run python manage.py process_watch_history
+    uv run python manage.py process_watch_history --once   # 쌓인 이벤트만 처리하고 종료
+"""
+import logging
+import os
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from accounts.watch_history import (
+    ensure_consumer_group,
+    read_watch_events,
+    split_dead_letters,
+    dead_letter_watch_events,
+    apply_watch_events,
+    ack_watch_events,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Redis Stream의 시청 기록 이벤트를 배치로 DB에 반영합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='한 번에 반영할 최대 이벤트 수')
+        parser.add_argument('--block-ms', type=int, default=5000, help='새 이벤트 대기 시간 (ms)')
+        parser.add_argument('--consumer', default=f'{socket.gethostname()}-{os.getpid()}', help='consumer 이름')
+        parser.add_argument('--once', action='store_true', help='대기 중인 이벤트를 모두 처리하면 종료')
+        parser.add_argument('--retry-delay', type=float, default=5, help='반영 실패 후 재시도 대기 시간 (초)')
+
+    def handle(self, *args, **options):
+        ensure_consumer_group()
+        consumer, batch_size = options['consumer'], options['batch_size']
+        self.stdout.write(self.style.NOTICE(f'시청 기록 워커 시작 ({consumer})'))
+
+        # ---- 이전 실행에서 확인(ACK)하지 못한 이벤트부터 처리 ----
+        pending, count = True, batch_size
+        total = 0
+        while True:
+            entries = read_watch_events(consumer, count, options['block_ms'], pending=pending)
+            if not entries:
+                if pending:
+                    pending, count = False, batch_size
+                    continue
+                if options['once']:
+                    break
+                continue
+
+            entries, dead = split_dead_letters(consumer, entries, pending=pending)
+            dead_letter_watch_events(dead)
+            if not entries:
+                continue
+
+            entry_ids = [entry_id for entry_id, _ in entries]
+            try:
+                applied = apply_watch_events([event for _, event in entries], entry_ids)
+            except Exception:
+                # 실패한 배치는 미확인 상태로 남김 → 한 건씩 다시 읽어 문제 이벤트만 재전달 횟수가 쌓이도록
+                logger.exception("시청 이벤트 반영 실패 — %s초 뒤 재시도", options['retry_delay'])
+                close_old_connections()
+                pending, count = True, 1
+                time.sleep(options['retry_delay'])
+                continue
+            ack_watch_events(entry_ids)
+            total += len(entries)
+            self.stdout.write(f'  ... 이벤트 {len(entries)}개 처리 (반영 {applied}개, 누적 {total}개)')
+
+        self.stdout.write(self.style.SUCCESS(f'시청 기록 {total}개 처리 완료!'))
@@ -0,0 +1,28 @@
+"""
+탈퇴 요청된(비활성화된) 유저의 연관 데이터를 청크 단위로 삭제하고 카운터를 보정하는 작업
+
+사용법:
+    uv run python manage.py purge_deleted_users                  # 1회 실행 (cron)
+    uv run python manage.py purge_deleted_users --interval 60    # 1분마다 반복
+"""
+from django.core.management.base import BaseCommand
+
+from accounts.deletion import pending_deletion_user_ids, purge_user, DEFAULT_CHUNK_SIZE
+from config.periodic import run_periodically
+
+
+class Command(BaseCommand):
+    help = '탈퇴 요청된 유저의 데이터를 청크 단위로 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='트랜잭션당 삭제할 최대 행 수')
+        parser.add_argument('--interval', type=int, default=0, help='반복 주기 (초, 0이면 1회 실행 후 종료)')
+
+    def handle(self, *args, **options):
+        def purge():
+            for user_id in pending_deletion_user_ids():
+                result = purge_user(user_id, options['chunk_size'])
+                summary = ', '.join(f'{name} {count}' for name, count in result.items() if count)
+                self.stdout.write(self.style.SUCCESS(f'유저 {user_id} 삭제 완료 ({summary or "연관 데이터 없음"})'))
+
+        run_periodically(purge, options['interval'])
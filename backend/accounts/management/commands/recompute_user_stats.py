@@ -0,0 +1,53 @@
+"""
+유저별 마이페이지 통계(total_watch_time, like_count)를 재계산하는 Management Command
+
+시청 기록 파이프라인과 좋아요 토글은 통계를 증분 갱신하므로, 영화 삭제로 좋아요가 함께 지워졌거나
+초기 데이터를 직접 넣은 경우 이 명령으로 정합성을 맞춥니다.
+(total_watch_time은 보관 한도 밖으로 아카이브된 기록까지 포함한 누적값이므로 --watch-time을 줄 때만 재계산)
+
+사용법:
+    uv run python manage.py recompute_user_stats
+    uv run python manage.py recompute_user_stats --watch-time   # 남아 있는 시청 기록 기준으로 누적 시청 시간도 재계산
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+
+from accounts.models import User, UserMovieHistory, UserLikeList
+from accounts.caching import bump_user_versions
+
+
+class Command(BaseCommand):
+    help = '좋아요/시청 기록을 한 번의 그룹 쿼리로 집계하여 유저별 마이페이지 통계를 재계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='bulk_update 배치 크기')
+        parser.add_argument('--watch-time', action='store_true', help='total_watch_time도 시청 기록 기준으로 재계산')
+
+    def handle(self, *args, **options):
+        # ---- 유저별 좋아요 수 / 시청 시간 합계 (각각 단일 GROUP BY 쿼리) ----
+        like_counts = dict(
+            UserLikeList.objects.order_by().values('user_id').annotate(count=Count('id')).values_list('user_id', 'count')
+        )
+        fields = ['like_count']
+        watch_times = {}
+        if options['watch_time']:
+            fields.append('total_watch_time')
+            watch_times = dict(
+                UserMovieHistory.objects.order_by().values('user_id').annotate(total=Sum('watch_time')).values_list('user_id', 'total')
+            )
+
+        # ---- 값이 달라진 유저만 모아서 bulk_update ----
+        changed = []
+        users = User.objects.only('id', *fields).order_by('id')
+        for user in users.iterator(chunk_size=options['batch_size']):
+            values = {'like_count': like_counts.get(user.id, 0)}
+            if options['watch_time']:
+                values['total_watch_time'] = watch_times.get(user.id) or 0
+            if any(getattr(user, field) != value for field, value in values.items()):
+                for field, value in values.items():
+                    setattr(user, field, value)
+                changed.append(user)
+
+        User.objects.bulk_update(changed, fields, batch_size=options['batch_size'])
+        bump_user_versions([user.pk for user in changed])
+        self.stdout.write(self.style.SUCCESS(f'유저 통계 재계산 완료! ({len(changed)}명 보정)'))
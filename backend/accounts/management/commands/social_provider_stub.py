@@ -0,0 +1,33 @@
+"""
+소셜 로그인 부하 테스트용 로컬 provider 스텁 서버 실행
+
+사용법:
+    uv run python manage.py social_provider_stub --port 8089 --delay 0.05
+    # 백엔드는 아래 환경 변수로 스텁을 바라보게 실행
+    KAKAO_USERINFO_URL=http://127.0.0.1:8089/v2/user/me
+    GOOGLE_USERINFO_URL=http://127.0.0.1:8089/oauth2/v3/userinfo
+"""
+from django.core.management.base import BaseCommand
+
+from accounts.social_stub import make_stub_server, KAKAO_PATH, GOOGLE_PATH
+
+
+class Command(BaseCommand):
+    help = '카카오/구글 사용자 정보 API를 흉내 내는 로컬 스텁 서버를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8089)
+        parser.add_argument('--delay', type=float, default=0.0, help='응답 지연 (초)')
+
+    def handle(self, *args, **options):
+        server = make_stub_server(options['host'], options['port'], options['delay'])
+        host, port = server.server_address[:2]
+        self.stdout.write(self.style.SUCCESS(f'provider 스텁 실행: http://{host}:{port}{KAKAO_PATH}, http://{host}:{port}{GOOGLE_PATH}'))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(f'요청 {server.request_count}건 처리')
@@ -0,0 +1,30 @@
+"""
+보관 한도(WATCH_HISTORY_LIMIT)를 넘긴 유저의 오래된 시청 기록을 청크 단위로 아카이브 후 정리하는 주기 작업
+
+사용법:
+    uv run python manage.py trim_watch_history                  # 1회 실행 (cron)
+    uv run python manage.py trim_watch_history --interval 600   # 10분마다 반복
+"""
+from django.core.management.base import BaseCommand
+
+from accounts.watch_history import history_limit, users_over_history_limit, trim_watch_history
+from config.periodic import run_periodically
+
+
+class Command(BaseCommand):
+    help = '보관 한도를 넘긴 시청 기록을 청크 단위로 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=None, help='유저별 보관 한도 (기본: WATCH_HISTORY_LIMIT)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='한 번에 삭제할 최대 기록 수')
+        parser.add_argument('--interval', type=int, default=0, help='반복 주기 (초, 0이면 1회 실행 후 종료)')
+
+    def handle(self, *args, **options):
+        limit = options['limit'] or history_limit()
+
+        def trim():
+            user_ids = users_over_history_limit(limit)
+            deleted = trim_watch_history(user_ids, limit=limit, chunk_size=options['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(f'시청 기록 정리: 유저 {len(user_ids)}명, {deleted}개 삭제 (한도 {limit}개)'))
+
+        run_periodically(trim, options['interval'])
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-19 11:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_alter_user_id_alter_userlikelist_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usermoviehistory',
+            name='watched_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_alter_usermoviehistory_watched_at'),
+        ('movies', '0005_alter_movie_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usermoviehistory',
+            index=models.Index(fields=['user', 'movie', 'watched_at'], name='accounts_history_merge_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_usermoviehistory_merge_index'),
+        ('movies', '0005_alter_movie_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usermoviehistory',
+            index=models.Index(fields=['user', '-watched_at', '-id'], name='accounts_history_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-19 11:40
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_user_stats(apps, schema_editor):
+    """기존 시청 기록/좋아요 기준으로 total_watch_time / like_count 초기값 채우기"""
+    User = apps.get_model('accounts', 'User')
+    UserMovieHistory = apps.get_model('accounts', 'UserMovieHistory')
+    UserLikeList = apps.get_model('accounts', 'UserLikeList')
+    for row in UserMovieHistory.objects.order_by().values('user_id').annotate(total=Sum('watch_time')):
+        User.objects.filter(pk=row['user_id']).update(total_watch_time=row['total'] or 0)
+    for row in UserLikeList.objects.order_by().values('user_id').annotate(count=Count('id')):
+        User.objects.filter(pk=row['user_id']).update(like_count=row['count'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_usermoviehistory_recent_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='like_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='total_watch_time',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_user_stats, migrations.RunPython.noop),
+    ]
@@ -1,30 +1,63 @@
+from functools import lru_cache
+
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import AbstractUser
-from django.db.models import F
-
-
-# ========== 장르 ID → pref 필드 매핑 딕셔너리 ==========
-GENRE_ID_TO_PREF_FIELD = {
-    28: 'pref_action',
-    12: 'pref_adventure',
-    16: 'pref_animation',
-    35: 'pref_comedy',
-    80: 'pref_crime',
-    99: 'pref_documentary',
-    18: 'pref_drama',
-    10751: 'pref_family',
-    14: 'pref_fantasy',
-    36: 'pref_history',
-    27: 'pref_horror',
-    10402: 'pref_music',
-    9648: 'pref_mystery',
-    10749: 'pref_romance',
-    878: 'pref_science_fiction',
-    10770: 'pref_tv_movie',
-    53: 'pref_thriller',
-    10752: 'pref_war',
-    37: 'pref_western',
-}
+from django.utils import timezone
+
+
+# ========== 장르 취향 벡터 (유일한 장르 매핑 테이블) ==========
+# (TMDB 장르 ID, 장르 이름, pref 필드) — 순서가 곧 취향 벡터의 인덱스 (변경 시 뒤에만 추가)
+GENRE_PREFS = (
+    (28, '액션', 'pref_action'),
+    (12, '모험', 'pref_adventure'),
+    (16, '애니메이션', 'pref_animation'),
+    (35, '코미디', 'pref_comedy'),
+    (80, '범죄', 'pref_crime'),
+    (99, '다큐멘터리', 'pref_documentary'),
+    (18, '드라마', 'pref_drama'),
+    (10751, '가족', 'pref_family'),
+    (14, '판타지', 'pref_fantasy'),
+    (36, '역사', 'pref_history'),
+    (27, '공포', 'pref_horror'),
+    (10402, '음악', 'pref_music'),
+    (9648, '미스터리', 'pref_mystery'),
+    (10749, '로맨스', 'pref_romance'),
+    (878, 'SF', 'pref_science_fiction'),
+    (10770, 'TV 영화', 'pref_tv_movie'),
+    (53, '스릴러', 'pref_thriller'),
+    (10752, '전쟁', 'pref_war'),
+    (37, '서부', 'pref_western'),
+)
+GENRE_PREF_FIELDS = tuple(field for _, _, field in GENRE_PREFS)
+GENRE_ID_TO_PREF_INDEX = {genre_id: index for index, (genre_id, _, _) in enumerate(GENRE_PREFS)}
+GENRE_NAME_TO_PREF_INDEX = {name: index for index, (_, name, _) in enumerate(GENRE_PREFS)}
+GENRE_ID_TO_PREF_FIELD = {genre_id: field for genre_id, _, field in GENRE_PREFS}
+
+
+@lru_cache(maxsize=1024)
+def genre_key_pref_indexes(genre_key):
+    """HomeCategory.genre_key ('액션|코미디') → 취향 벡터 인덱스 목록"""
+    return tuple(GENRE_NAME_TO_PREF_INDEX[name] for name in (genre_key or '').split('|') if name in GENRE_NAME_TO_PREF_INDEX)
+
+
+def genre_key_score(pref_vector, genre_key):
+    """카테고리 장르 조합의 평균 취향 점수 (매핑되지 않는 장르는 제외)"""
+    indexes = genre_key_pref_indexes(genre_key)
+    return sum(pref_vector[index] for index in indexes) / len(indexes) if indexes else 0
+
+
+def pref_delta_updates(deltas):
+    """
+    {벡터 인덱스: 증가량} → queryset.update()용 F 표현식
+    (UPDATE 한 문장으로 원자적으로 더함 — 읽고 다시 쓰지 않음)
+    """
+    return {
+        GENRE_PREF_FIELDS[index]: Coalesce(F(GENRE_PREF_FIELDS[index]), Value(0)) + delta
+        for index, delta in deltas.items() if delta
+    }
+
 
 class User(AbstractUser):
     LOGIN_TYPE_CHOICES = [
@@ -59,40 +92,49 @@ class User(AbstractUser):
     pref_war = models.IntegerField(default=0, null=True, blank=True)
     pref_western = models.IntegerField(default=0, null=True, blank=True)
 
+    # MyPage 통계 (비정규화) — 시청 기록 파이프라인 / 좋아요 토글이 증분 갱신, recompute_user_stats로 보정
+    total_watch_time = models.BigIntegerField(default=0)  # 누적 시청 시간 (초)
+    like_count = models.IntegerField(default=0)           # 좋아요한 영화 수
+
+    # 회원 탈퇴 요청 시각 — 요청 즉시 비활성화하고 연관 데이터는 purge_deleted_users 작업이 청크 단위로 삭제
+    deletion_requested_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
     def __str__(self):
         return self.username
 
+    @property
+    def pref_vector(self):
+        """장르 취향 점수 벡터 (GENRE_PREFS 순서)"""
+        return tuple(getattr(self, field) or 0 for field in GENRE_PREF_FIELDS)
+
 class UserMovieHistory(models.Model):
+    """
+    유저 시청 기록 — 장르 선호도 반영은 accounts.watch_history 파이프라인에서 배치로, 보관 한도 정리는 trim_watch_history 주기 작업으로 처리
+    (watched_at은 큐에 적재된 시점의 이벤트 시각을 그대로 저장)
+    같은 영화를 WATCH_HISTORY_MERGE_WINDOW 안에 다시 보면 새 행 대신 watch_time 누적 + watched_at = 마지막 시청 시각
+    """
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='watch_histories')
     movie = models.ForeignKey('movies.Movie', on_delete=models.CASCADE)
     watch_time = models.IntegerField(default=0) # Seconds
-    watched_at = models.DateTimeField(auto_now_add=True)
+    watched_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         ordering = ['-watched_at']
+        indexes = [
+            # 시청 이벤트 병합 시 (유저, 영화)별 최근 기록 조회
+            models.Index(fields=['user', 'movie', 'watched_at'], name='accounts_history_merge_idx'),
+            # 최신순 조회 + 보관 한도 정리 경계 탐색
+            models.Index(fields=['user', '-watched_at', '-id'], name='accounts_history_recent_idx'),
+        ]
+
+class ProcessedWatchEvent(models.Model):
+    """
+    워커가 반영한 시청 이벤트의 Stream entry id — 반영과 같은 트랜잭션에서 저장
+    반영 후 ACK 전에 워커가 죽어 같은 이벤트가 다시 전달돼도 두 번 반영하지 않음 (ACK 후 삭제)
+    """
+    entry_id = models.CharField(max_length=40, primary_key=True)
+    processed_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
-    def save(self, *args, **kwargs):
-        is_new = self.pk is None
-        super().save(*args, **kwargs)
-        
-        if is_new:
-            # Update user's genre preferences
-            user = self.user
-            movie = self.movie
-            genres = movie.genres.all()
-            
-            # 장르 ID → pref 필드 매핑 딕셔너리 사용 (한국어/영어 장르명 무관)
-            for genre in genres:
-                field_name = GENRE_ID_TO_PREF_FIELD.get(genre.id)
-                if field_name:
-                    setattr(user, field_name, F(field_name) + self.watch_time)
-            user.save()
-
-            # Limit to 500 records per user
-            history_count = UserMovieHistory.objects.filter(user=user).count()
-            if history_count > 500:
-                oldest_histories = UserMovieHistory.objects.filter(user=user).order_by('watched_at')[:history_count - 500]
-                UserMovieHistory.objects.filter(pk__in=oldest_histories).delete()
 
 class UserMyList(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='my_lists')
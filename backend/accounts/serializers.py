@@ -3,6 +3,8 @@ from django.contrib.auth import get_user_model, authenticate
 from django.contrib.auth.password_validation import validate_password
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from .models import GENRE_PREF_FIELDS
+
 User = get_user_model()
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -52,12 +54,10 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             password=validated_data['password'],
             first_name=validated_data.get('first_name', ''),
             last_name=validated_data.get('last_name', ''),
-            login_type='email'
+            login_type='email',
+            # 장르 취향 점수도 INSERT 한 번에 함께 저장
+            **{field: validated_data[field] for field in GENRE_PREF_FIELDS if field in validated_data},
         )
-        for key, value in validated_data.items():
-            if key.startswith('pref_'):
-                setattr(user, key, value)
-        user.save()
         return user
 
 class ChangePasswordSerializer(serializers.Serializer):
@@ -159,6 +159,15 @@ class WatchHistorySerializer(serializers.Serializer):
     movie_id = serializers.CharField()
     watch_time = serializers.IntegerField(min_value=1)
 
+class WatchHistoryEventSerializer(serializers.Serializer):
+    movie_id = serializers.CharField()
+    watch_time = serializers.IntegerField(min_value=1)
+    watched_at = serializers.DateTimeField(required=False, help_text="클라이언트 시청 시각 (생략 시 서버 수신 시각)")
+
+class WatchHistoryBatchSerializer(serializers.Serializer):
+    """쇼츠 플레이어가 모아서 보내는 시청 이벤트 배치 (최대 200개)"""
+    events = WatchHistoryEventSerializer(many=True, allow_empty=False, max_length=200)
+
 # ========== Onboarding Serializer (신규) ==========
 class OnboardingSerializer(serializers.Serializer):
     """최초 1회 장르 취향 수집용 시리얼라이저"""
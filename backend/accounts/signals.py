@@ -0,0 +1,38 @@
+"""
+User 행 변경 시 유저 버전 증가 → 인증 유저 캐시(accounts.authentication) 무효화
+
+save()/delete()와 권한 m2m 변경은 여기서 처리하고,
+시그널이 발생하지 않는 queryset.update() 경로(시청 기록 선호도/통계, 좋아요 수)는 호출하는 쪽에서 bump_user_versions를 직접 호출합니다.
+버전은 즉시 한 번 + 커밋 후 한 번 더 올림
+→ 트랜잭션 도중 다른 요청이 커밋 전 행을 새 버전 키로 캐시했더라도 커밋 후에는 그 키를 쓰지 않음
+"""
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import bump_user_versions
+from .models import User
+
+
+def bump_after_commit(user_ids):
+    user_ids = list(user_ids)
+    bump_user_versions(user_ids)
+    transaction.on_commit(lambda: bump_user_versions(user_ids))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def bump_on_user_change(sender, instance, **kwargs):
+    bump_after_commit([instance.pk])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def bump_on_permission_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        bump_after_commit([instance.pk])
+    elif pk_set:
+        # 그룹/권한 쪽에서 유저를 추가·제거한 경우
+        bump_after_commit(pk_set)
@@ -0,0 +1,78 @@
+"""
+소셜 로그인 provider(카카오/구글) 사용자 정보 조회
+
+- 프로세스당 requests.Session 하나를 재사용 (keep-alive 커넥션 풀)
+- 모든 호출에 (연결, 응답) 타임아웃 — provider가 느려도 워커가 무기한 묶이지 않음
+- 같은 access token의 사용자 정보는 SOCIAL_USERINFO_CACHE_TIMEOUT 동안 캐시 (키는 토큰 해시)
+"""
+import hashlib
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS = {
+    'kakao': {
+        'url_setting': 'KAKAO_USERINFO_URL',
+        'request': lambda token: {'headers': {'Authorization': f'Bearer {token}'}},
+    },
+    'google': {
+        'url_setting': 'GOOGLE_USERINFO_URL',
+        'request': lambda token: {'params': {'access_token': token}},
+    },
+}
+
+_session = None
+
+
+class SocialProviderError(Exception):
+    """provider 연결 실패/타임아웃 (토큰이 잘못된 경우와 구분)"""
+
+
+def get_session():
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=len(PROVIDERS), pool_maxsize=settings.SOCIAL_PROVIDER_POOL_SIZE, max_retries=0
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _session = session
+    return _session
+
+
+def userinfo_cache_key(provider, access_token):
+    return f"accounts:social_userinfo:{provider}:{hashlib.sha256(access_token.encode()).hexdigest()}"
+
+
+def fetch_user_info(provider, access_token):
+    """
+    provider 사용자 정보 dict, 토큰이 유효하지 않으면 None
+    provider에 연결할 수 없거나 타임아웃이면 SocialProviderError
+    """
+    key = userinfo_cache_key(provider, access_token)
+    user_info = cache.get(key)
+    if user_info is not None:
+        return user_info
+
+    config = PROVIDERS[provider]
+    try:
+        response = get_session().get(
+            getattr(settings, config['url_setting']),
+            timeout=settings.SOCIAL_PROVIDER_TIMEOUT,
+            **config['request'](access_token),
+        )
+    except requests.RequestException as e:
+        logger.warning("%s 사용자 정보 조회 실패: %s", provider, e)
+        raise SocialProviderError(provider) from e
+    if response.status_code != 200:
+        return None
+
+    user_info = response.json()
+    cache.set(key, user_info, settings.SOCIAL_USERINFO_CACHE_TIMEOUT)
+    return user_info
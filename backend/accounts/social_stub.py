@@ -0,0 +1,62 @@
+"""
+오프라인 부하 테스트용 소셜 provider 스텁 서버
+
+카카오/구글 사용자 정보 API와 같은 경로/응답 형식을 흉내 냅니다.
+- GET /v2/user/me          (Authorization: Bearer <token>)  → 카카오 형식
+- GET /oauth2/v3/userinfo  (?access_token=<token>)          → 구글 형식
+- 토큰이 'invalid'로 시작하면 401, 사용자 id는 토큰에서 결정 (같은 토큰 → 같은 사용자)
+- delay로 provider 응답 지연을 재현 (타임아웃 동작 확인용)
+"""
+import hashlib
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+KAKAO_PATH = '/v2/user/me'
+GOOGLE_PATH = '/oauth2/v3/userinfo'
+
+
+def stub_user_id(token):
+    return int(hashlib.sha256(token.encode()).hexdigest()[:12], 16)
+
+
+class ProviderStubHandler(BaseHTTPRequestHandler):
+    delay = 0.0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == KAKAO_PATH:
+            token = self.headers.get('Authorization', '').removeprefix('Bearer ')
+            body = lambda uid: {"id": uid, "kakao_account": {"email": f"kakao{uid}@stub.local", "profile": {"nickname": f"stub{uid}"}}}
+        elif url.path == GOOGLE_PATH:
+            token = parse_qs(url.query).get('access_token', [''])[0]
+            body = lambda uid: {"sub": str(uid), "email": f"google{uid}@stub.local", "given_name": f"stub{uid}", "family_name": ""}
+        else:
+            return self.respond(404, {"error": "not found"})
+
+        self.server.request_count += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if not token or token.startswith('invalid'):
+            return self.respond(401, {"error": "invalid token"})
+        self.respond(200, body(stub_user_id(token)))
+
+    def respond(self, status_code, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_stub_server(host='127.0.0.1', port=0, delay=0.0):
+    """스텁 서버 생성 (port=0이면 빈 포트 자동 할당, server.server_address로 확인)"""
+    handler = type('ProviderStubHandler', (ProviderStubHandler,), {'delay': delay})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.request_count = 0
+    return server
@@ -0,0 +1,120 @@
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from movies.models import Comment, Movie
+from home.models import MovieReview
+from community.models import Review, ReviewComment
+from accounts.models import UserLikeList, UserMovieHistory
+from accounts.deletion import pending_deletion_user_ids, purge_user
+from accounts.history_archive import archived_months, iter_archived_histories
+from accounts.watch_history import trim_watch_history
+
+User = get_user_model()
+
+
+class AccountDeletionTest(TestCase):
+    """회원 탈퇴 (즉시 비활성화 + 청크 단위 삭제) 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.movies = [
+            Movie.objects.create(movie_id=str(40000 + i), title=f'영화 {i}', vote_average=7.0, like_count=2)
+            for i in range(3)
+        ]
+        cls.other = User.objects.create_user(username='other', password='testpass1234!')
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='leaver', password='testpass1234!')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+        for movie in self.movies:
+            UserLikeList.objects.create(user=self.user, movie=movie)
+            UserLikeList.objects.create(user=self.other, movie=movie)
+            UserMovieHistory.objects.create(user=self.user, movie=movie, watch_time=10)
+            Comment.objects.create(user=self.user, movie=movie, content='댓글')
+        # 영화 0: 탈퇴 유저 리뷰(2점) + 다른 유저 리뷰(8점)
+        for author, rating in ((self.user, 2), (self.other, 8)):
+            MovieReview.objects.create(movie=self.movies[0], author=author, rating=rating, content='리뷰')
+        Movie.objects.filter(pk=self.movies[0].pk).update(review_count=2, review_sum=10, review_average=5.0)
+
+        self.review = Review.objects.create(user=self.user, title='글', movie_title='영화 0', rank=5, content='본문')
+        self.review.like_users.add(self.other)
+        ReviewComment.objects.create(review=self.review, user=self.other, content='댓글')
+        other_review = Review.objects.create(user=self.other, title='글2', movie_title='영화 1', rank=7, content='본문')
+        other_review.like_users.add(self.user)
+        Review.objects.update(like_count=1)
+
+    # ========== 1. 탈퇴 요청 → 즉시 비활성화, 데이터는 유지 ==========
+    def test_delete_deactivates_immediately(self):
+        self.client.post('/api/accounts/mypage/', {'userid': self.user.id}, format='json')  # 인증 유저 캐시 적재
+        response = self.client.delete('/api/accounts/profile/delete/')
+        self.assertEqual(response.status_code, 204)
+
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
+        self.assertEqual(pending_deletion_user_ids(), [self.user.id])
+        self.assertEqual(UserLikeList.objects.filter(user=self.user).count(), 3)
+
+        again = self.client.post('/api/accounts/mypage/', {'userid': self.user.id}, format='json')
+        self.assertEqual(again.status_code, 401)
+        print('✅ [PASS] 탈퇴 요청 → 즉시 비활성화 + 인증 차단')
+
+    # ========== 2. 청크 단위 삭제 + 카운터 보정 ==========
+    def test_purge_deletes_in_chunks_and_fixes_counters(self):
+        self.client.delete('/api/accounts/profile/delete/')
+        result = purge_user(self.user.id, chunk_size=2)
+
+        self.assertEqual(result['liked_movies'], 3)
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+        self.assertFalse(UserMovieHistory.objects.exists())
+        self.assertFalse(Comment.objects.exists())
+        self.assertEqual(list(Review.objects.values_list('user_id', flat=True)), [self.other.id])
+        self.assertEqual(Review.objects.get().like_users.count(), 0)
+        self.assertEqual(Review.objects.get().like_count, 0)
+        self.assertFalse(ReviewComment.objects.exists())
+
+        self.assertEqual(list(Movie.objects.values_list('like_count', flat=True)), [1, 1, 1])
+        movie = Movie.objects.get(pk=self.movies[0].pk)
+        self.assertEqual((movie.review_count, movie.review_sum, movie.review_average), (1, 8, 8.0))
+        self.assertEqual(UserLikeList.objects.filter(user=self.other).count(), 3)
+        print('✅ [PASS] 청크 단위 삭제 + like_count/review_average 보정')
+
+    # ========== 3. 탈퇴 요청 없는 유저는 삭제하지 않음 ==========
+    def test_purge_requires_deletion_request(self):
+        purge_user(self.other.id)
+        self.assertTrue(User.objects.filter(pk=self.other.pk).exists())
+        self.assertEqual(pending_deletion_user_ids(), [])
+        print('✅ [PASS] 탈퇴 요청 없는 유저 → 작업 대상 아님')
+
+    # ========== 4. 콜드 아카이브에 옮겨진 시청 기록도 삭제 ==========
+    def test_purge_removes_archived_histories(self):
+        archive = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, archive)
+        with override_settings(WATCH_HISTORY_ARCHIVE_DIR=archive):
+            base = datetime(2026, 3, 31, 12)
+            for user in (self.user, self.other):
+                for i in range(4):
+                    UserMovieHistory.objects.create(
+                        user=user, movie=self.movies[i % 3], watch_time=10, watched_at=base + timedelta(hours=i),
+                    )
+            UserMovieHistory.objects.filter(user=self.user, watched_at__gte=base).update(watched_at=base - timedelta(days=31))
+            trim_watch_history(limit=2)
+            self.assertEqual(archived_months(), ['2026-02', '2026-03'])
+
+            self.client.delete('/api/accounts/profile/delete/')
+            result = purge_user(self.user.id)
+
+            self.assertEqual(result['archived_watch_histories'], 5)
+            self.assertEqual({r['user_id'] for r in iter_archived_histories()}, {self.other.id})
+            self.assertEqual(len(list(iter_archived_histories())), 2)
+            self.assertEqual(archived_months(), ['2026-03'])  # 탈퇴 유저 기록만 있던 월 파일은 제거
+        print('✅ [PASS] 탈퇴 → 아카이브된 시청 기록도 삭제')
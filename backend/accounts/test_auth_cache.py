@@ -0,0 +1,102 @@
+from io import StringIO
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from movies.models import Genre, Movie
+from accounts.caching import (
+    auth_user_key, get_auth_cache_stats, get_user_version, reset_auth_cache_stats,
+)
+
+User = get_user_model()
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    """JWT 인증 유저 캐시 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        action = Genre.objects.create(id=28, name='액션')
+        cls.movie = Movie.objects.create(movie_id='27205', title='인셉션')
+        cls.movie.genres.set([action])
+
+    def setUp(self):
+        cache.clear()
+        reset_auth_cache_stats()
+        self.user = User.objects.create_user(username='viewer', password='testpass1234!')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+    def mypage(self):
+        return self.client.post('/api/accounts/mypage/', {'userid': self.user.id}, format='json')
+
+    # ========== 1. 두 번째 요청부터 유저 조회 없음 + 적중률 집계 ==========
+    def test_user_query_skipped_on_hit(self):
+        self.mypage()
+        with self.assertNumQueries(0):
+            self.mypage()
+
+        stats = get_auth_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hit_ratio'], 0.5)
+
+        out = StringIO()
+        call_command('auth_cache_stats', stdout=out)
+        self.assertIn('50.00%', out.getvalue())
+        print('✅ [PASS] 캐시 적중 → 유저 조회 없음 + 적중률 집계')
+
+    # ========== 2. 프로필/선호도 변경 → 버전 증가로 최신 값 ==========
+    def test_profile_and_pref_changes_invalidate(self):
+        self.mypage()
+        self.client.patch('/api/accounts/profile/', {'first_name': '새이름'}, format='json')
+        self.assertEqual(self.mypage().data['userdata']['firstname'], '새이름')
+
+        # 시청 기록(queryset.update 경로)도 버전 증가
+        self.client.post('/api/accounts/watch-history/', {'movie_id': '27205', 'watch_time': 30}, format='json')
+        self.assertEqual(self.mypage().data['watchtime'], 30)
+        print('✅ [PASS] 프로필/선호도 변경 → 인증 유저 캐시 무효화')
+
+    # ========== 3. 권한/비활성화 변경 즉시 반영 ==========
+    def test_permission_and_active_changes_invalidate(self):
+        self.mypage()
+        version = get_user_version(self.user.id)
+        self.user.groups.add(Group.objects.create(name='staff'))
+        self.assertGreater(get_user_version(self.user.id), version)
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.mypage().status_code, 401)
+        print('✅ [PASS] 권한/비활성화 → 즉시 반영')
+
+    # ========== 4. 캐시에는 비밀번호 해시 없음, 비밀번호 확인/변경은 그대로 동작 ==========
+    def test_cache_excludes_password_hash(self):
+        self.mypage()
+        fields, password_hash = cache.get(auth_user_key(self.user.id, get_user_version(self.user.id)))
+        self.assertNotIn('password', fields)
+        self.assertNotEqual(password_hash, self.user.password)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/accounts/change_password/', {
+                'old_password': 'testpass1234!', 'new_password': 'Newpass5678!', 'new_password_confirm': 'Newpass5678!',
+            }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('Newpass5678!'))
+        print('✅ [PASS] 인증 캐시 비밀번호 해시 제외 + 비밀번호 변경 정상')
+
+    # ========== 5. 트랜잭션 안의 변경은 커밋 후 버전을 한 번 더 올림 ==========
+    def test_version_bumped_again_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.user.first_name = '커밋전'
+                self.user.save()
+                # 이 사이 다른 요청은 커밋 전 행을 이 버전 키로 캐시할 수 있음
+                in_transaction = get_user_version(self.user.id)
+        self.assertGreater(get_user_version(self.user.id), in_transaction)
+        print('✅ [PASS] 커밋 후 유저 버전 재증가 → 커밋 전 행 캐시 무효화')
@@ -0,0 +1,68 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from accounts.models import (
+    GENRE_PREFS, GENRE_ID_TO_PREF_INDEX, genre_key_score, pref_delta_updates,
+)
+
+User = get_user_model()
+
+
+class GenrePreferenceVectorTest(TestCase):
+    """장르 취향 벡터 + 원자적 증가 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def login(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+
+    # ========== 1. 하나의 매핑 테이블에서 벡터 순서/인덱스 결정 ==========
+    def test_vector_follows_single_table(self):
+        user = User.objects.create_user(username='vec', password='testpass1234!', pref_drama=7, pref_western=3)
+        self.assertEqual(len(user.pref_vector), len(GENRE_PREFS))
+        self.assertEqual(user.pref_vector[GENRE_ID_TO_PREF_INDEX[18]], 7)
+        self.assertEqual(user.pref_vector[-1], 3)
+        # 이름 매핑 (다큐멘터리 포함) → 평균 점수
+        vector = [0] * len(GENRE_PREFS)
+        vector[GENRE_ID_TO_PREF_INDEX[99]], vector[GENRE_ID_TO_PREF_INDEX[28]] = 40, 20
+        self.assertEqual(genre_key_score(vector, '다큐멘터리|액션|없는장르'), 30)
+        print('✅ [PASS] 단일 장르 테이블 기반 취향 벡터')
+
+    # ========== 2. 증가량은 UPDATE 한 문장으로 ==========
+    def test_delta_update_is_single_statement(self):
+        user = User.objects.create_user(username='delta', password='testpass1234!', pref_action=5)
+        with self.assertNumQueries(1):
+            User.objects.filter(pk=user.pk).update(**pref_delta_updates({0: 10, 14: 3}))
+        user.refresh_from_db()
+        self.assertEqual((user.pref_action, user.pref_science_fiction), (15, 3))
+        print('✅ [PASS] 취향 증가량 → UPDATE 1회')
+
+    # ========== 3. 회원가입 시 취향 점수 함께 저장 ==========
+    def test_registration_keeps_prefs(self):
+        response = self.client.post('/api/accounts/register/', {
+            'username': 'newbie', 'email': 'newbie@test.com',
+            'password': 'Strongpass1234!', 'password_confirm': 'Strongpass1234!', 'pref_comedy': 12,
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(User.objects.get(username='newbie').pref_comedy, 12)
+        print('✅ [PASS] 회원가입 취향 점수 저장')
+
+    # ========== 4. 온보딩: 선택 장르 +50, 한 번만 ==========
+    def test_onboarding_adds_once(self):
+        user = User.objects.create_user(username='onboard', password='testpass1234!', pref_horror=10)
+        self.login(user)
+        payload = {'pref_horror': True, 'pref_romance': True}
+        first = self.client.post('/api/accounts/onboarding/', payload, format='json')
+        second = self.client.post('/api/accounts/onboarding/', payload, format='json')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 400)
+        user.refresh_from_db()
+        self.assertTrue(user.is_onboarding_completed)
+        self.assertEqual((user.pref_horror, user.pref_romance, user.pref_action), (60, 50, 0))
+        print('✅ [PASS] 온보딩 +50 원자적 반영 (1회)')
@@ -0,0 +1,115 @@
+import gzip
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+
+from movies.models import Movie
+from accounts.models import UserMovieHistory
+from accounts.history_archive import (
+    archive_histories, archived_months, iter_archived_histories, write_journal, ARCHIVE_FIELDS,
+)
+from accounts.watch_history import apply_watch_events, make_event, trim_watch_history
+
+User = get_user_model()
+
+
+class WatchHistoryArchiveTest(TestCase):
+    """보관 한도 밖 시청 기록 콜드 아카이브 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.movie = Movie.objects.create(movie_id='27205', title='인셉션')
+        cls.user = User.objects.create_user(username='viewer', password='testpass1234!')
+        cls.other = User.objects.create_user(username='other', password='testpass1234!')
+
+    def setUp(self):
+        self.archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.archive_dir)
+        settings_override = override_settings(
+            WATCH_HISTORY_ARCHIVE_DIR=self.archive_dir, WATCH_HISTORY_LIMIT=3, WATCH_HISTORY_MERGE_WINDOW=0,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def watch(self, user, *times):
+        apply_watch_events([make_event(user.id, self.movie.id, 10, watched_at) for watched_at in times])
+
+    # ========== 1. 정리된 기록은 월별 파일로 이동 ==========
+    def test_trim_moves_overflow_to_monthly_archive(self):
+        sep = datetime(2026, 9, 30, 12)
+        octo = datetime(2026, 10, 2, 12)
+        self.watch(self.user, sep, sep + timedelta(hours=1), octo, octo + timedelta(hours=1), octo + timedelta(hours=2))
+
+        self.assertEqual(trim_watch_history(chunk_size=1), 2)
+        self.assertEqual(UserMovieHistory.objects.filter(user=self.user).count(), 3)
+        self.assertEqual(archived_months(), ['2026-09'])
+
+        records = list(iter_archived_histories())
+        self.assertEqual([r['watched_at'] for r in records], [sep, sep + timedelta(hours=1)])
+        self.assertEqual(records[0]['tmdb_id'], '27205')
+        self.assertEqual(records[0]['watch_time'], 10)
+        print('✅ [PASS] 한도 밖 기록 → 월별 아카이브 이동')
+
+    # ========== 2. append-only + 범위/유저 필터 스트리밍 ==========
+    def test_archive_appends_and_filters(self):
+        base = datetime(2026, 8, 1)
+        self.watch(self.user, *[base + timedelta(days=i) for i in range(6)])
+        self.watch(self.other, *[base + timedelta(days=i, hours=1) for i in range(5)])
+        trim_watch_history()
+        self.watch(self.user, *[base + timedelta(days=10 + i) for i in range(3)])
+        trim_watch_history()
+
+        # 두 번의 정리가 같은 월 파일에 gzip member로 이어 붙음
+        path = Path(self.archive_dir) / '2026-08.ndjson.gz'
+        with gzip.open(path, 'rt') as f:
+            self.assertEqual(len(f.readlines()), 3 + 2 + 3)
+
+        mine = list(iter_archived_histories(user_id=self.user.id))
+        self.assertEqual(len(mine), 6)
+        ranged = list(iter_archived_histories(start=base + timedelta(days=1), end=base + timedelta(days=2)))
+        self.assertEqual(len(ranged), 2)
+        print('✅ [PASS] append-only 아카이브 + 범위/유저 필터')
+
+    # ========== 3. 아카이브 후 삭제 전 중단 → 다음 정리에서 되돌려 중복 없이 다시 기록 ==========
+    def test_interrupted_archive_is_rolled_back(self):
+        base = datetime(2026, 7, 1)
+        self.watch(self.user, *[base + timedelta(hours=i) for i in range(4)])
+        oldest = list(UserMovieHistory.objects.order_by('watched_at').values(*ARCHIVE_FIELDS)[:1])
+        archive_histories(oldest)  # 아카이브 직후 삭제 전에 중단된 상황
+        trim_watch_history()
+
+        with gzip.open(Path(self.archive_dir) / '2026-07.ndjson.gz', 'rt') as f:
+            self.assertEqual(len(f.readlines()), 1)
+        self.assertEqual(len(list(iter_archived_histories())), 1)
+        self.assertEqual(list(Path(self.archive_dir).glob('*.journal')), [])
+        print('✅ [PASS] 중단된 아카이브 → 되돌린 뒤 한 번만 기록')
+
+    # ========== 4. 삭제까지 끝난 뒤 중단 → 아카이브 유지 ==========
+    def test_archive_kept_when_delete_finished(self):
+        base = datetime(2026, 6, 1)
+        self.watch(self.user, *[base + timedelta(hours=i) for i in range(4)])
+        oldest = list(UserMovieHistory.objects.order_by('watched_at').values(*ARCHIVE_FIELDS)[:1])
+        archive_histories(oldest)
+        UserMovieHistory.objects.filter(pk=oldest[0]['id']).delete()  # 저널 정리 직전에 중단된 상황
+        trim_watch_history()
+
+        self.assertEqual(len(list(iter_archived_histories())), 1)
+        print('✅ [PASS] 삭제 완료 후 중단 → 아카이브 유지')
+
+    # ========== 5. 저널만 쓰고 파일을 열기 전에 중단 (새 월) → 정리 계속 진행 ==========
+    def test_journal_without_month_file_is_discarded(self):
+        base = datetime(2026, 5, 1)
+        self.watch(self.user, *[base + timedelta(hours=i) for i in range(4)])
+        oldest = list(UserMovieHistory.objects.order_by('watched_at').values_list('id', flat=True)[:1])
+        directory = Path(self.archive_dir)
+        write_journal(directory / '2026-05.journal', {"size": 0, "ids": oldest})
+        (directory / '2026-04.journal').write_text('{"size": 1', encoding='utf-8')  # 저널 기록 중 중단
+
+        self.assertEqual(trim_watch_history(), 1)
+        self.assertEqual(list(directory.glob('*.journal')), [])
+        self.assertEqual([r['id'] for r in iter_archived_histories()], oldest)
+        print('✅ [PASS] 파일 없는 저널/깨진 저널 → 건너뛰고 저널 정리')
@@ -0,0 +1,79 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from movies.models import Genre, Movie
+from accounts.models import UserLikeList
+
+User = get_user_model()
+
+
+class MyPageStatsTest(TestCase):
+    """마이페이지 비정규화 통계 + 목록 캐시 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        action = Genre.objects.create(id=28, name='액션')
+        cls.movie1 = Movie.objects.create(movie_id='27205', title='인셉션')
+        cls.movie1.genres.set([action])
+        cls.movie2 = Movie.objects.create(movie_id='157336', title='인터스텔라')
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='viewer', password='testpass1234!')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+    def mypage(self):
+        return self.client.post('/api/accounts/mypage/', {'userid': self.user.id}, format='json')
+
+    # ========== 1. 시청/좋아요 경로가 통계 증분 갱신 ==========
+    def test_watch_and_like_update_stats(self):
+        self.client.post('/api/accounts/watch-history/', {'movie_id': '27205', 'watch_time': 30}, format='json')
+        self.client.post('/api/accounts/watch-history/', {'movie_id': '157336', 'watch_time': 15}, format='json')
+        self.client.post('/api/movies/shorts/27205/like/')
+        self.client.post('/api/movies/shorts/157336/like/')
+        self.client.post('/api/movies/shorts/157336/like/')  # 취소
+
+        self.user.refresh_from_db()
+        self.assertEqual((self.user.total_watch_time, self.user.like_count), (45, 1))
+
+        response = self.mypage()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['watchtime'], 45)
+        self.assertEqual(response.data['usermylist'], 1)
+        self.assertEqual(list(response.data['recordmovie']), ['157336', '27205'])
+        self.assertEqual(list(response.data['mylistmovie']), ['27205'])
+        print('✅ [PASS] 시청/좋아요 → 통계 증분 갱신')
+
+    # ========== 2. 캐시 적중 시 쿼리 없이 응답 (인증 유저도 캐시) ==========
+    def test_mypage_served_from_cache(self):
+        self.mypage()
+        with self.assertNumQueries(0):
+            response = self.mypage()
+        self.assertEqual(response.status_code, 200)
+        print('✅ [PASS] 마이페이지 캐시 적중 → 쿼리 0회')
+
+    # ========== 3. 쓰기 경로에서 목록 캐시 무효화 ==========
+    def test_lists_invalidated_on_write(self):
+        self.assertEqual(self.mypage().data['recordmovie'], {})
+
+        self.client.post('/api/accounts/watch-history/', {'movie_id': '27205', 'watch_time': 30}, format='json')
+        self.assertEqual(list(self.mypage().data['recordmovie']), ['27205'])
+
+        self.client.post('/api/movies/shorts/157336/like/')
+        self.assertEqual(list(self.mypage().data['mylistmovie']), ['157336'])
+        print('✅ [PASS] 시청/좋아요 → 목록 캐시 무효화')
+
+    # ========== 4. 재계산 명령으로 보정 ==========
+    def test_recompute_user_stats(self):
+        UserLikeList.objects.create(user=self.user, movie=self.movie1)  # 좋아요 API를 거치지 않은 데이터
+        call_command('recompute_user_stats', stdout=StringIO())
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.like_count, 1)
+        print('✅ [PASS] recompute_user_stats → like_count 보정')
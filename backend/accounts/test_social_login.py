@@ -0,0 +1,77 @@
+import threading
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+
+from accounts.social_stub import make_stub_server, KAKAO_PATH, GOOGLE_PATH
+
+User = get_user_model()
+
+
+class SocialLoginStubTest(TestCase):
+    """소셜 로그인 (로컬 provider 스텁 서버 대상) 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = make_stub_server()
+        cls.slow_server = make_stub_server(delay=0.5)
+        for server in (cls.server, cls.slow_server):
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in (cls.server, cls.slow_server):
+            server.shutdown()
+            server.server_close()
+        super().tearDownClass()
+
+    def stub_urls(self, server):
+        base = 'http://%s:%s' % server.server_address[:2]
+        return {'KAKAO_USERINFO_URL': base + KAKAO_PATH, 'GOOGLE_USERINFO_URL': base + GOOGLE_PATH}
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        settings_override = override_settings(**self.stub_urls(self.server))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    # ========== 1. 카카오/구글 로그인 → 유저 생성 ==========
+    def test_login_creates_user(self):
+        kakao = self.client.post('/api/accounts/login/kakao/', {'access_token': 'token-a'}, format='json')
+        google = self.client.post('/api/accounts/login/google/', {'access_token': 'token-b'}, format='json')
+
+        self.assertEqual(kakao.status_code, 200)
+        self.assertEqual(google.status_code, 200)
+        self.assertEqual(kakao.data['user']['login_type'], 'kakao')
+        self.assertEqual(google.data['user']['login_type'], 'google')
+        self.assertEqual(User.objects.count(), 2)
+        print('✅ [PASS] 스텁 provider 로그인 → 유저 생성')
+
+    # ========== 2. 같은 토큰은 provider 재호출 없이 캐시 ==========
+    def test_user_info_cached_per_token(self):
+        before = self.server.request_count
+        for _ in range(3):
+            response = self.client.post('/api/accounts/login/kakao/', {'access_token': 'token-c'}, format='json')
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.request_count - before, 1)
+        print('✅ [PASS] 같은 토큰 → provider 호출 1회')
+
+    # ========== 3. 잘못된 토큰 → 401 (캐시하지 않음) ==========
+    def test_invalid_token(self):
+        before = self.server.request_count
+        for _ in range(2):
+            response = self.client.post('/api/accounts/login/google/', {'access_token': 'invalid-token'}, format='json')
+            self.assertEqual(response.status_code, 401)
+        self.assertEqual(self.server.request_count - before, 2)
+        print('✅ [PASS] 잘못된 토큰 → 401')
+
+    # ========== 4. provider 지연 → 타임아웃 후 503 ==========
+    def test_slow_provider_times_out(self):
+        with override_settings(SOCIAL_PROVIDER_TIMEOUT=(0.5, 0.1), **self.stub_urls(self.slow_server)):
+            response = self.client.post('/api/accounts/login/kakao/', {'access_token': 'token-d'}, format='json')
+        self.assertEqual(response.status_code, 503)
+        print('✅ [PASS] provider 지연 → 타임아웃 503')
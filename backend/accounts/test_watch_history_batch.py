@@ -0,0 +1,88 @@
+import time
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from movies.models import Genre, Movie
+from accounts.models import UserMovieHistory
+
+User = get_user_model()
+
+
+class WatchHistoryBatchAPITest(TestCase):
+    """시청 기록 배치 API 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        action = Genre.objects.create(id=28, name='액션')
+        cls.movies = []
+        for i in range(20):
+            movie = Movie.objects.create(movie_id=str(30000 + i), title=f'쇼츠 {i}')
+            movie.genres.set([action])
+            cls.movies.append(movie)
+        cls.url = '/api/accounts/watch-history/batch/'
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='viewer', password='testpass1234!')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+    # ========== 1. 배치 저장 + 짧은 시청/없는 영화 제외 ==========
+    def test_batch_records_valid_events(self):
+        events = [
+            {'movie_id': '30000', 'watch_time': 10},
+            {'movie_id': '30001', 'watch_time': 20, 'watched_at': '2026-01-01T12:00:00'},
+            {'movie_id': '30002', 'watch_time': 2},
+            {'movie_id': 'unknown', 'watch_time': 15},
+        ]
+        response = self.client.post(self.url, {'events': events}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['accepted'], 2)
+        self.assertEqual(response.data['skipped_short'], 1)
+        self.assertEqual(response.data['unknown_movie_ids'], ['unknown'])
+        self.assertEqual(UserMovieHistory.objects.filter(user=self.user).count(), 2)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.pref_action, 30)
+        print('✅ [PASS] 배치 저장 + 짧은 시청/없는 영화 제외')
+
+    # ========== 2. 배열 본문도 허용 ==========
+    def test_batch_accepts_plain_array(self):
+        response = self.client.post(self.url, [{'movie_id': '30000', 'watch_time': 10}], format='json')
+        self.assertEqual(response.status_code, 201)
+        print('✅ [PASS] 이벤트 배열 본문 허용')
+
+    # ========== 3. 빈 배치 → 400 ==========
+    def test_batch_rejects_empty(self):
+        response = self.client.post(self.url, {'events': []}, format='json')
+        self.assertEqual(response.status_code, 400)
+        print('✅ [PASS] 빈 배치 → 400')
+
+    # ========== 4. 단건 API 대비 처리량 비교 ==========
+    def test_batch_throughput_vs_single_endpoint(self):
+        events = [{'movie_id': movie.movie_id, 'watch_time': 10} for movie in self.movies]
+
+        with CaptureQueriesContext(connection) as single_queries:
+            started = time.perf_counter()
+            for event in events:
+                self.client.post('/api/accounts/watch-history/', event, format='json')
+            single_elapsed = time.perf_counter() - started
+
+        with CaptureQueriesContext(connection) as batch_queries:
+            started = time.perf_counter()
+            self.client.post(self.url, {'events': events}, format='json')
+            batch_elapsed = time.perf_counter() - started
+
+        # 같은 영화를 병합 구간 안에 다시 봤으므로 기록은 영화당 1개
+        self.assertEqual(UserMovieHistory.objects.filter(user=self.user).count(), 20)
+        self.assertEqual(UserMovieHistory.objects.filter(user=self.user, watch_time=20).count(), 20)
+        self.assertLess(len(batch_queries), len(single_queries) / 5)
+        print(
+            f'✅ [PASS] 이벤트 {len(events)}개: 단건 {len(single_queries)}쿼리/{single_elapsed * 1000:.1f}ms '
+            f'vs 배치 {len(batch_queries)}쿼리/{batch_elapsed * 1000:.1f}ms'
+        )
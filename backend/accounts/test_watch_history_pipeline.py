@@ -0,0 +1,197 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from movies.models import Genre, Movie
+from accounts import watch_history
+from accounts.models import ProcessedWatchEvent, UserMovieHistory
+from accounts.watch_history import (
+    apply_watch_events, enqueue_watch_events, make_event, recent_watch_histories, trim_watch_history,
+)
+
+User = get_user_model()
+
+
+class WatchHistoryPipelineTest(TestCase):
+    """시청 기록 배치 반영 파이프라인 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        action = Genre.objects.create(id=28, name='액션')
+        sf = Genre.objects.create(id=878, name='SF')
+        cls.movie1 = Movie.objects.create(movie_id='27205', title='인셉션')
+        cls.movie1.genres.set([action, sf])
+        cls.movie2 = Movie.objects.create(movie_id='157336', title='인터스텔라')
+        cls.movie2.genres.set([sf])
+        cls.user1 = User.objects.create_user(username='viewer1', password='testpass1234!')
+        cls.user2 = User.objects.create_user(username='viewer2', password='testpass1234!')
+
+    # ========== 1. 배치 반영: 유저별 pref 합산 ==========
+    def test_apply_sums_preferences_per_user(self):
+        events = [
+            make_event(self.user1.id, self.movie1.id, 30),
+            make_event(self.user1.id, self.movie2.id, 20),
+            make_event(self.user2.id, self.movie2.id, 10),
+        ]
+        self.assertEqual(apply_watch_events(events), 3)
+
+        self.user1.refresh_from_db()
+        self.user2.refresh_from_db()
+        self.assertEqual((self.user1.pref_action, self.user1.pref_science_fiction), (30, 50))
+        self.assertEqual((self.user2.pref_action, self.user2.pref_science_fiction), (0, 10))
+        self.assertEqual(UserMovieHistory.objects.count(), 3)
+        print('✅ [PASS] 배치 반영 → 유저별 pref 합산')
+
+    # ========== 2. 쿼리 수는 이벤트 수와 무관 ==========
+    def test_apply_query_count_is_bounded(self):
+        # 유저/영화 존재 확인 2 + 장르 1 + 최근 기록 1 + bulk insert 1 + 유저별 update 1, 트랜잭션 savepoint 2
+        events = [make_event(self.user1.id, self.movie1.id, 5) for _ in range(50)]
+        with self.assertNumQueries(8):
+            apply_watch_events(events)
+        print('✅ [PASS] 이벤트 50개 → 쿼리 8회')
+
+    # ========== 3. 이벤트 시각 보존 ==========
+    def test_apply_keeps_event_time(self):
+        watched_at = timezone.now() - timedelta(minutes=5)
+        apply_watch_events([make_event(self.user1.id, self.movie1.id, 5, watched_at)])
+        self.assertEqual(UserMovieHistory.objects.get().watched_at, watched_at)
+        print('✅ [PASS] 큐 적재 시각 보존')
+
+    # ========== 4. 삭제된 영화 이벤트 제외 ==========
+    def test_apply_skips_missing_movie(self):
+        applied = apply_watch_events([make_event(self.user1.id, 999999, 30)])
+        self.assertEqual(applied, 0)
+        self.assertFalse(UserMovieHistory.objects.exists())
+        print('✅ [PASS] 없는 영화 이벤트 제외')
+
+    # ========== 5. 보관 한도 초과분은 주기 작업이 청크 단위로 정리 ==========
+    @override_settings(WATCH_HISTORY_MERGE_WINDOW=0, WATCH_HISTORY_LIMIT=20)
+    def test_trim_is_deferred_and_chunked(self):
+        base = timezone.now() - timedelta(days=1)
+        events = [make_event(self.user1.id, self.movie1.id, 5, base + timedelta(seconds=i)) for i in range(25)]
+        events.append(make_event(self.user2.id, self.movie1.id, 5, base))
+        apply_watch_events(events)
+
+        # 삽입 경로에서는 정리하지 않지만 조회는 최신 20개만
+        self.assertEqual(UserMovieHistory.objects.filter(user=self.user1).count(), 25)
+        self.assertEqual(len(recent_watch_histories(self.user1)), 20)
+
+        self.assertEqual(trim_watch_history(chunk_size=2), 5)
+        remaining = UserMovieHistory.objects.filter(user=self.user1)
+        self.assertEqual(remaining.count(), 20)
+        self.assertEqual(remaining.order_by('watched_at').first().watched_at, base + timedelta(seconds=5))
+        self.assertEqual(UserMovieHistory.objects.filter(user=self.user2).count(), 1)
+        print('✅ [PASS] 보관 한도 초과분 → 주기 작업이 청크 단위로 정리')
+
+    # ========== 6. Redis 장애 시 즉시 반영 ==========
+    @override_settings(WATCH_HISTORY_QUEUE='redis', REDIS_URL='redis://127.0.0.1:1/0')
+    def test_enqueue_falls_back_to_sync_when_redis_unavailable(self):
+        watch_history._redis = None
+        try:
+            queued = enqueue_watch_events([make_event(self.user1.id, self.movie1.id, 30)])
+        finally:
+            watch_history._redis = None
+        self.assertFalse(queued)
+        self.assertEqual(UserMovieHistory.objects.filter(user=self.user1).count(), 1)
+        print('✅ [PASS] Redis 장애 → 즉시 반영')
+
+    # ========== 7. 병합 구간 안의 반복 시청 → 한 기록에 누적 ==========
+    def test_repeated_watch_within_window_is_merged(self):
+        base = timezone.now() - timedelta(minutes=30)
+        apply_watch_events([make_event(self.user1.id, self.movie1.id, 30, base)])
+        apply_watch_events([
+            make_event(self.user1.id, self.movie1.id, 30, base + timedelta(minutes=2)),
+            make_event(self.user1.id, self.movie1.id, 30, base + timedelta(minutes=4)),
+        ])
+
+        history = UserMovieHistory.objects.get(user=self.user1)
+        self.assertEqual(history.watch_time, 90)
+        self.assertEqual(history.watched_at, base + timedelta(minutes=4))
+        self.user1.refresh_from_db()
+        self.assertEqual(self.user1.pref_action, 90)
+        print('✅ [PASS] 병합 구간 안 반복 시청 → 한 기록에 누적')
+
+    # ========== 8. 병합 구간 밖 → 새 기록 ==========
+    @override_settings(WATCH_HISTORY_MERGE_WINDOW=60)
+    def test_watch_after_window_creates_new_row(self):
+        base = timezone.now() - timedelta(minutes=30)
+        apply_watch_events([
+            make_event(self.user1.id, self.movie1.id, 30, base),
+            make_event(self.user1.id, self.movie1.id, 30, base + timedelta(minutes=5)),
+            make_event(self.user1.id, self.movie2.id, 30, base + timedelta(seconds=30)),
+        ])
+        self.assertEqual(UserMovieHistory.objects.filter(user=self.user1, movie=self.movie1).count(), 2)
+        self.assertEqual(UserMovieHistory.objects.filter(user=self.user1).count(), 3)
+        print('✅ [PASS] 병합 구간 밖 / 다른 영화 → 새 기록')
+
+    # ========== 9. 같은 entry id 재전달 → 한 번만 반영 ==========
+    def test_redelivered_entries_are_applied_once(self):
+        events = [make_event(self.user1.id, self.movie1.id, 30), make_event(self.user2.id, self.movie2.id, 10)]
+        self.assertEqual(apply_watch_events(events, ['1-0', '2-0']), 2)
+        # ACK 전에 워커가 죽어 같은 배치 + 새 이벤트가 다시 전달된 경우
+        replay = events + [make_event(self.user2.id, self.movie1.id, 5)]
+        self.assertEqual(apply_watch_events(replay, ['1-0', '2-0', '3-0']), 1)
+
+        self.user1.refresh_from_db()
+        self.assertEqual((self.user1.pref_action, self.user1.total_watch_time), (30, 30))
+        self.assertEqual(UserMovieHistory.objects.count(), 3)
+        self.assertEqual(ProcessedWatchEvent.objects.count(), 3)
+        print('✅ [PASS] 재전달된 이벤트 → entry id로 중복 반영 방지')
+
+    # ========== 10. 계속 실패하는 이벤트 → dead letter, 나머지는 반영 ==========
+    @override_settings(WATCH_EVENT_MAX_DELIVERIES=3)
+    def test_poison_event_moves_to_dead_letter(self):
+        stream = FakeStream([
+            ('1-0', make_event(self.user1.id, self.movie1.id, 30)),
+            ('2-0', {**make_event(self.user1.id, self.movie2.id, 30), 'watched_at': 'not-a-date'}),
+            ('3-0', make_event(self.user2.id, self.movie2.id, 10)),
+            ('4-0', None),  # JSON이 깨진 이벤트
+        ])
+        command = 'accounts.management.commands.process_watch_history'
+        with mock.patch(f'{command}.ensure_consumer_group'), \
+                mock.patch(f'{command}.close_old_connections'), \
+                mock.patch(f'{command}.read_watch_events', stream.read), \
+                mock.patch(f'{command}.dead_letter_watch_events', stream.dead_letter), \
+                mock.patch(f'{command}.ack_watch_events', stream.ack), \
+                mock.patch('accounts.watch_history.delivery_counts', stream.delivery_counts):
+            call_command('process_watch_history', '--once', '--retry-delay', '0', stdout=StringIO())
+
+        self.assertEqual(sorted(stream.dead), ['2-0', '4-0'])
+        self.assertEqual((stream.pending, stream.acked), ({}, ['1-0', '3-0']))
+        self.assertEqual(UserMovieHistory.objects.count(), 2)
+        print('✅ [PASS] 반영 실패 이벤트 → 재시도 후 dead letter, 워커는 계속 진행')
+
+
+class FakeStream:
+    """Redis Stream consumer group의 pending/전달 횟수 동작만 흉내 낸 테스트용 스트림"""
+
+    def __init__(self, entries):
+        self.new, self.pending, self.dead, self.acked = list(entries), {}, [], []
+
+    def read(self, consumer, count, block_ms=None, pending=False):
+        if pending:
+            batch = list(self.pending.items())[:count]
+        else:
+            batch, self.new = [(entry_id, [event, 0]) for entry_id, event in self.new[:count]], self.new[count:]
+            self.pending.update(batch)
+        for _, state in batch:
+            state[1] += 1
+        return [(entry_id, state[0]) for entry_id, state in batch]
+
+    def delivery_counts(self, consumer, entry_ids):
+        return {entry_id: self.pending[entry_id][1] for entry_id in entry_ids}
+
+    def dead_letter(self, entries):
+        for entry_id, _ in entries:
+            self.dead.append(entry_id)
+            del self.pending[entry_id]
+
+    def ack(self, entry_ids):
+        for entry_id in entry_ids:
+            self.acked.append(entry_id)
+            del self.pending[entry_id]
@@ -8,6 +8,7 @@ from .views import (
     CustomTokenObtainPairView,
     MyPageView,
     WatchHistoryView,
+    WatchHistoryBatchView,
     OnboardingView,
     UserProfileUpdateView,
     UserProfileDeleteView
@@ -23,6 +24,7 @@ urlpatterns = [
     path('onboarding/', OnboardingView.as_view(), name='user_onboarding'),
     path('mypage/', MyPageView.as_view(), name='user_mypage'),
     path('watch-history/', WatchHistoryView.as_view(), name='watch_history'),
+    path('watch-history/batch/', WatchHistoryBatchView.as_view(), name='watch_history_batch'),
     
     # Profile management (Allow both with and without trailing slash)
     re_path(r'^profile/?$', UserProfileUpdateView.as_view(), name='user_profile_update'),
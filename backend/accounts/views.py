@@ -1,8 +1,7 @@
 import os
-import requests
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import update_last_login
-from django.db.models import Sum, F
+from django.utils import timezone
 from rest_framework import status, generics, views
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
@@ -19,11 +18,16 @@ from .serializers import (
     MyPageRequestSerializer, 
     MyPageResponseSerializer, 
     WatchHistorySerializer,
+    WatchHistoryBatchSerializer,
     OnboardingSerializer,
     UserProfileUpdateSerializer
 )
 from movies.models import Movie
-from .models import UserMovieHistory, UserMyList, UserLikeList
+from .models import UserMovieHistory, UserMyList, UserLikeList, GENRE_PREF_FIELDS, pref_delta_updates
+from .watch_history import enqueue_watch_events, make_event, MIN_WATCH_TIME
+from .caching import get_mypage_lists, set_mypage_lists, bump_user_versions
+from .social import fetch_user_info, SocialProviderError
+from .deletion import request_account_deletion
 
 User = get_user_model()
 
@@ -64,11 +68,15 @@ class UserProfileUpdateView(generics.UpdateAPIView):
     def patch(self, request, *args, **kwargs): return super().partial_update(request, *args, **kwargs)
 
 class UserProfileDeleteView(views.APIView):
+    """
+    DELETE /api/accounts/profile/delete/
+    즉시 비활성화만 하고 응답 — 연관 데이터 삭제와 카운터 보정은 purge_deleted_users 작업이 청크 단위로 처리
+    """
     permission_classes = (IsAuthenticated,)
     def delete(self, request):
         user = request.user
         try:
-            user.delete()
+            request_account_deletion(user)
             return Response({"message": "User deleted successfully"}, status=status.HTTP_204_NO_CONTENT)
         except Exception as e:
             return Response({"error": "DELETE_FAILED", "message": f"회원 탈퇴 중 오류 발생: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -96,17 +104,21 @@ class MyPageView(views.APIView):
                 "onboarding": user.is_onboarding_completed,
                 "is_superuser": user.is_superuser # 마이페이지 데이터에도 추가
             }
-            watchtime_sum = UserMovieHistory.objects.filter(user=user).aggregate(Sum('watch_time'))['watch_time__sum'] or 0
-            usermylist_count = UserLikeList.objects.filter(user=user).count()
-            record_movies_qs = UserMovieHistory.objects.filter(user=user).select_related('movie').order_by('-watched_at')[:10]
-            recordmovie = {}
-            for history in record_movies_qs:
-                recordmovie[str(history.movie.movie_id)] = {"recordmovie_name": history.movie.title, "recordmovie_poster": history.movie.poster_path}
-            like_movies_qs = UserLikeList.objects.filter(user=user).select_related('movie').order_by('-created_at')[:10]
-            mylistmovie = {}
-            for item in like_movies_qs:
-                mylistmovie[str(item.movie.movie_id)] = {"mylistmovie_name": item.movie.title, "mylistmovie_poster": item.movie.poster_path}
-            return Response({"userdata": userdata, "watchtime": watchtime_sum, "usermylist": usermylist_count, "recordmovie": recordmovie, "mylistmovie": mylistmovie}, status=status.HTTP_200_OK)
+            # ---- 최근 시청/좋아요 top-10 (유저별 캐시, 시청 기록 반영/좋아요 토글 시 무효화) ----
+            lists = get_mypage_lists(user.id)
+            if lists is None:
+                record_movies_qs = UserMovieHistory.objects.filter(user=user).select_related('movie').order_by('-watched_at', '-id')[:10]
+                recordmovie = {}
+                for history in record_movies_qs:
+                    recordmovie[str(history.movie.movie_id)] = {"recordmovie_name": history.movie.title, "recordmovie_poster": history.movie.poster_path}
+                like_movies_qs = UserLikeList.objects.filter(user=user).select_related('movie').order_by('-created_at')[:10]
+                mylistmovie = {}
+                for item in like_movies_qs:
+                    mylistmovie[str(item.movie.movie_id)] = {"mylistmovie_name": item.movie.title, "mylistmovie_poster": item.movie.poster_path}
+                lists = {"recordmovie": recordmovie, "mylistmovie": mylistmovie}
+                set_mypage_lists(user.id, lists)
+            # ---- 누적 시청 시간/좋아요 수는 인증 시 조회한 유저 행의 비정규화 컬럼 ----
+            return Response({"userdata": userdata, "watchtime": user.total_watch_time, "usermylist": user.like_count, **lists}, status=status.HTTP_200_OK)
         except Exception as e: return Response({"error": "SERVER_ERROR", "message": f"데이터 조회 중 서버 에러 발생: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class KakaoLoginView(views.APIView):
@@ -117,14 +129,15 @@ class KakaoLoginView(views.APIView):
         serializer = SocialLoginSerializer(data=request.data)
         if not serializer.is_valid(): return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         access_token = serializer.validated_data.get('access_token')
-        user_info_response = requests.get("https://kapi.kakao.com/v2/user/me", headers={'Authorization': f'Bearer {access_token}'})
-        if user_info_response.status_code != 200: return Response({'error': 'Invalid Kakao token'}, status=status.HTTP_401_UNAUTHORIZED)
-        user_info = user_info_response.json()
+        try: user_info = fetch_user_info('kakao', access_token)
+        except SocialProviderError: return Response({'error': 'Kakao server unavailable'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        if user_info is None: return Response({'error': 'Invalid Kakao token'}, status=status.HTTP_401_UNAUTHORIZED)
         kakao_id, kakao_account = user_info.get('id'), user_info.get('kakao_account', {})
         email, nickname = kakao_account.get('email'), kakao_account.get('profile', {}).get('nickname', f"kakao_{user_info.get('id')}")
         username = f"kakao_{kakao_id}"
         try:
             user = User.objects.get(username=username)
+            if not user.is_active: return Response({'error': 'INACTIVE_USER', 'message': '탈퇴 처리 중이거나 비활성화된 계정입니둥'}, status=status.HTTP_403_FORBIDDEN)
             if email: user.email = email
             user.save()
         except User.DoesNotExist:
@@ -141,14 +154,15 @@ class GoogleLoginView(views.APIView):
         serializer = SocialLoginSerializer(data=request.data)
         if not serializer.is_valid(): return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         access_token = serializer.validated_data.get('access_token')
-        user_info_response = requests.get("https://www.googleapis.com/oauth2/v3/userinfo", params={'access_token': access_token})
-        if user_info_response.status_code != 200: return Response({'error': 'Invalid Google token'}, status=status.HTTP_401_UNAUTHORIZED)
-        user_info = user_info_response.json()
+        try: user_info = fetch_user_info('google', access_token)
+        except SocialProviderError: return Response({'error': 'Google server unavailable'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        if user_info is None: return Response({'error': 'Invalid Google token'}, status=status.HTTP_401_UNAUTHORIZED)
         google_id, email = user_info.get('sub'), user_info.get('email')
         first_name, last_name = user_info.get('given_name', f"google_{google_id}"), user_info.get('family_name', '')
         username = f"google_{google_id}"
         try:
             user = User.objects.get(username=username)
+            if not user.is_active: return Response({'error': 'INACTIVE_USER', 'message': '탈퇴 처리 중이거나 비활성화된 계정입니둥'}, status=status.HTTP_403_FORBIDDEN)
             if email: user.email = email
             user.save()
         except User.DoesNotExist:
@@ -167,10 +181,44 @@ class WatchHistoryView(views.APIView):
         movie_id, watch_time = serializer.validated_data['movie_id'], serializer.validated_data['watch_time']
         try: movie = Movie.objects.get(movie_id=movie_id)
         except Movie.DoesNotExist: return Response({"error": "해당 영화를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
-        if watch_time < 3: return Response({"message": "시청 시간이 짧아 기록되지 않았습니둥.", "movie_id": movie_id, "watch_time": watch_time}, status=status.HTTP_200_OK)
-        UserMovieHistory.objects.create(user=request.user, movie=movie, watch_time=watch_time)
+        if watch_time < MIN_WATCH_TIME: return Response({"message": "시청 시간이 짧아 기록되지 않았습니둥.", "movie_id": movie_id, "watch_time": watch_time}, status=status.HTTP_200_OK)
+        # 큐에 적재되면 바로 202 응답 (워커가 배치 반영), 큐를 쓰지 않으면 즉시 반영 후 201
+        if enqueue_watch_events([make_event(request.user.id, movie.id, watch_time)]):
+            return Response({"message": "시청 기록이 접수되었습니다.", "movie_id": movie_id, "watch_time": watch_time}, status=status.HTTP_202_ACCEPTED)
         return Response({"message": "시청 기록이 저장되었습니다.", "movie_id": movie_id, "watch_time": watch_time}, status=status.HTTP_201_CREATED)
 
+class WatchHistoryBatchView(views.APIView):
+    """
+    POST /api/accounts/watch-history/batch/
+    여러 시청 이벤트를 한 번에 기록 (영화 조회 IN 쿼리 1회 + bulk insert)
+    Body: {"events": [{"movie_id", "watch_time", "watched_at"}, ...]} 또는 이벤트 배열
+    """
+    permission_classes = (IsAuthenticated,)
+    serializer_class = WatchHistoryBatchSerializer
+    @extend_schema(request=WatchHistoryBatchSerializer)
+    def post(self, request):
+        data = {"events": request.data} if isinstance(request.data, list) else request.data
+        serializer = WatchHistoryBatchSerializer(data=data)
+        if not serializer.is_valid(): return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        events = serializer.validated_data['events']
+
+        # ---- 짧은 시청 일괄 제외 + 영화 ID 일괄 조회 ----
+        valid = [e for e in events if e['watch_time'] >= MIN_WATCH_TIME]
+        movie_pks = dict(Movie.objects.filter(movie_id__in={e['movie_id'] for e in valid}).values_list('movie_id', 'id'))
+        now = timezone.now()
+        queue_events = [
+            make_event(request.user.id, movie_pks[e['movie_id']], e['watch_time'], min(e.get('watched_at') or now, now))
+            for e in valid if e['movie_id'] in movie_pks
+        ]
+        unknown = sorted({e['movie_id'] for e in valid if e['movie_id'] not in movie_pks})
+
+        result = {"accepted": len(queue_events), "skipped_short": len(events) - len(valid), "unknown_movie_ids": unknown}
+        if not queue_events:
+            return Response({"message": "기록할 시청 이벤트가 없습니다.", **result}, status=status.HTTP_200_OK)
+        if enqueue_watch_events(queue_events):
+            return Response({"message": "시청 기록이 접수되었습니다.", **result}, status=status.HTTP_202_ACCEPTED)
+        return Response({"message": "시청 기록이 저장되었습니다.", **result}, status=status.HTTP_201_CREATED)
+
 class OnboardingView(views.APIView):
     permission_classes = (IsAuthenticated,)
     serializer_class = OnboardingSerializer
@@ -180,10 +228,9 @@ class OnboardingView(views.APIView):
         if user.is_onboarding_completed: return Response({"error": "이미 온보딩을 완료한 사용자입니둥."}, status=status.HTTP_400_BAD_REQUEST)
         serializer = OnboardingSerializer(data=request.data)
         if not serializer.is_valid(): return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        for field, is_selected in serializer.validated_data.items():
-            if is_selected:
-                current_val = getattr(user, field, 0) or 0
-                setattr(user, field, current_val + 50)
-        user.is_onboarding_completed = True
-        user.save()
-        return Response({"status": "success", "message": "온보딩이 완료되었습니다.", "onboarding": user.is_onboarding_completed})
+        # 선택한 장르마다 +50 — 읽고 다시 쓰지 않고 UPDATE 한 문장으로 (동시 요청 시 한 번만 반영)
+        deltas = {GENRE_PREF_FIELDS.index(field): 50 for field, is_selected in serializer.validated_data.items() if is_selected}
+        updated = User.objects.filter(pk=user.pk, is_onboarding_completed=False).update(is_onboarding_completed=True, **pref_delta_updates(deltas))
+        if not updated: return Response({"error": "이미 온보딩을 완료한 사용자입니둥."}, status=status.HTTP_400_BAD_REQUEST)
+        bump_user_versions([user.pk])
+        return Response({"status": "success", "message": "온보딩이 완료되었습니다.", "onboarding": True})
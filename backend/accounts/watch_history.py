@@ -0,0 +1,303 @@
+"""
+시청 기록 수집 파이프라인
+
+WatchHistoryView → enqueue_watch_events() → Redis Stream → process_watch_history 워커 → apply_watch_events()
+
+- 요청 경로: 이벤트를 Stream에 적재(XADD)하고 바로 응답
+- 워커: 이벤트를 배치로 읽어 같은 (유저, 영화) 연속 시청은 한 기록으로 합친 뒤 bulk insert/update 1회씩 + 유저별 pref_*/total_watch_time F-update 1회
+- 보관 한도(WATCH_HISTORY_LIMIT) 초과분은 삽입 경로가 아닌 trim_watch_history 주기 작업이 청크 단위로 정리
+  (삭제 전 accounts.history_archive 월별 콜드 아카이브로 이동)
+  → 정리 전까지 한도를 넘는 기록이 남아 있을 수 있으므로 조회는 recent_watch_histories()로 최신 N개만
+- WATCH_HISTORY_QUEUE='sync' (테스트/단일 노드) 또는 Redis 장애 시: 큐 없이 같은 배치 로직으로 즉시 반영
+- 전달은 at-least-once: 반영한 entry id를 같은 트랜잭션에서 ProcessedWatchEvent에 기록 → 재전달돼도 한 번만 반영
+  WATCH_EVENT_MAX_DELIVERIES번 넘게 재전달된(계속 실패하는) 이벤트는 dead letter Stream으로 옮겨 워커가 막히지 않도록 함
+"""
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from movies.models import Movie
+from .models import User, UserMovieHistory, ProcessedWatchEvent, GENRE_ID_TO_PREF_INDEX, pref_delta_updates
+from .history_archive import archive_histories, archive_lock, commit_archives, recover_archives, ARCHIVE_FIELDS
+from .caching import invalidate_mypage_lists, bump_user_versions
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = 'watch_history:events'
+DEAD_LETTER_KEY = 'watch_history:dead'
+CONSUMER_GROUP = 'watch_history_workers'
+MIN_WATCH_TIME = 3      # 이보다 짧은 시청은 기록하지 않음 (초)
+
+_redis = None
+
+
+def get_redis():
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+# ========== 이벤트 적재 ==========
+def make_event(user_id, movie_pk, watch_time, watched_at=None):
+    """큐에 적재되는 시청 이벤트 (movie_id는 Movie PK)"""
+    return {
+        "user_id": user_id,
+        "movie_id": movie_pk,
+        "watch_time": watch_time,
+        "watched_at": (watched_at or timezone.now()).isoformat(),
+    }
+
+
+def enqueue_watch_events(events):
+    """이벤트를 Stream에 적재. 큐에 적재했으면 True, 즉시 반영했으면 False"""
+    if settings.WATCH_HISTORY_QUEUE == 'redis':
+        try:
+            pipe = get_redis().pipeline()
+            for event in events:
+                pipe.xadd(STREAM_KEY, {"event": json.dumps(event)})
+            pipe.execute()
+            return True
+        except redis.RedisError:
+            logger.warning("시청 기록 큐 적재 실패 — 즉시 반영으로 전환", exc_info=True)
+    apply_watch_events(events)
+    return False
+
+
+# ========== 배치 반영 ==========
+def apply_watch_events(events, entry_ids=None):
+    """
+    시청 이벤트 배치를 DB에 반영합니다.
+    - entry_ids(워커): 이미 반영한 entry id의 이벤트는 건너뛰고, 새로 반영한 id는 같은 트랜잭션에서 기록
+    - 같은 (유저, 영화)의 이벤트가 WATCH_HISTORY_MERGE_WINDOW 안에 이어지면 한 기록으로 합침
+      (배치 안의 이벤트끼리 + 직전 배치까지 저장된 최근 기록과)
+    - 합쳐진 기존 기록은 watch_time 누적 + watched_at 갱신 (bulk update 1회), 새 기록은 bulk insert 1회
+    - 유저별 취향 벡터(pref_*) / total_watch_time 누적 시청 시간 F-update 1회 (배치 내 합산 — 이벤트별 증가분만 반영)
+    - 유저별 마이페이지 목록 캐시 삭제 + 유저 버전 증가 (인증 유저 캐시 무효화)
+    보관 한도 정리는 하지 않음 (trim_watch_history 주기 작업)
+    """
+    if entry_ids is not None:
+        processed = set(ProcessedWatchEvent.objects.filter(entry_id__in=entry_ids).values_list('entry_id', flat=True))
+        pairs = [(entry_id, event) for entry_id, event in zip(entry_ids, events) if entry_id not in processed]
+        entry_ids, events = [entry_id for entry_id, _ in pairs], [event for _, event in pairs]
+    if not events:
+        return 0
+
+    # ---- 그 사이 삭제된 유저/영화의 이벤트 제외 ----
+    user_ids = set(User.objects.filter(id__in={e["user_id"] for e in events}).values_list('id', flat=True))
+    movie_ids = set(Movie.objects.filter(id__in={e["movie_id"] for e in events}).values_list('id', flat=True))
+    events = sorted(
+        ({**e, "watched_at": datetime.fromisoformat(e["watched_at"])} for e in events
+         if e["user_id"] in user_ids and e["movie_id"] in movie_ids),
+        key=lambda e: e["watched_at"],
+    )
+    if not events:
+        return 0
+
+    # ---- 영화별 취향 벡터 인덱스 (장르 조회 1회) ----
+    movie_prefs = defaultdict(list)
+    genre_rows = Movie.genres.through.objects.filter(movie_id__in=movie_ids).values_list('movie_id', 'genre_id')
+    for movie_id, genre_id in genre_rows:
+        if genre_id in GENRE_ID_TO_PREF_INDEX:
+            movie_prefs[movie_id].append(GENRE_ID_TO_PREF_INDEX[genre_id])
+
+    # ---- 유저별 취향 벡터 증가량 + 누적 시청 시간 ----
+    pref_deltas = defaultdict(lambda: defaultdict(int))
+    watch_time_deltas = defaultdict(int)
+    for event in events:
+        watch_time_deltas[event["user_id"]] += event["watch_time"]
+        for index in movie_prefs[event["movie_id"]]:
+            pref_deltas[event["user_id"]][index] += event["watch_time"]
+
+    window = timedelta(seconds=settings.WATCH_HISTORY_MERGE_WINDOW)
+    with transaction.atomic():
+        # 같은 entry id가 동시에 반영되면 PK 충돌로 트랜잭션 전체가 롤백됨
+        if entry_ids:
+            ProcessedWatchEvent.objects.bulk_create([ProcessedWatchEvent(entry_id=entry_id) for entry_id in entry_ids])
+
+        # ---- (유저, 영화)별 마지막 기록 — 병합 구간 안의 것만 조회 1회 ----
+        latest = {}
+        if window:
+            recent = UserMovieHistory.objects.select_for_update().filter(
+                user_id__in={e["user_id"] for e in events},
+                movie_id__in={e["movie_id"] for e in events},
+                watched_at__gte=events[0]["watched_at"] - window,
+            ).order_by('watched_at', 'id')
+            for history in recent:
+                latest[(history.user_id, history.movie_id)] = history
+
+        new_histories, merged = [], {}
+        for event in events:
+            key = (event["user_id"], event["movie_id"])
+            history = latest.get(key)
+            if history is not None and window and timedelta(0) <= event["watched_at"] - history.watched_at <= window:
+                history.watch_time += event["watch_time"]
+                history.watched_at = event["watched_at"]
+                if history.pk:
+                    merged[history.pk] = history
+                continue
+            history = UserMovieHistory(
+                user_id=event["user_id"],
+                movie_id=event["movie_id"],
+                watch_time=event["watch_time"],
+                watched_at=event["watched_at"],
+            )
+            latest[key] = history
+            new_histories.append(history)
+
+        UserMovieHistory.objects.bulk_create(new_histories)
+        if merged:
+            UserMovieHistory.objects.bulk_update(merged.values(), ['watch_time', 'watched_at'])
+        for user_id, watch_time in watch_time_deltas.items():
+            User.objects.filter(pk=user_id).update(
+                total_watch_time=F('total_watch_time') + watch_time, **pref_delta_updates(pref_deltas[user_id])
+            )
+
+    invalidate_mypage_lists(watch_time_deltas.keys())
+    bump_user_versions(watch_time_deltas.keys())
+    return len(events)
+
+
+# ========== 보관 한도 ==========
+def history_limit():
+    return settings.WATCH_HISTORY_LIMIT
+
+
+def recent_watch_histories(user):
+    """조회용 시청 기록 — 정리 전 초과분이 남아 있어도 최신 보관 한도만큼만"""
+    return UserMovieHistory.objects.filter(user=user).order_by('-watched_at', '-id')[:history_limit()]
+
+
+def users_over_history_limit(limit=None):
+    """보관 한도를 넘긴 유저 id 목록 (user_id 인덱스로 그룹 집계)"""
+    limit = history_limit() if limit is None else limit
+    return list(
+        UserMovieHistory.objects.order_by().values('user_id')
+        .annotate(history_count=Count('id')).filter(history_count__gt=limit)
+        .values_list('user_id', flat=True)
+    )
+
+
+def trim_watch_history(user_ids=None, limit=None, chunk_size=1000):
+    """
+    보관 한도 초과분을 chunk_size개씩 콜드 아카이브에 덧붙인 뒤 삭제합니다. → 삭제한 기록 수
+    user_ids를 주지 않으면 한도를 넘긴 유저를 먼저 찾습니다.
+    """
+    limit = history_limit() if limit is None else limit
+    with archive_lock():
+        recover_archived_histories()
+    if user_ids is None:
+        user_ids = users_over_history_limit(limit)
+
+    deleted = 0
+    for user_id in user_ids:
+        histories = UserMovieHistory.objects.filter(user_id=user_id)
+        # 한도 밖 첫 기록 (최신순 limit번째) — 이 기록과 그보다 오래된 기록이 삭제 대상
+        boundary = histories.order_by('-watched_at', '-id').values('watched_at', 'id')[limit:limit + 1].first()
+        if boundary is None:
+            continue
+        overflow = histories.filter(
+            Q(watched_at__lt=boundary['watched_at']) | Q(watched_at=boundary['watched_at'], id__lte=boundary['id'])
+        ).order_by('watched_at', 'id')
+        while True:
+            # 청크 조회~아카이브~삭제를 한 잠금 안에서 → 탈퇴 작업의 아카이브 제거와 엇갈리지 않음
+            with archive_lock():
+                chunk = list(overflow.values(*ARCHIVE_FIELDS)[:chunk_size])
+                if not chunk:
+                    break
+                archive_histories(chunk)
+                deleted += UserMovieHistory.objects.filter(pk__in=[row['id'] for row in chunk]).delete()[0]
+                commit_archives()
+    return deleted
+
+
+def recover_archived_histories():
+    """이전 정리가 아카이브 후 삭제 전에 중단됐으면 덧붙인 기록을 되돌림 (archive_lock 안에서 호출)"""
+    recover_archives(lambda ids: UserMovieHistory.objects.filter(pk__in=ids).exists())
+
+
+# ========== 워커용 Stream 읽기/확인 ==========
+def ensure_consumer_group():
+    try:
+        get_redis().xgroup_create(STREAM_KEY, CONSUMER_GROUP, id='0', mkstream=True)
+    except redis.ResponseError as e:
+        if 'BUSYGROUP' not in str(e):
+            raise
+
+
+def read_watch_events(consumer, count, block_ms=None, pending=False):
+    """
+    Stream에서 이벤트 배치를 읽습니다. → [(entry_id, event), ...] (JSON이 깨진 이벤트는 event=None)
+    pending=True면 이 consumer가 읽고 확인(ACK)하지 못한 이벤트부터 다시 읽습니다. (워커 재시작/반영 실패 시)
+    """
+    response = get_redis().xreadgroup(
+        CONSUMER_GROUP, consumer, {STREAM_KEY: '0' if pending else '>'}, count=count, block=None if pending else block_ms
+    )
+    if not response:
+        return []
+    return [(entry_id, parse_event(fields)) for entry_id, fields in response[0][1]]
+
+
+def parse_event(fields):
+    try:
+        return json.loads(fields["event"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def delivery_counts(consumer, entry_ids):
+    """XPENDING: entry id별 전달 횟수"""
+    if not entry_ids:
+        return {}
+    rows = get_redis().xpending_range(
+        STREAM_KEY, CONSUMER_GROUP, min=entry_ids[0], max=entry_ids[-1], count=len(entry_ids), consumername=consumer
+    )
+    return {row['message_id']: row['times_delivered'] for row in rows}
+
+
+def split_dead_letters(consumer, entries, pending=False):
+    """
+    반영할 이벤트 / dead letter로 보낼 이벤트 분리 → (entries, dead)
+    JSON이 깨진 이벤트와, 다시 읽은(pending) 이벤트 중 WATCH_EVENT_MAX_DELIVERIES번 이상 전달된 이벤트가 dead
+    """
+    counts = delivery_counts(consumer, [entry_id for entry_id, _ in entries]) if pending else {}
+    alive, dead = [], []
+    for entry_id, event in entries:
+        if event is None or counts.get(entry_id, 0) >= settings.WATCH_EVENT_MAX_DELIVERIES:
+            dead.append((entry_id, event))
+        else:
+            alive.append((entry_id, event))
+    return alive, dead
+
+
+def dead_letter_watch_events(entries):
+    """반영할 수 없는 이벤트를 dead letter Stream으로 옮기고 원래 Stream에서 확인/제거"""
+    if not entries:
+        return
+    pipe = get_redis().pipeline()
+    for entry_id, event in entries:
+        pipe.xadd(DEAD_LETTER_KEY, {"entry_id": entry_id, "event": json.dumps(event)})
+    pipe.xack(STREAM_KEY, CONSUMER_GROUP, *[entry_id for entry_id, _ in entries])
+    pipe.xdel(STREAM_KEY, *[entry_id for entry_id, _ in entries])
+    pipe.execute()
+    logger.error("시청 이벤트 %d개를 dead letter로 이동: %s", len(entries), [entry_id for entry_id, _ in entries])
+
+
+def ack_watch_events(entry_ids):
+    """반영이 끝난 이벤트 확인 후 Stream에서 제거 + 중복 반영 방지 기록 정리 (ACK 후에는 재전달되지 않음)"""
+    if entry_ids:
+        pipe = get_redis().pipeline()
+        pipe.xack(STREAM_KEY, CONSUMER_GROUP, *entry_ids)
+        pipe.xdel(STREAM_KEY, *entry_ids)
+        pipe.execute()
+        # ACK 직후 중단돼 남은 기록은 하루 지나면 함께 정리
+        ProcessedWatchEvent.objects.filter(
+            Q(entry_id__in=entry_ids) | Q(processed_at__lt=timezone.now() - timedelta(days=1))
+        ).delete()
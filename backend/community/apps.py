@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def ensure_search_index(sender, using, **kwargs):
+    """migrate 후 검색 인덱스/트리거 재확인 (SQLite 테이블 재생성으로 트리거가 사라진 경우 복구)"""
+    from django.db import connections
+    from .search import install_search_index
+    install_search_index(connections[using])
 
 
 class CommunityConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "community"
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        post_migrate.connect(ensure_search_index, sender=self)
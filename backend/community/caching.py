@@ -0,0 +1,25 @@
+"""
+커뮤니티 리뷰 캐시 키 및 무효화 헬퍼
+
+- 리뷰 상세 캐시: is_liked를 제외한 비개인화 응답 (본문 + 첫 댓글 페이지 + 댓글 수)을 리뷰별로 저장
+  리뷰 수정/삭제, 좋아요 토글, 댓글 작성/수정/삭제, 회원 탈퇴 정리 시 삭제
+"""
+from django.core.cache import cache
+
+REVIEW_DETAIL_TIMEOUT = 60 * 10  # 10분
+
+
+def review_detail_key(review_id):
+    return f"community:review_detail:{review_id}"
+
+
+def get_review_detail(review_id):
+    return cache.get(review_detail_key(review_id))
+
+
+def set_review_detail(review_id, payload):
+    cache.set(review_detail_key(review_id), payload, REVIEW_DETAIL_TIMEOUT)
+
+
+def invalidate_review_details(review_ids):
+    cache.delete_many([review_detail_key(review_id) for review_id in set(review_ids)])
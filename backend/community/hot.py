@@ -0,0 +1,98 @@
+"""
+커뮤니티 리뷰 인기순(type=hot) 점수
+
+hot_score = (좋아요 + 댓글 × HOT_COMMENT_WEIGHT) / (경과 시간(h) + 2) ^ HOT_GRAVITY
+
+- Review.hot_score 컬럼에 저장 + (hot_score, id) 인덱스 → 목록은 인덱스 범위 조회 (전체 테이블 계산 정렬 없음)
+- 좋아요 토글 / 댓글 작성·삭제: 리뷰 행 잠금 상태에서 새 카운트로 점수를 계산해 카운트와 같은 UPDATE로 저장
+  (댓글은 community.signals에서 adjust_comment_count 호출 → API 외 경로로 만든 댓글도 반영)
+- 시간이 지나며 떨어지는 점수는 refresh_hot_scores 주기 작업이 재계산 (HOT_MIN_SCORE 미만은 0으로 내려 다음 패스에서 제외)
+  (패스 도중 들어온 좋아요/댓글과 겹쳐 한 번 덜 반영되더라도 다음 패스에서 카운트 기준으로 다시 맞춰짐)
+- bulk_create/직접 SQL 등 시그널 없는 경로로 어긋난 comment_count는 reconcile_review_comment_counts 명령으로 일괄 보정
+"""
+from django.db import transaction
+from django.db.models import Count, F
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+
+from .caching import invalidate_review_details
+from .models import Review, ReviewComment
+
+HOT_COMMENT_WEIGHT = 2
+HOT_GRAVITY = 1.5
+HOT_MIN_SCORE = 0.001
+
+
+def hot_score(like_count, comment_count, created_at, now=None):
+    now = now or timezone.now()
+    points = max(like_count + comment_count * HOT_COMMENT_WEIGHT, 0)
+    age_hours = max((now - created_at).total_seconds(), 0) / 3600
+    score = points / (age_hours + 2) ** HOT_GRAVITY
+    return score if score >= HOT_MIN_SCORE else 0.0
+
+
+def lock_review(review_id):
+    """카운트/점수 갱신용 리뷰 행 잠금 (트랜잭션 안에서 호출). 리뷰가 없으면 Http404"""
+    return get_object_or_404(
+        Review.objects.select_for_update().only('id', 'like_count', 'comment_count', 'created_at'), id=review_id
+    )
+
+
+def apply_counts(review, like_delta=0, comment_delta=0):
+    """잠근 리뷰의 like_count/comment_count 증감 + hot_score 재계산을 UPDATE 1회로 저장"""
+    review.like_count += like_delta
+    review.comment_count += comment_delta
+    review.hot_score = hot_score(review.like_count, review.comment_count, review.created_at)
+    Review.objects.filter(pk=review.pk).update(
+        like_count=F('like_count') + like_delta,
+        comment_count=F('comment_count') + comment_delta,
+        hot_score=review.hot_score,
+    )
+
+
+def adjust_comment_count(review_id, delta):
+    """댓글 작성/삭제 시 리뷰를 잠그고 comment_count 증감 + hot_score 재계산 (리뷰가 이미 없으면 무시)"""
+    with transaction.atomic():
+        review = (
+            Review.objects.select_for_update().only('id', 'like_count', 'comment_count', 'created_at')
+            .filter(pk=review_id).first()
+        )
+        if review:
+            apply_counts(review, comment_delta=delta)
+    transaction.on_commit(lambda: invalidate_review_details([review_id]))
+
+
+# ========== 주기적 감쇠 ==========
+def reconcile_review_comment_counts(batch_size=500, now=None):
+    """댓글 테이블 기준으로 comment_count + hot_score 재계산 → 보정한 리뷰 수"""
+    now = now or timezone.now()
+    actual = dict(
+        ReviewComment.objects.order_by().values('review_id').annotate(count=Count('id')).values_list('review_id', 'count')
+    )
+    changed = []
+    reviews = Review.objects.only('id', 'like_count', 'comment_count', 'created_at').order_by('id')
+    for review in reviews.iterator(chunk_size=batch_size):
+        count = actual.get(review.id, 0)
+        if review.comment_count != count:
+            review.comment_count = count
+            review.hot_score = hot_score(review.like_count, count, review.created_at, now)
+            changed.append(review)
+    Review.objects.bulk_update(changed, ['comment_count', 'hot_score'], batch_size=batch_size)
+    return len(changed)
+
+
+def refresh_hot_scores(batch_size=500, now=None):
+    """점수가 남아 있는 리뷰만 현재 시각 기준으로 재계산 → 갱신한 리뷰 수"""
+    now = now or timezone.now()
+    changed = []
+    reviews = (
+        Review.objects.filter(hot_score__gt=0)
+        .only('id', 'like_count', 'comment_count', 'created_at', 'hot_score').order_by('id')
+    )
+    for review in reviews.iterator(chunk_size=batch_size):
+        score = hot_score(review.like_count, review.comment_count, review.created_at, now)
+        if score != review.hot_score:
+            review.hot_score = score
+            changed.append(review)
+    Review.objects.bulk_update(changed, ['hot_score'], batch_size=batch_size)
+    return len(changed)
@@ -0,0 +1,56 @@
+"""
+커뮤니티 리뷰 좋아요
+
+Review.like_count는 좋아요 수 비정규화 컬럼입니다.
+- 토글: 리뷰 행 잠금(select_for_update) → through 테이블 DELETE 또는 INSERT → like_count F() 증감 + hot_score를 한 트랜잭션에서 처리
+  (같은 리뷰에 대한 동시 요청은 행 잠금으로 직렬화되어 카운트가 어긋나지 않음)
+- 목록/정렬은 through 테이블 COUNT 대신 like_count 컬럼을 그대로 사용
+- 직접 INSERT/관리자 수정 등으로 어긋난 값은 reconcile_review_like_counts 명령으로 일괄 보정
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from .hot import apply_counts, lock_review
+from .models import Review
+
+ReviewLike = Review.like_users.through
+
+
+def toggle_review_like(review_id, user_id):
+    """좋아요 등록 ↔ 취소 → (is_liked, like_count). 리뷰가 없으면 Http404"""
+    with transaction.atomic():
+        review = lock_review(review_id)
+        deleted = ReviewLike.objects.filter(review_id=review.id, user_id=user_id).delete()[0]
+        if deleted:
+            delta = -deleted
+        else:
+            ReviewLike.objects.create(review_id=review.id, user_id=user_id)
+            delta = 1
+        apply_counts(review, like_delta=delta)
+    return not deleted, review.like_count
+
+
+def decrement_like_counts(review_ids):
+    """삭제되는 좋아요만큼 like_count 감소 (review_ids: 좋아요 1건당 리뷰 id 1개, 같은 감소량끼리 UPDATE 1회)"""
+    by_count = defaultdict(list)
+    for review_id, count in Counter(review_ids).items():
+        by_count[count].append(review_id)
+    for count, ids in by_count.items():
+        Review.objects.filter(pk__in=ids).update(like_count=F('like_count') - count)
+
+
+def reconcile_review_like_counts(batch_size=500):
+    """through 테이블 기준으로 like_count 재계산 → 보정한 리뷰 수"""
+    actual = dict(
+        ReviewLike.objects.order_by().values('review_id').annotate(count=Count('id')).values_list('review_id', 'count')
+    )
+    changed = []
+    for review in Review.objects.only('id', 'like_count').order_by('id').iterator(chunk_size=batch_size):
+        count = actual.get(review.id, 0)
+        if review.like_count != count:
+            review.like_count = count
+            changed.append(review)
+    Review.objects.bulk_update(changed, ['like_count'], batch_size=batch_size)
+    return len(changed)
@@ -0,0 +1,50 @@
+"""
+커뮤니티 리뷰 movie_title(자유 입력) → movie FK 일괄 연결 Management Command
+
+리뷰 작성/수정 시에는 즉시 연결되므로, 기존 리뷰나 영화가 나중에 추가된 경우 이 명령으로 채웁니다.
+정규화 제목 인덱스(Movie.title_key)로 청크마다 한 번에 해석하고, 같은 영화끼리 UPDATE 1회로 저장합니다.
+
+사용법:
+    uv run python manage.py backfill_review_movies              # 연결 안 된 리뷰만
+    uv run python manage.py backfill_review_movies --all        # 이미 연결된 리뷰도 다시 해석
+"""
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from community.models import Review
+from movies.titles import normalize_title, resolve_movie_ids
+
+
+class Command(BaseCommand):
+    help = '커뮤니티 리뷰의 영화 제목을 영화(movie FK)와 일괄 연결합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 해석할 리뷰 수')
+        parser.add_argument('--all', action='store_true', help='이미 연결된 리뷰도 다시 해석')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = Review.objects.all() if options['all'] else Review.objects.filter(movie__isnull=True)
+        linked = scanned = 0
+        last_id = 0
+        while True:
+            # id 키셋으로 청크 순회 (연결된 행이 조건에서 빠져도 건너뛰지 않음)
+            rows = list(
+                queryset.filter(id__gt=last_id).order_by('id').values_list('id', 'movie_title', 'movie_id')[:batch_size]
+            )
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            scanned += len(rows)
+
+            resolved = resolve_movie_ids(title for _, title, _ in rows)
+            by_movie = defaultdict(list)
+            for review_id, title, current in rows:
+                movie_pk = resolved.get(normalize_title(title))
+                if movie_pk != current and (movie_pk or options['all']):
+                    by_movie[movie_pk].append(review_id)
+            for movie_pk, review_ids in by_movie.items():
+                linked += Review.objects.filter(pk__in=review_ids).update(movie_id=movie_pk)
+
+        self.stdout.write(self.style.SUCCESS(f'리뷰 영화 연결 완료! ({scanned}건 확인, {linked}건 갱신)'))
@@ -0,0 +1,24 @@
+"""
+커뮤니티 리뷰 comment_count(+ hot_score)를 댓글 테이블 기준으로 재계산하는 Management Command
+
+댓글 save()/delete()는 시그널로 comment_count를 증분 갱신하므로, 시그널이 발생하지 않는
+bulk_create / queryset.update() / 직접 SQL로 댓글을 넣거나 지운 경우 이 명령으로 정합성을 맞춥니다.
+
+사용법:
+    uv run python manage.py reconcile_review_comment_counts
+    uv run python manage.py reconcile_review_comment_counts --batch-size 1000
+"""
+from django.core.management.base import BaseCommand
+
+from community.hot import reconcile_review_comment_counts
+
+
+class Command(BaseCommand):
+    help = '댓글을 한 번의 그룹 쿼리로 집계하여 커뮤니티 리뷰 comment_count/hot_score를 보정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='bulk_update 배치 크기')
+
+    def handle(self, *args, **options):
+        changed = reconcile_review_comment_counts(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'리뷰 댓글 수 보정 완료! ({changed}건 보정)'))
@@ -0,0 +1,24 @@
+"""
+커뮤니티 리뷰 like_count를 좋아요(through 테이블) 기준으로 재계산하는 Management Command
+
+좋아요 토글은 like_count를 증분 갱신하므로, through 테이블을 직접 수정했거나
+초기 데이터를 넣은 경우 이 명령으로 정합성을 맞춥니다.
+
+사용법:
+    uv run python manage.py reconcile_review_like_counts
+    uv run python manage.py reconcile_review_like_counts --batch-size 1000
+"""
+from django.core.management.base import BaseCommand
+
+from community.likes import reconcile_review_like_counts
+
+
+class Command(BaseCommand):
+    help = '좋아요를 한 번의 그룹 쿼리로 집계하여 커뮤니티 리뷰 like_count를 보정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='bulk_update 배치 크기')
+
+    def handle(self, *args, **options):
+        changed = reconcile_review_like_counts(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'리뷰 좋아요 수 보정 완료! ({changed}건 보정)'))
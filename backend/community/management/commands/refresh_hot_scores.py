@@ -0,0 +1,29 @@
+"""
+커뮤니티 리뷰 인기순(hot_score) 감쇠 주기 작업
+
+좋아요/댓글이 들어올 때는 점수가 즉시 갱신되지만, 시간이 지나며 떨어지는 점수는 이 작업이 재계산합니다.
+(점수가 0인 리뷰는 건너뛰므로 활동이 있었던 최근 리뷰만 읽음)
+
+사용법:
+    uv run python manage.py refresh_hot_scores                  # 1회 실행 (cron)
+    uv run python manage.py refresh_hot_scores --interval 300   # 5분마다 반복
+"""
+from django.core.management.base import BaseCommand
+
+from community.hot import refresh_hot_scores
+from config.periodic import run_periodically
+
+
+class Command(BaseCommand):
+    help = '현재 시각 기준으로 커뮤니티 리뷰 hot_score를 재계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='bulk_update 배치 크기')
+        parser.add_argument('--interval', type=int, default=0, help='반복 주기 (초, 0이면 1회 실행 후 종료)')
+
+    def handle(self, *args, **options):
+        def refresh():
+            changed = refresh_hot_scores(batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'인기순 점수 갱신: {changed}건'))
+
+        run_periodically(refresh, options['interval'])
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-19 14:10
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_like_count(apps, schema_editor):
+    """기존 좋아요(through 테이블) 기준으로 like_count 초기값 채우기"""
+    Review = apps.get_model('community', 'Review')
+    through = Review.like_users.through
+    for row in through.objects.order_by().values('review_id').annotate(count=Count('id')):
+        Review.objects.filter(pk=row['review_id']).update(like_count=row['count'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0002_review_like_users'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='like_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['like_count', 'id'], name='community_review_likes_idx'),
+        ),
+        migrations.RunPython(backfill_like_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 6.0.2 on 2026-10-19 14:40
+
+from django.db import migrations
+
+# 이 시점의 검색 인덱스 정의를 그대로 고정 (community.search가 바뀌어도 마이그레이션 재실행 결과는 동일)
+SEARCH_FIELDS = ('movie_title', 'title', 'content')
+FTS_TABLE = 'community_review_fts'
+
+POSTGRES_SETUP_SQL = ['CREATE EXTENSION IF NOT EXISTS pg_trgm'] + [
+    f'CREATE INDEX IF NOT EXISTS community_review_{field}_trgm ON community_review USING gin (UPPER({field}) gin_trgm_ops)'
+    for field in SEARCH_FIELDS
+]
+
+SQLITE_SETUP_SQL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"movie_title, title, content, content='community_review', content_rowid='id', tokenize='unicode61')",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON community_review BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, movie_title, title, content) VALUES (new.id, new.movie_title, new.title, new.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON community_review BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, movie_title, title, content) VALUES ('delete', old.id, old.movie_title, old.title, old.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF movie_title, title, content ON community_review BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, movie_title, title, content) VALUES ('delete', old.id, old.movie_title, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, movie_title, title, content) VALUES (new.id, new.movie_title, new.title, new.content);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def create_search_index(apps, schema_editor):
+    """DB 종류별 검색 인덱스 생성 (Postgres: pg_trgm GIN, SQLite: FTS5 + 동기화 트리거)"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        statements = POSTGRES_SETUP_SQL
+    elif vendor == 'sqlite':
+        statements = SQLITE_SETUP_SQL
+    else:
+        return
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        for field in SEARCH_FIELDS:
+            schema_editor.execute(f'DROP INDEX IF EXISTS community_review_{field}_trgm')
+    elif vendor == 'sqlite':
+        for suffix in ('ai', 'ad', 'au'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0003_review_like_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
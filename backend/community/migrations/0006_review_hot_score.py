@@ -0,0 +1,61 @@
+# Generated by Django 6.0.2 on 2026-10-19 15:40
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+# 이 시점의 hot_score 공식을 그대로 고정 (community.hot이 바뀌어도 마이그레이션 재실행 결과는 동일)
+HOT_COMMENT_WEIGHT = 2
+HOT_GRAVITY = 1.5
+HOT_MIN_SCORE = 0.001
+
+
+def hot_score(like_count, comment_count, created_at, now):
+    points = max(like_count + comment_count * HOT_COMMENT_WEIGHT, 0)
+    age_hours = max((now - created_at).total_seconds(), 0) / 3600
+    score = points / (age_hours + 2) ** HOT_GRAVITY
+    return score if score >= HOT_MIN_SCORE else 0.0
+
+
+def backfill_hot_score(apps, schema_editor):
+    """기존 댓글 수로 comment_count 채우고 현재 시각 기준 hot_score 계산"""
+    Review = apps.get_model('community', 'Review')
+    ReviewComment = apps.get_model('community', 'ReviewComment')
+    comment_counts = dict(
+        ReviewComment.objects.order_by().values('review_id').annotate(count=Count('id')).values_list('review_id', 'count')
+    )
+    now = timezone.now()
+    changed = []
+    for review in Review.objects.only('id', 'like_count', 'created_at').iterator(chunk_size=500):
+        review.comment_count = comment_counts.get(review.id, 0)
+        review.hot_score = hot_score(review.like_count, review.comment_count, review.created_at, now)
+        if review.comment_count or review.hot_score:
+            changed.append(review)
+    Review.objects.bulk_update(changed, ['comment_count', 'hot_score'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0005_review_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='comment_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='hot_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['hot_score', 'id'], name='community_review_hot_idx'),
+        ),
+        migrations.RunPython(backfill_hot_score, migrations.RunPython.noop),
+    ]
@@ -10,16 +10,34 @@ class Review(models.Model):
     )
     title = models.CharField(max_length=200)           # 리뷰 제목
     movie_title = models.CharField(max_length=200)     # 영화 제목 (텍스트)
+    movie = models.ForeignKey(                          # 제목으로 해석한 영화 (없으면 null, movies.titles)
+        'movies.Movie', on_delete=models.SET_NULL, null=True, blank=True, related_name='community_reviews',
+        db_index=False,  # (movie, created_at, id) 복합 인덱스가 대신함
+    )
     rank = models.IntegerField()                        # 평점 (1~10)
     content = models.TextField()                        # 리뷰 본문
     like_users = models.ManyToManyField(                # 좋아요 누른 유저들
         settings.AUTH_USER_MODEL, related_name='liked_reviews', blank=True
     )
+    like_count = models.IntegerField(default=0)         # 좋아요 수 (비정규화, community.likes에서 갱신)
+    comment_count = models.IntegerField(default=0)      # 댓글 수 (비정규화, 댓글 작성/삭제 시 갱신)
+    hot_score = models.FloatField(default=0)            # 인기순 점수 (community.hot)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
+        # 목록 정렬별 키셋 페이지네이션용 (field, id) 복합 인덱스 (역방향 스캔으로 desc도 처리)
+        indexes = [
+            models.Index(fields=['like_count', 'id'], name='community_review_likes_idx'),
+            models.Index(fields=['hot_score', 'id'], name='community_review_hot_idx'),
+            models.Index(fields=['rank', 'id'], name='community_review_rank_idx'),
+            models.Index(fields=['title', 'id'], name='community_review_title_idx'),
+            models.Index(fields=['movie_title', 'id'], name='community_review_mtitle_idx'),
+            models.Index(fields=['created_at', 'id'], name='community_review_created_idx'),
+            # 영화별 리뷰 목록 (최신순)
+            models.Index(fields=['movie', 'created_at', 'id'], name='community_review_movie_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.movie_title}] {self.title}"
@@ -29,7 +47,8 @@ class Review(models.Model):
 class ReviewComment(models.Model):
     """리뷰 댓글"""
     review = models.ForeignKey(
-        Review, on_delete=models.CASCADE, related_name='comments'
+        Review, on_delete=models.CASCADE, related_name='comments',
+        db_index=False,  # (review, created_at, id) 복합 인덱스가 대신함
     )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='review_comments'
@@ -39,6 +58,10 @@ class ReviewComment(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        # 리뷰별 댓글 키셋 페이지네이션 (역방향 스캔으로 최신순도 처리)
+        indexes = [
+            models.Index(fields=['review', 'created_at', 'id'], name='community_comment_page_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}: {self.content[:20]}"
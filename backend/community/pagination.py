@@ -0,0 +1,127 @@
+"""
+커뮤니티 리뷰 목록 키셋 페이지네이션
+
+정렬 필드 + id(동점 처리)로 정렬하고, 커서에 마지막 행의 (정렬 값, id)를 담아
+다음 페이지를 WHERE (field, id) < (값, id) 범위 조회로 가져옵니다.
+→ OFFSET 없이 (field, id) 복합 인덱스 범위만 읽으므로 깊은 페이지도 첫 페이지와 비용이 같음
+
+- 커서: base64(JSON [정렬 타입, 방향, 값, id]) — 다른 정렬의 커서는 거부
+- 리뷰 댓글도 같은 방식 (created_at, id) — 상세 응답의 첫 댓글 페이지 커서로 댓글 목록 API에서 이어서 조회
+- 전체 개수: 첫 페이지에서만 (include_count=false로 생략 가능)
+  필터 없는 전체 목록은 PostgreSQL 통계(pg_class.reltuples) 추정치 사용 → count_estimated=true
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import FilteredRelation, Q
+
+from accounts.models import User
+from config.db import estimated_row_count
+from .models import Review, ReviewComment
+
+REVIEW_PAGE_SIZE = 10
+MAX_REVIEW_PAGE_SIZE = 50
+COMMENT_PAGE_SIZE = 10
+
+
+def encode_cursor(sort_type, descending, value, review_id):
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort_type, 'desc' if descending else 'asc', value, review_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor, sort_type, descending, sort_field):
+    """커서 → (정렬 값, id), 잘못됐거나 다른 정렬의 커서면 None"""
+    try:
+        cursor_type, direction, value, review_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if cursor_type != sort_type or direction != ('desc' if descending else 'asc'):
+            return None
+        if sort_field == 'created_at':
+            value = datetime.fromisoformat(value)
+        elif sort_field == 'search_rank':
+            value = float(value)
+        else:
+            value = Review._meta.get_field(sort_field).to_python(value)
+        return value, int(review_id)
+    except (ValueError, TypeError, binascii.Error, ValidationError):
+        return None
+
+
+def get_keyset_page(queryset, sort_type, sort_field, descending, position=None, page_size=REVIEW_PAGE_SIZE):
+    """(sort_field, id) 순 한 페이지 → (rows, next_cursor)"""
+    direction = '-' if descending else ''
+    queryset = queryset.order_by(f'{direction}{sort_field}', f'{direction}id')
+    if position:
+        value, review_id = position
+        op = 'lt' if descending else 'gt'
+        queryset = queryset.filter(
+            Q(**{f'{sort_field}__{op}': value}) | Q(**{sort_field: value, f'id__{op}': review_id})
+        )
+    rows = list(queryset[:page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        last = rows[page_size - 1]
+        next_cursor = encode_cursor(sort_type, descending, getattr(last, sort_field), last.id)
+    return rows[:page_size], next_cursor
+
+
+def get_comment_page(review_id, descending=False, position=None, page_size=COMMENT_PAGE_SIZE):
+    """리뷰 댓글 (created_at, id) 순 한 페이지 + 작성자 JOIN → (comments, next_cursor)"""
+    queryset = ReviewComment.objects.filter(review_id=review_id).select_related('user')
+    return get_keyset_page(queryset, 'comments', 'created_at', descending, position, page_size)
+
+
+COMMENT_FIELDS = ('id', 'content', 'created_at')
+COMMENT_USER_FIELDS = ('id', 'username', 'email', 'first_name', 'last_name', 'date_joined')
+
+
+def get_review_comment_page(review_id, descending=True, position=None, page_size=COMMENT_PAGE_SIZE):
+    """
+    리뷰 존재 확인 + 댓글 한 페이지 + 작성자를 쿼리 1회로 → (comment_count, comments, next_cursor), 리뷰가 없으면 None
+    review LEFT JOIN 댓글(키셋 조건은 ON 절) LEFT JOIN 작성자 → 댓글이 없어도 리뷰 행 1개가 남아 404와 구분됨
+    """
+    condition = Q()
+    if position:
+        value, comment_id = position
+        op = 'lt' if descending else 'gt'
+        condition &= (
+            Q(**{f'comments__created_at__{op}': value})
+            | Q(**{'comments__created_at': value, f'comments__id__{op}': comment_id})
+        )
+    direction = '-' if descending else ''
+    columns = [f'page__{field}' for field in COMMENT_FIELDS] + [f'page__user__{field}' for field in COMMENT_USER_FIELDS]
+    rows = list(
+        Review.objects.filter(pk=review_id)
+        .annotate(page=FilteredRelation('comments', condition=condition))
+        .order_by(f'{direction}page__created_at', f'{direction}page__id')
+        .values('comment_count', *columns)[:page_size + 1]
+    )
+    if not rows:
+        return None
+
+    comments = [
+        ReviewComment(
+            review_id=review_id,
+            user=User(**{field: row[f'page__user__{field}'] for field in COMMENT_USER_FIELDS}),
+            **{field: row[f'page__{field}'] for field in COMMENT_FIELDS},
+        )
+        for row in rows if row['page__id'] is not None
+    ]
+    next_cursor = None
+    if len(comments) > page_size:
+        last = comments[page_size - 1]
+        next_cursor = encode_cursor('comments', descending, last.created_at, last.id)
+    return rows[0]['comment_count'], comments[:page_size], next_cursor
+
+
+def count_reviews(queryset, filtered):
+    """(count, count_estimated) — 필터 없는 전체 목록은 추정치 우선"""
+    if not filtered:
+        estimate = estimated_row_count(Review)
+        if estimate is not None:
+            return estimate, True
+    return queryset.count(), False
@@ -0,0 +1,151 @@
+"""
+커뮤니티 리뷰 검색 백엔드
+
+movie_title / title / content 세 컬럼을 인덱스로 검색하고 search_rank(클수록 관련도 높음)를 annotate합니다.
+결과는 일반 queryset이므로 rating 필터·정렬·페이징과 그대로 조합됩니다.
+
+- postgres: pg_trgm GIN 인덱스 (UPPER(컬럼) gin_trgm_ops) → icontains가 인덱스를 타고, similarity()로 순위
+- sqlite  : FTS5 가상 테이블 community_review_fts (external content) → MATCH + bm25()로 순위
+- basic   : 인덱스 없는 icontains (그 외 DB용 대체 경로)
+
+인덱스/가상 테이블과 동기화 트리거는 install_search_index()가 DB 종류별로 생성합니다.
+(community 마이그레이션 0004 + 매 migrate 후 post_migrate에서 재확인)
+→ 리뷰 작성/수정/삭제(관리자 화면·탈퇴 청크 삭제 포함)는 별도 호출 없이 DB 안에서 검색 인덱스에 반영됩니다.
+
+REVIEW_SEARCH_BACKEND 설정: 'auto'(기본, DB 종류로 선택) / 'postgres' / 'sqlite' / 'basic'
+"""
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, FloatField, Func, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Greatest
+
+from config.db import trigram_index_sql
+
+SEARCH_FIELDS = ('movie_title', 'title', 'content')
+
+FTS_TABLE = 'community_review_fts'
+
+
+# ========== 인덱스 생성 (DB 종류별) ==========
+POSTGRES_SETUP_SQL = trigram_index_sql({'community_review': SEARCH_FIELDS})
+
+# external content FTS5: 본문은 community_review에만 저장, 트리거로 역색인만 동기화
+SQLITE_TABLE_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"movie_title, title, content, content='community_review', content_rowid='id', tokenize='unicode61')"
+)
+SQLITE_TRIGGER_SQL = [
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON community_review BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, movie_title, title, content) VALUES (new.id, new.movie_title, new.title, new.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON community_review BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, movie_title, title, content) VALUES ('delete', old.id, old.movie_title, old.title, old.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF movie_title, title, content ON community_review BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, movie_title, title, content) VALUES ('delete', old.id, old.movie_title, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, movie_title, title, content) VALUES (new.id, new.movie_title, new.title, new.content);
+    END""",
+]
+
+
+def install_search_index(connection):
+    """
+    검색 인덱스 생성 (여러 번 호출해도 안전)
+    SQLite는 컬럼 변경 마이그레이션이 테이블을 다시 만들면서 트리거가 사라지므로,
+    트리거가 없으면 다시 만들고 역색인을 rebuild합니다.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            for sql in POSTGRES_SETUP_SQL:
+                cursor.execute(sql)
+        elif connection.vendor == 'sqlite':
+            cursor.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE %s", [f'{FTS_TABLE}_%']
+            )
+            if cursor.fetchone()[0] == len(SQLITE_TRIGGER_SQL):
+                return
+            cursor.execute(SQLITE_TABLE_SQL)
+            for sql in SQLITE_TRIGGER_SQL:
+                cursor.execute(sql)
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+# ========== 검색 백엔드 ==========
+class BasicSearchBackend:
+    """인덱스 없는 대체 경로 — 모든 DB에서 동작"""
+
+    def search(self, queryset, query):
+        condition = Q()
+        for field in SEARCH_FIELDS:
+            condition |= Q(**{f'{field}__icontains': query})
+        return queryset.filter(condition).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class Similarity(Func):
+    """pg_trgm similarity(a, b) → 0~1"""
+    function = 'SIMILARITY'
+    output_field = FloatField()
+
+
+class PostgresTrigramSearchBackend(BasicSearchBackend):
+    """
+    UPPER(컬럼) LIKE UPPER('%검색어%') 형태의 icontains를 trigram GIN 인덱스가 처리 (BitmapOr)
+    순위: 세 컬럼 similarity 중 최댓값 (영화 제목 일치가 본문 일치보다 높게 나오도록 본문은 절반 가중)
+    """
+
+    def search(self, queryset, query):
+        rank = Greatest(
+            Similarity(F('movie_title'), Value(query)),
+            Similarity(F('title'), Value(query)),
+            Similarity(F('content'), Value(query)) * Value(0.5),
+        )
+        return super().search(queryset, query).annotate(search_rank=rank)
+
+
+class SQLiteFTSSearchBackend:
+    """FTS5 MATCH (각 단어 접두어 AND 검색) + bm25 순위"""
+
+    def match_expression(self, query):
+        # 사용자 입력의 FTS5 문법(따옴표, OR, NEAR, 컬럼 필터 등)을 무력화: 단어마다 "단어"* 접두어 검색
+        terms = ['"{}"*'.format(term.replace('"', '""')) for term in query.split()]
+        return ' '.join(terms)
+
+    def search(self, queryset, query):
+        match = self.match_expression(query)
+        if not match:
+            return queryset.none()
+        table = queryset.model._meta.db_table
+        # bm25()는 작을수록 관련도 높음 → 부호를 바꿔 search_rank로 사용
+        rank = RawSQL(
+            f'SELECT -bm25({FTS_TABLE}, 2.0, 1.0, 0.5) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = {table}.id',
+            [match], output_field=FloatField(),
+        )
+        matched_ids = RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [match])
+        return queryset.filter(id__in=matched_ids).annotate(search_rank=rank)
+
+
+# ========== 백엔드 선택 ==========
+BACKENDS = {
+    'postgres': PostgresTrigramSearchBackend,
+    'sqlite': SQLiteFTSSearchBackend,
+    'basic': BasicSearchBackend,
+}
+
+VENDOR_BACKENDS = {
+    'postgresql': 'postgres',
+    'sqlite': 'sqlite',
+}
+
+
+def get_search_backend():
+    name = getattr(settings, 'REVIEW_SEARCH_BACKEND', 'auto')
+    if name == 'auto':
+        name = VENDOR_BACKENDS.get(connection.vendor, 'basic')
+    return BACKENDS[name]()
+
+
+def search_reviews(queryset, query):
+    """검색어로 queryset 필터링 + search_rank annotate"""
+    return get_search_backend().search(queryset, query.strip())
@@ -36,14 +36,17 @@ class ReviewCommentUpdateSerializer(serializers.ModelSerializer):
 
 # ========== 좋아요 필드 Mixin ==========
 class LikeFieldsMixin(serializers.Serializer):
-    """like_users_count, is_liked 공통 필드"""
-    like_users_count = serializers.SerializerMethodField()
+    """
+    like_users_count, is_liked 공통 필드
+    like_users_count는 Review.like_count 컬럼, 목록 조회의 is_liked는 context['liked_review_ids'] 사용 (행별 쿼리 없음)
+    """
+    like_users_count = serializers.IntegerField(source='like_count', read_only=True)
     is_liked = serializers.SerializerMethodField()
 
-    def get_like_users_count(self, obj):
-        return obj.like_users.count()
-
     def get_is_liked(self, obj):
+        liked_ids = self.context.get('liked_review_ids')
+        if liked_ids is not None:
+            return obj.id in liked_ids
         request = self.context.get('request')
         if request and hasattr(request, 'user') and request.user.is_authenticated:
             return obj.like_users.filter(id=request.user.id).exists()
@@ -87,13 +90,19 @@ class ReviewListSerializer(LikeFieldsMixin, serializers.ModelSerializer):
                   'like_users_count', 'is_liked', 'created_at', 'updated_at']
 
 
-# ========== 리뷰 상세용 (comments 포함) ==========
+# ========== 리뷰 상세용 (첫 댓글 페이지 포함) ==========
 class ReviewDetailSerializer(LikeFieldsMixin, serializers.ModelSerializer):
-    """리뷰 상세 시리얼라이저 — 댓글 포함"""
+    """
+    리뷰 상세 시리얼라이저 — 첫 댓글 페이지 포함
+    comments: context['comments'] (작성자 JOIN으로 조회한 첫 N개), comment_count: Review.comment_count 컬럼
+    """
     user = ReviewUserSerializer(read_only=True)
-    comments = ReviewCommentSerializer(many=True, read_only=True)
+    comments = serializers.SerializerMethodField()
 
     class Meta:
         model = Review
         fields = ['id', 'title', 'movie_title', 'rank', 'content', 'user',
-                  'comments', 'like_users_count', 'is_liked', 'created_at', 'updated_at']
+                  'comments', 'comment_count', 'like_users_count', 'is_liked', 'created_at', 'updated_at']
+
+    def get_comments(self, obj):
+        return ReviewCommentSerializer(self.context.get('comments', []), many=True).data
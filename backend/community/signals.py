@@ -0,0 +1,29 @@
+"""
+ReviewComment 작성/삭제 → Review.comment_count(+ hot_score) 갱신
+
+댓글 API뿐 아니라 관리자 화면·시드 스크립트·ORM의 save()/delete() 경로도 카운트를 맞추도록 시그널에서 처리합니다.
+- 리뷰 삭제로 함께 지워지는 댓글(cascade)은 건너뜀
+- 시그널이 발생하지 않는 bulk_create / queryset.update() 경로는 reconcile_review_comment_counts 명령으로 보정
+"""
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .hot import adjust_comment_count
+from .models import Review, ReviewComment
+
+
+def deleted_with_review(origin):
+    return isinstance(origin, Review) or (isinstance(origin, QuerySet) and origin.model is Review)
+
+
+@receiver(post_save, sender=ReviewComment)
+def count_created_comment(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        adjust_comment_count(instance.review_id, 1)
+
+
+@receiver(post_delete, sender=ReviewComment)
+def count_deleted_comment(sender, instance, origin=None, **kwargs):
+    if not deleted_with_review(origin):
+        adjust_comment_count(instance.review_id, -1)
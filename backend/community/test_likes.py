@@ -1,3 +1,7 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -68,3 +72,61 @@ class ReviewLikeTest(TestCase):
         self.client.credentials()  # 인증 정보 제거
         response = self.client.post(self.url)
         self.assertEqual(response.status_code, 401)
+
+
+class ReviewLikeCountTest(TestCase):
+    """리뷰 like_count 비정규화 컬럼 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='password123')
+        cls.users = [User.objects.create_user(username=f'liker{i}', password='password123') for i in range(3)]
+        cls.reviews = [
+            Review.objects.create(user=cls.author, title=f'리뷰 {i}', movie_title='영화', rank=5, content='본문')
+            for i in range(3)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def like(self, user, review):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+        return self.client.post(f'/api/community/review/{review.id}/like/')
+
+    # ========== 1. 토글 → through 행과 like_count 함께 증감 ==========
+    def test_toggle_updates_column(self):
+        for user in self.users:
+            self.like(user, self.reviews[1])
+        response = self.like(self.users[0], self.reviews[1])
+
+        self.assertEqual((response.data['is_liked'], response.data['like_users_count']), (False, 2))
+        self.reviews[1].refresh_from_db()
+        self.assertEqual(self.reviews[1].like_count, self.reviews[1].like_users.count())
+        self.assertEqual(self.like(self.users[0], Review(id=999999)).status_code, 404)
+        print('✅ [PASS] 좋아요 토글 → like_count 동시 증감')
+
+    # ========== 2. 목록 likes 정렬은 컬럼 사용 ==========
+    def test_list_sorts_by_column(self):
+        self.like(self.users[0], self.reviews[2])
+        self.like(self.users[1], self.reviews[2])
+        self.like(self.users[0], self.reviews[0])
+
+        response = self.client.get('/api/community/review/list/', {'type': 'likes'})
+        results = response.data['results']
+        self.assertEqual([row['id'] for row in results], [r.id for r in (self.reviews[2], self.reviews[0], self.reviews[1])])
+        self.assertEqual([row['like_users_count'] for row in results], [2, 1, 0])
+        print('✅ [PASS] type=likes → like_count 내림차순')
+
+    # ========== 3. 보정 명령 → through 테이블 기준 재계산 ==========
+    def test_reconcile_command(self):
+        self.reviews[0].like_users.add(*self.users)  # 토글을 거치지 않은 좋아요
+        Review.objects.filter(pk=self.reviews[1].pk).update(like_count=7)
+
+        out = StringIO()
+        call_command('reconcile_review_like_counts', stdout=out)
+        self.assertIn('2건 보정', out.getvalue())
+        self.assertEqual(
+            list(Review.objects.order_by('id').values_list('like_count', flat=True)), [3, 0, 0]
+        )
+        print('✅ [PASS] reconcile_review_like_counts → like_count 재계산')
@@ -0,0 +1,78 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+
+from community.models import Review, ReviewComment
+
+User = get_user_model()
+
+
+class ReviewCommentKeysetTest(TestCase):
+    """댓글 목록 키셋 페이지네이션 + 단일 쿼리 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        users = [User.objects.create_user(username=f'c{i}', password='testpass1234!') for i in range(4)]
+        cls.review = Review.objects.create(user=users[0], title='글', movie_title='영화', rank=8, content='본문', comment_count=23)
+        cls.empty = Review.objects.create(user=users[0], title='빈 글', movie_title='영화', rank=8, content='본문')
+        ReviewComment.objects.bulk_create([
+            ReviewComment(review=cls.review, user=users[i % 4], content=f'댓글 {i}') for i in range(23)
+        ])
+        # 작성 시각이 같은 댓글이 섞여도 id로 순서가 결정되어야 함
+        first = ReviewComment.objects.order_by('id').first()
+        ReviewComment.objects.filter(id__lte=first.id + 9).update(created_at=first.created_at)
+        cls.url = f'/api/community/review/{cls.review.id}/comment/list/'
+
+    def setUp(self):
+        self.client = APIClient()
+
+    # ========== 1. 커서 순회 (asc/desc) — 페이지마다 쿼리 1회 ==========
+    def test_walk_pages_with_single_query(self):
+        for order, prefix in (('desc', '-'), ('asc', '')):
+            seen, cursor = [], None
+            while True:
+                params = {'order': order, 'page_size': 4}
+                if cursor:
+                    params['cursor'] = cursor
+                with self.assertNumQueries(1):
+                    data = self.client.get(self.url, params).data
+                self.assertEqual(data['count'], 23)
+                seen.extend(comment['id'] for comment in data['results'])
+                cursor = data['next_cursor']
+                if cursor is None:
+                    break
+            expected = list(self.review.comments.order_by(f'{prefix}created_at', f'{prefix}id').values_list('id', flat=True))
+            self.assertEqual(seen, expected, order)
+
+        comment = self.client.get(self.url).data['results'][0]
+        self.assertEqual((comment['review'], comment['user']['username']), (self.review.id, 'c2'))
+        print('✅ [PASS] 댓글 커서 순회 asc/desc → 중복/누락 없음, 페이지당 쿼리 1회')
+
+    # ========== 2. 댓글 없는 리뷰 / 없는 리뷰 — 쿼리 1회로 구분 ==========
+    def test_empty_and_missing_review(self):
+        with self.assertNumQueries(1):
+            data = self.client.get(f'/api/community/review/{self.empty.id}/comment/list/').data
+        self.assertEqual((data['count'], data['results'], data['next_cursor']), (0, [], None))
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/community/review/999999/comment/list/')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.client.get(self.url, {'cursor': 'broken'}).status_code, 400)
+        print('✅ [PASS] 빈 리뷰 → 빈 목록, 없는 리뷰 → 404 (각 쿼리 1회)')
+
+    # ========== 3. API 외 경로(ORM save/delete)도 count 반영, 리뷰 삭제 cascade는 건너뜀 ==========
+    def test_orm_comments_keep_count(self):
+        user = User.objects.get(username='c1')
+        comment = ReviewComment.objects.create(review=self.empty, user=user, content='관리자 화면에서 작성')
+        ReviewComment.objects.create(review=self.empty, user=user, content='시드 스크립트')
+        self.assertEqual(self.client.get(f'/api/community/review/{self.empty.id}/comment/list/').data['count'], 2)
+
+        comment.delete()
+        self.assertEqual(Review.objects.get(pk=self.empty.pk).comment_count, 1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            Review.objects.filter(pk=self.empty.pk).delete()
+        self.assertFalse([q for q in ctx.captured_queries if q['sql'].startswith('UPDATE')])  # 지워질 리뷰 카운트 갱신 없음
+        print('✅ [PASS] ORM 댓글 작성/삭제 → comment_count 반영, 리뷰 cascade 삭제는 건너뜀')
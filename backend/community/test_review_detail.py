@@ -0,0 +1,83 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from community.models import Review, ReviewComment
+from community.views import DETAIL_COMMENT_COUNT
+
+User = get_user_model()
+
+
+class ReviewDetailCommentsTest(TestCase):
+    """리뷰 상세: 첫 댓글 페이지 + 커서 + 캐시 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='testpass1234!')
+        cls.commenters = [User.objects.create_user(username=f'c{i}', password='testpass1234!') for i in range(5)]
+        cls.review = Review.objects.create(user=cls.author, title='글', movie_title='영화', rank=8, content='본문')
+        ReviewComment.objects.bulk_create([
+            ReviewComment(review=cls.review, user=cls.commenters[i % 5], content=f'댓글 {i}') for i in range(25)
+        ])
+        Review.objects.filter(pk=cls.review.pk).update(comment_count=25)
+        cls.url = f'/api/community/review/{cls.review.id}/'
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def login(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+
+    # ========== 1. 첫 N개 댓글만 (쿼리 2회) + 커서로 나머지 이어서 조회 ==========
+    def test_first_comments_and_continuation(self):
+        with self.assertNumQueries(2):  # 리뷰+작성자, 댓글+작성자
+            data = self.client.get(self.url).data
+        self.assertEqual(len(data['comments']), DETAIL_COMMENT_COUNT)
+        self.assertEqual(data['comment_count'], 25)
+
+        seen = [comment['id'] for comment in data['comments']]
+        next_url = data['comments_next']
+        while next_url:
+            page = self.client.get(next_url).data
+            seen.extend(comment['id'] for comment in page['results'])
+            self.assertEqual(page['count'], 25)
+            cursor = page['next_cursor']
+            next_url = f'/api/community/review/{self.review.id}/comment/list/?order=asc&cursor={cursor}' if cursor else None
+
+        expected = list(ReviewComment.objects.filter(review=self.review).order_by('created_at', 'id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+        print('✅ [PASS] 상세 첫 댓글 페이지 + comments_next 커서로 전체 순회')
+
+    # ========== 2. 캐시 적중 → 쿼리 없음, is_liked만 유저별 ==========
+    def test_cached_payload_with_personal_is_liked(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        liker = self.commenters[0]
+        self.login(liker)
+        self.client.post(f'{self.url}like/')
+        self.client.get(self.url)  # 인증 유저 캐시 적재
+        with self.assertNumQueries(1):  # is_liked 조회만
+            data = self.client.get(self.url).data
+        self.assertEqual((data['is_liked'], data['like_users_count']), (True, 1))
+        print('✅ [PASS] 상세 캐시 적중 + is_liked 유저별 조회')
+
+    # ========== 3. 댓글 작성/수정/삭제 → 캐시 무효화 ==========
+    def test_comment_writes_invalidate(self):
+        self.login(self.commenters[0])
+        self.client.get(self.url)
+
+        created = self.client.post(f'{self.url}comment/create/', {'content': '새 댓글'}, format='json').data['comment']
+        self.assertEqual(self.client.get(self.url).data['comment_count'], 26)
+
+        first = self.client.get(self.url).data['comments'][0]
+        self.client.put(f'{self.url}comment/{first["id"]}/update/', {'content': '수정됨'}, format='json')
+        self.assertEqual(self.client.get(self.url).data['comments'][0]['content'], '수정됨')
+
+        self.client.delete(f'{self.url}comment/{created["id"]}/delete/')
+        self.assertEqual(self.client.get(self.url).data['comment_count'], 25)
+        print('✅ [PASS] 댓글 작성/수정/삭제 → 상세 캐시 무효화')
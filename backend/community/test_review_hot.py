@@ -0,0 +1,130 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from community.hot import hot_score, refresh_hot_scores
+from community.models import Review, ReviewComment
+
+User = get_user_model()
+
+URL = '/api/community/review/list/'
+
+
+class ReviewHotScoreTest(TestCase):
+    """커뮤니티 리뷰 인기순(type=hot) 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='testpass1234!')
+        cls.users = [User.objects.create_user(username=f'fan{i}', password='testpass1234!') for i in range(3)]
+        cls.old, cls.new, cls.quiet = [
+            Review.objects.create(user=cls.author, title=f'글 {i}', movie_title='영화', rank=5, content='본문')
+            for i in range(3)
+        ]
+        # old: 하루 전 작성
+        Review.objects.filter(pk=cls.old.pk).update(created_at=timezone.now() - timedelta(days=1))
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def login(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+
+    # ========== 1. 좋아요/댓글 → 점수 즉시 갱신, 최신 글이 우선 ==========
+    def test_like_and_comment_update_score(self):
+        for user in self.users:
+            self.login(user)
+            self.client.post(f'/api/community/review/{self.old.id}/like/')
+        self.login(self.users[0])
+        self.client.post(f'/api/community/review/{self.new.id}/like/')
+        self.client.post(f'/api/community/review/{self.new.id}/comment/create/', {'content': '좋아요'}, format='json')
+
+        old, new = Review.objects.get(pk=self.old.pk), Review.objects.get(pk=self.new.pk)
+        self.assertEqual((new.like_count, new.comment_count), (1, 1))
+        self.assertAlmostEqual(new.hot_score, hot_score(1, 1, new.created_at), places=3)
+        self.assertGreater(new.hot_score, old.hot_score)  # 좋아요 3개지만 하루 지난 글보다 방금 글이 위
+
+        response = self.client.get(URL, {'type': 'hot'})
+        self.assertEqual([row['id'] for row in response.data['results']], [self.new.id, self.old.id, self.quiet.id])
+        print('✅ [PASS] 좋아요/댓글 → hot_score 즉시 갱신 + type=hot 정렬')
+
+    # ========== 2. 댓글 삭제 → comment_count 감소 ==========
+    def test_comment_delete_decrements(self):
+        self.login(self.users[0])
+        response = self.client.post(f'/api/community/review/{self.new.id}/comment/create/', {'content': '댓글'}, format='json')
+        comment_id = response.data['comment']['id']
+        self.client.delete(f'/api/community/review/{self.new.id}/comment/{comment_id}/delete/')
+
+        new = Review.objects.get(pk=self.new.pk)
+        self.assertEqual((new.comment_count, new.hot_score), (0, 0))
+        print('✅ [PASS] 댓글 삭제 → comment_count/hot_score 감소')
+
+    # ========== 3. 감쇠 패스: 점수 있는 리뷰만 재계산 ==========
+    def test_decay_pass(self):
+        Review.objects.filter(pk=self.new.pk).update(like_count=4, hot_score=hot_score(4, 0, timezone.now()))
+        later = timezone.now() + timedelta(hours=6)
+
+        self.assertEqual(refresh_hot_scores(now=later), 1)
+        new = Review.objects.get(pk=self.new.pk)
+        self.assertAlmostEqual(new.hot_score, hot_score(4, 0, new.created_at, later), places=6)
+
+        # 아주 오래 지나면 0으로 내려가고 다음 패스에서 제외
+        refresh_hot_scores(now=later + timedelta(days=365))
+        self.assertEqual(Review.objects.get(pk=self.new.pk).hot_score, 0)
+        out = StringIO()
+        call_command('refresh_hot_scores', stdout=out)
+        self.assertIn('0건', out.getvalue())
+        print('✅ [PASS] 감쇠 패스 → 점수 재계산 + 0점 리뷰 제외')
+
+    # ========== 4. hot 목록은 인덱스 범위 조회 (계산식 정렬 없음) ==========
+    def test_hot_read_is_plain_column_order(self):
+        first = self.client.get(URL, {'type': 'hot', 'page_size': 1, 'include_count': 'false'})
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(URL, {'type': 'hot', 'page_size': 1, 'cursor': first.data['next_cursor']})
+        sql = ctx.captured_queries[0]['sql']
+        self.assertIn('ORDER BY "community_review"."hot_score" DESC, "community_review"."id" DESC', sql)
+        print('✅ [PASS] type=hot → (hot_score, id) 컬럼 정렬 + 커서')
+
+    # ========== 5. 직접 넣은 댓글 → 보정 명령으로 comment_count/hot_score 재계산 ==========
+    def test_reconcile_comment_counts(self):
+        ReviewComment.objects.bulk_create([
+            ReviewComment(review=self.new, user=self.users[i], content='직접 입력') for i in range(3)
+        ])
+        Review.objects.filter(pk=self.quiet.pk).update(comment_count=-1)
+
+        out = StringIO()
+        call_command('reconcile_review_comment_counts', stdout=out)
+        self.assertIn('2건', out.getvalue())
+        new, quiet = Review.objects.get(pk=self.new.pk), Review.objects.get(pk=self.quiet.pk)
+        self.assertEqual((new.comment_count, quiet.comment_count), (3, 0))
+        self.assertAlmostEqual(new.hot_score, hot_score(0, 3, new.created_at), places=3)
+        print('✅ [PASS] reconcile_review_comment_counts → comment_count/hot_score 재계산')
+
+    # ========== 6. --interval 반복 중 실패한 회차는 로그만 남기고 다음 주기에 다시 실행 ==========
+    def test_interval_loop_survives_errors(self):
+        class Stop(Exception):
+            pass
+
+        out = StringIO()
+        with mock.patch('community.management.commands.refresh_hot_scores.refresh_hot_scores',
+                        side_effect=[RuntimeError('db down'), 2]) as refresh, \
+                mock.patch('config.periodic.close_old_connections') as close, \
+                mock.patch('config.periodic.time.sleep', side_effect=[None, Stop]), \
+                self.assertLogs('config.periodic', level='ERROR'), \
+                self.assertRaises(Stop):
+            call_command('refresh_hot_scores', interval=300, stdout=out)
+        self.assertEqual(refresh.call_count, 2)
+        self.assertEqual(close.call_count, 4)
+        self.assertIn('2건', out.getvalue())
+        print('✅ [PASS] --interval 반복 → 실패 회차는 로그 후 계속 + 매 회차 연결 정리')
@@ -0,0 +1,79 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+
+from community.models import Review
+
+User = get_user_model()
+
+URL = '/api/community/review/list/'
+
+
+class ReviewKeysetPaginationTest(TestCase):
+    """리뷰 목록 키셋(커서) 페이지네이션 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='writer', password='testpass1234!')
+        # 정렬 값이 겹치는 행이 많아도 id로 순서가 결정되어야 함
+        Review.objects.bulk_create([
+            Review(user=cls.user, title=f'글 {i % 4}', movie_title=f'영화 {i % 3}', rank=i % 5 + 1,
+                   content='본문', like_count=i % 2)
+            for i in range(23)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def walk(self, params, page_size=5):
+        seen, cursor = [], None
+        while True:
+            query = dict(params, page_size=page_size)
+            if cursor:
+                query['cursor'] = cursor
+            response = self.client.get(URL, query)
+            self.assertEqual(response.status_code, 200)
+            seen.extend(row['id'] for row in response.data['results'])
+            cursor = response.data['next_cursor']
+            if cursor is None:
+                return seen
+
+    # ========== 1. 모든 정렬/방향에서 중복·누락 없이 순회 ==========
+    def test_walk_every_sort(self):
+        sorts = {'rating': 'rank', 'title': 'title', 'movie_title': 'movie_title',
+                 'likes': 'like_count', 'created_at': 'created_at'}
+        for sort_type, field in sorts.items():
+            for order, prefix in (('asc', ''), ('desc', '-')):
+                expected = list(Review.objects.order_by(f'{prefix}{field}', f'{prefix}id').values_list('id', flat=True))
+                self.assertEqual(self.walk({'type': sort_type, 'order': order}), expected, (sort_type, order))
+        # 필터와 조합
+        expected = list(Review.objects.filter(rank=3).order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(self.walk({'rating': 3}, page_size=2), expected)
+        print('✅ [PASS] 정렬 5종 × asc/desc 커서 순회 → 중복/누락 없음')
+
+    # ========== 2. 깊은 페이지: OFFSET/COUNT 없이 쿼리 1회 ==========
+    def test_deep_page_has_no_offset_or_count(self):
+        first = self.client.get(URL, {'type': 'title', 'page_size': 5})
+        self.assertEqual((first.data['count'], first.data['count_estimated']), (23, False))
+
+        cursor = first.data['next_cursor']
+        for _ in range(3):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(URL, {'type': 'title', 'page_size': 5, 'cursor': cursor})
+            self.assertEqual(len(ctx.captured_queries), 1)
+            self.assertNotIn('OFFSET', ctx.captured_queries[0]['sql'].upper())
+            self.assertIsNone(response.data['count'])
+            cursor = response.data['next_cursor']
+
+        with self.assertNumQueries(1):
+            self.client.get(URL, {'include_count': 'false'})
+        print('✅ [PASS] 깊은 페이지 → OFFSET/COUNT 없는 쿼리 1회')
+
+    # ========== 3. 잘못된 커서 / 다른 정렬의 커서 → 400 ==========
+    def test_invalid_cursor(self):
+        cursor = self.client.get(URL, {'type': 'rating', 'page_size': 5}).data['next_cursor']
+        self.assertEqual(self.client.get(URL, {'type': 'title', 'cursor': cursor}).status_code, 400)
+        self.assertEqual(self.client.get(URL, {'cursor': 'not-a-cursor'}).status_code, 400)
+        print('✅ [PASS] 잘못된/다른 정렬 커서 → 400')
@@ -0,0 +1,54 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from community.models import Review
+
+User = get_user_model()
+
+URL = '/api/community/review/list/'
+
+
+class ReviewListQueryCountTest(TestCase):
+    """리뷰 목록 N+1 제거 테스트 — 페이지 크기와 무관한 쿼리 수"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.viewer = User.objects.create_user(username='viewer', password='testpass1234!')
+        authors = [User.objects.create_user(username=f'author{i}', password='testpass1234!') for i in range(5)]
+        cls.reviews = [
+            Review.objects.create(user=authors[i % 5], title=f'글 {i}', movie_title=f'영화 {i}', rank=i % 10 + 1, content='본문')
+            for i in range(50)
+        ]
+        for review in cls.reviews[::2]:
+            review.like_users.add(cls.viewer, authors[0])
+        Review.objects.filter(pk__in=[review.pk for review in cls.reviews[::2]]).update(like_count=2)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    # ========== 1. 비로그인: count + 페이지 조회 2회 ==========
+    def test_anonymous_query_count_is_fixed(self):
+        for page_size in (5, 50):
+            with self.assertNumQueries(2):
+                response = self.client.get(URL, {'page_size': page_size})
+            self.assertEqual(len(response.data['results']), page_size)
+        print('✅ [PASS] 비로그인 목록 → page_size 5/50 모두 쿼리 2회')
+
+    # ========== 2. 로그인: + 좋아요 id 조회 1회 ==========
+    def test_authenticated_query_count_is_fixed(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.viewer).access_token}')
+        self.client.get(URL)  # 인증 유저 캐시 적재
+        for page_size in (5, 50):
+            with self.assertNumQueries(3):
+                response = self.client.get(URL, {'page_size': page_size, 'order': 'asc'})
+            self.assertEqual(len(response.data['results']), page_size)
+
+        first, second = response.data['results'][:2]
+        self.assertEqual((first['like_users_count'], first['is_liked']), (2, True))
+        self.assertEqual((second['like_users_count'], second['is_liked']), (0, False))
+        self.assertEqual(first['user']['username'], 'author0')
+        print('✅ [PASS] 로그인 목록 → page_size 5/50 모두 쿼리 3회 + 좋아요 값 일치')
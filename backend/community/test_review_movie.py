@@ -0,0 +1,69 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from community.models import Review
+from movies.models import Movie
+from movies.titles import normalize_title, resolve_movie_id
+
+User = get_user_model()
+
+
+class ReviewMovieLinkTest(TestCase):
+    """커뮤니티 리뷰 movie_title → movie FK 연결 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='writer', password='testpass1234!')
+        cls.endgame = Movie.objects.create(movie_id='299534', title='어벤져스: 엔드게임')
+        cls.inception = Movie.objects.create(movie_id='27205', title='Inception', review_count=5)
+        Movie.objects.create(movie_id='99999', title='INCEPTION')  # 같은 제목 → 리뷰 많은 영화 우선
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+    # ========== 1. 제목 정규화 + 인덱스 조회 ==========
+    def test_resolver(self):
+        self.assertEqual(normalize_title(' 어벤져스 : 엔드-게임 '), '어벤져스엔드게임')
+        self.assertEqual(resolve_movie_id('어벤져스 엔드게임'), self.endgame.pk)
+        self.assertEqual(resolve_movie_id('inception'), self.inception.pk)
+        self.assertIsNone(resolve_movie_id('없는 영화'))
+        print('✅ [PASS] 정규화 제목 → 영화 해석')
+
+    # ========== 2. 작성/수정 시 연결 + 영화별 목록 ==========
+    def test_create_and_update_link_movie(self):
+        response = self.client.post('/api/community/review/create/', {
+            'title': '최고', 'movie_title': '어벤져스 엔드게임', 'rank': 10, 'content': '본문',
+        }, format='json')
+        review = Review.objects.get(pk=response.data['post']['id'])
+        self.assertEqual(review.movie_id, self.endgame.pk)
+
+        self.client.patch(f'/api/community/review/{review.id}/update/', {'movie_title': 'Inception'}, format='json')
+        review.refresh_from_db()
+        self.assertEqual(review.movie_id, self.inception.pk)
+
+        listed = self.client.get('/api/community/review/list/', {'movie': '27205'}).data
+        self.assertEqual([row['id'] for row in listed['results']], [review.id])
+        print('✅ [PASS] 리뷰 작성/수정 → movie 연결 + 영화별 목록')
+
+    # ========== 3. 일괄 연결 명령 ==========
+    def test_backfill_command(self):
+        reviews = [
+            Review.objects.create(user=self.user, title=f'글 {i}', movie_title=title, rank=7, content='본문')
+            for i, title in enumerate(['어벤져스:엔드게임', 'inception', '모르는 영화', 'Inception'])
+        ]
+        out = StringIO()
+        call_command('backfill_review_movies', '--batch-size', '2', stdout=out)
+        self.assertIn('4건 확인, 3건 갱신', out.getvalue())
+        self.assertEqual(
+            [Review.objects.get(pk=review.pk).movie_id for review in reviews],
+            [self.endgame.pk, self.inception.pk, None, self.inception.pk],
+        )
+        print('✅ [PASS] backfill_review_movies → 청크 단위 일괄 연결')
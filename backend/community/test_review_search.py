@@ -0,0 +1,81 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+
+from community.models import Review
+from community.search import FTS_TABLE, install_search_index
+
+User = get_user_model()
+
+URL = '/api/community/review/list/'
+
+
+class ReviewSearchTest(TestCase):
+    """커뮤니티 리뷰 검색 백엔드 테스트 (SQLite FTS5)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='writer', password='testpass1234!')
+        cls.inception = Review.objects.create(user=cls.user, title='꿈속의 꿈', movie_title='인셉션', rank=10, content='팽이가 멈출까')
+        cls.interstellar = Review.objects.create(user=cls.user, title='인셉션 감독 신작', movie_title='인터스텔라', rank=9, content='우주 이야기')
+        cls.tenet = Review.objects.create(user=cls.user, title='시간 역행', movie_title='테넷', rank=7, content='인셉션보다 어렵다')
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def ids(self, params):
+        return [row['id'] for row in self.client.get(URL, params).data['results']]
+
+    # ========== 1. 세 컬럼 검색 + 관련도순 (영화 제목 > 글 제목 > 본문) ==========
+    def test_ranked_search_over_three_columns(self):
+        self.assertEqual(self.ids({'search': '인셉션'}), [self.inception.id, self.interstellar.id, self.tenet.id])
+        self.assertEqual(self.ids({'search': '인터'}), [self.interstellar.id])  # 접두어 검색
+        self.assertEqual(self.ids({'search': '"인셉션" OR'}), [])  # FTS 문법은 일반 단어로 처리
+
+        # 관련도순도 커서로 이어서 조회
+        first = self.client.get(URL, {'search': '인셉션', 'page_size': 2}).data
+        rest = self.client.get(URL, {'search': '인셉션', 'page_size': 2, 'cursor': first['next_cursor']}).data
+        self.assertEqual([row['id'] for row in first['results'] + rest['results']],
+                         [self.inception.id, self.interstellar.id, self.tenet.id])
+        print('✅ [PASS] movie_title/title/content FTS 검색 + 관련도순')
+
+    # ========== 2. rating 필터 / 정렬과 조합 ==========
+    def test_composes_with_filter_and_sort(self):
+        self.assertEqual(self.ids({'search': '인셉션', 'rating': 7}), [self.tenet.id])
+        self.assertEqual(
+            self.ids({'search': '인셉션', 'type': 'rating', 'order': 'asc'}),
+            [self.tenet.id, self.interstellar.id, self.inception.id],
+        )
+        print('✅ [PASS] 검색 + rating 필터 + 정렬 조합')
+
+    # ========== 3. 작성/수정/삭제 → 인덱스 동기화 ==========
+    def test_index_follows_writes(self):
+        review = Review.objects.create(user=self.user, title='새 글', movie_title='오펜하이머', rank=8, content='원자폭탄')
+        self.assertEqual(self.ids({'search': '오펜하이머'}), [review.id])
+
+        review.movie_title = '바비'
+        review.save()
+        self.assertEqual(self.ids({'search': '오펜하이머'}), [])
+        self.assertEqual(self.ids({'search': '바비'}), [review.id])
+
+        Review.objects.filter(pk=review.pk).delete()
+        self.assertEqual(self.ids({'search': '바비'}), [])
+        print('✅ [PASS] 작성/수정/삭제 → FTS 인덱스 동기화')
+
+    # ========== 4. 트리거가 사라진 경우 재설치 + rebuild ==========
+    def test_reinstall_rebuilds_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TRIGGER {FTS_TABLE}_ai')
+        review = Review.objects.create(user=self.user, title='누락', movie_title='듄', rank=8, content='모래')
+        self.assertEqual(self.ids({'search': '듄'}), [])
+
+        install_search_index(connection)
+        self.assertEqual(self.ids({'search': '듄'}), [review.id])
+        print('✅ [PASS] 트리거 재설치 → 역색인 rebuild')
+
+    # ========== 5. basic 백엔드 (인덱스 없는 대체 경로) ==========
+    @override_settings(REVIEW_SEARCH_BACKEND='basic')
+    def test_basic_backend(self):
+        self.assertEqual(sorted(self.ids({'search': '셉'})), [self.inception.id, self.interstellar.id, self.tenet.id])
+        print('✅ [PASS] basic 백엔드 → icontains 검색')
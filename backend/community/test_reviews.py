@@ -306,11 +306,11 @@ class ReviewAPITest(TestCase):
                 content=f'댓글 {i}'
             )
         
-        response = self.client.get(f'/api/community/review/{self.review1.id}/comment/list/?page=1')
+        response = self.client.get(f'/api/community/review/{self.review1.id}/comment/list/')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data['count'], 17)  # setUp 2개 + 추가 15개 = 17개
         self.assertEqual(len(response.data['results']), 10)  # 페이지당 10개
-        self.assertIsNotNone(response.data['next'])
+        self.assertIsNotNone(response.data['next_cursor'])
         print('✅ [PASS] 댓글 목록 조회 (페이징) → 200')
 
     # ========== 21. 없는 리뷰 댓글 조회 → 404 ==========
@@ -3,105 +3,175 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
+from django.db import transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from movies.titles import resolve_movie_id
+from urllib.parse import urlencode
 
+from .caching import get_review_detail, invalidate_review_details, set_review_detail
+from .hot import lock_review
+from .likes import toggle_review_like
 from .models import Review, ReviewComment
+from .pagination import (
+    COMMENT_PAGE_SIZE, MAX_REVIEW_PAGE_SIZE, REVIEW_PAGE_SIZE,
+    count_reviews, decode_cursor, get_comment_page, get_keyset_page, get_review_comment_page,
+)
+from .search import search_reviews
 from .serializers import ReviewListSerializer, ReviewDetailSerializer, CommunityReviewCreateSerializer, CommunityReviewUpdateSerializer, ReviewCommentSerializer, ReviewCommentUpdateSerializer
 
 
-# ========== 페이지네이션 설정 ==========
-class ReviewPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 50
+def liked_review_ids(request, reviews):
+    """현재 유저가 좋아요 누른 리뷰 id 집합 (페이지 단위 1회 조회, 비로그인이면 빈 집합)"""
+    user = getattr(request, 'user', None)
+    if not (user and user.is_authenticated) or not reviews:
+        return set()
+    return set(
+        Review.like_users.through.objects
+        .filter(user_id=user.id, review_id__in=[review.id for review in reviews])
+        .values_list('review_id', flat=True)
+    )
 
 
 # ========== 리뷰 목록 조회 ==========
 class ReviewListView(APIView):
     """
     GET /api/review/list/
-    리뷰 목록 조회 (공개 API, 페이징 + 검색 + 필터 + 정렬)
+    리뷰 목록 조회 (공개 API, 키셋 페이징 + 검색 + 필터 + 정렬)
     """
     permission_classes = [AllowAny]
 
     @extend_schema(
         summary="리뷰 목록 조회",
-        description="영화 리뷰 목록을 조회합니다. 검색, 필터, 정렬, 페이징을 지원합니다.",
+        description="영화 리뷰 목록을 조회합니다. 검색, 필터, 정렬, 키셋(커서) 페이징을 지원합니다.",
         parameters=[
-            OpenApiParameter(name='page', description='페이지 번호', required=False, type=int),
-            OpenApiParameter(name='search', description='영화 제목 검색', required=False, type=str),
+            OpenApiParameter(name='cursor', description='다음 페이지 커서 (응답의 next_cursor)', required=False, type=str),
+            OpenApiParameter(name='page_size', description='페이지 크기 (기본값 10, 최대 50)', required=False, type=int),
+            OpenApiParameter(name='include_count', description='첫 페이지 전체 개수 포함 여부 (기본 true)', required=False, type=bool),
+            OpenApiParameter(name='search', description='영화 제목/글 제목/본문 검색 (기본 관련도순)', required=False, type=str),
+            OpenApiParameter(name='movie', description='영화 TMDB ID 필터 (제목으로 연결된 리뷰)', required=False, type=str),
             OpenApiParameter(name='rating', description='평점 필터 (1~10)', required=False, type=int),
-            OpenApiParameter(name='type', description='정렬 기준 (rating, title, movie_title, created_at)', required=False, type=str),
+            OpenApiParameter(name='type', description='정렬 기준 (rating, title, movie_title, likes, hot, created_at, relevance=검색 시)', required=False, type=str),
             OpenApiParameter(name='order', description='정렬 방향 (asc, desc)', required=False, type=str),
         ],
         responses=ReviewListSerializer(many=True)
     )
     def get(self, request):
-        queryset = Review.objects.all()
+        # 작성자는 JOIN, 좋아요 수는 like_count 컬럼 → 페이지 크기와 무관하게 쿼리 수 고정
+        queryset = Review.objects.select_related('user')
+        filtered = False
 
-        # ---- search: 영화 제목 검색 ----
-        search = request.query_params.get('search')
+        # ---- search: 영화 제목/글 제목/본문 인덱스 검색 (search_rank annotate) ----
+        search = (request.query_params.get('search') or '').strip()
         if search:
-            queryset = queryset.filter(movie_title__icontains=search)
+            queryset = search_reviews(queryset, search)
+            filtered = True
+
+        # ---- movie: 영화(TMDB ID)별 리뷰 (movie FK 인덱스) ----
+        movie = request.query_params.get('movie')
+        if movie:
+            queryset = queryset.filter(movie__movie_id=movie)
+            filtered = True
 
         # ---- rating: 평점 필터 ----
         rating = request.query_params.get('rating')
         if rating:
             try:
                 queryset = queryset.filter(rank=int(rating))
+                filtered = True
             except ValueError:
                 pass
 
-        # ---- type + order: 정렬 ----
-        sort_type = request.query_params.get('type', 'created_at')
-        order = request.query_params.get('order', 'desc')
+        # ---- type + order: 정렬 (검색 중 type 미지정 시 관련도순) ----
+        sort_type = request.query_params.get('type', 'relevance' if search else 'created_at')
+        descending = request.query_params.get('order', 'desc') != 'asc'
 
-        # 허용된 정렬 필드만 사용
+        # 허용된 정렬 필드만 사용 (각 필드는 (field, id) 복합 인덱스 보유)
         allowed_sort = {
             'rating': 'rank',
             'title': 'title',
             'movie_title': 'movie_title',
+            'likes': 'like_count',
+            'hot': 'hot_score',
             'created_at': 'created_at',
         }
-        sort_field = allowed_sort.get(sort_type, 'created_at')
-
-        # 오름차순/내림차순
-        if order == 'asc':
-            queryset = queryset.order_by(sort_field)
-        else:
-            queryset = queryset.order_by(f'-{sort_field}')
-
-        # ---- 페이징 ----
-        paginator = ReviewPagination()
-        page = paginator.paginate_queryset(queryset, request)
+        if search:
+            allowed_sort['relevance'] = 'search_rank'
+        if sort_type not in allowed_sort:
+            sort_type = 'created_at'
+        sort_field = allowed_sort[sort_type]
+
+        # ---- 키셋 페이징 (sort_field, id) ----
+        try:
+            page_size = min(max(int(request.query_params.get('page_size', REVIEW_PAGE_SIZE)), 1), MAX_REVIEW_PAGE_SIZE)
+        except ValueError:
+            page_size = REVIEW_PAGE_SIZE
+
+        cursor = request.query_params.get('cursor')
+        position = None
+        if cursor:
+            position = decode_cursor(cursor, sort_type, descending, sort_field)
+            if position is None:
+                return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+
+        reviews, next_cursor = get_keyset_page(queryset, sort_type, sort_field, descending, position, page_size)
+
+        # ---- 전체 개수: 첫 페이지에서만 (필터 없으면 추정치) ----
+        count, count_estimated = None, False
+        if position is None and request.query_params.get('include_count', 'true').lower() != 'false':
+            count, count_estimated = count_reviews(queryset, filtered)
+
+        # context에 request + 좋아요 누른 리뷰 id 전달 (is_liked 필드용)
+        context = {'request': request, 'liked_review_ids': liked_review_ids(request, reviews)}
+        serializer = ReviewListSerializer(reviews, many=True, context=context)
+        return Response({
+            "count": count,
+            "count_estimated": count_estimated,
+            "next_cursor": next_cursor,
+            "results": serializer.data,
+        })
 
-        if page is not None:
-            # context에 request 전달 (is_liked 필드용)
-            serializer = ReviewListSerializer(page, many=True, context={'request': request})
-            return paginator.get_paginated_response(serializer.data)
 
-        serializer = ReviewListSerializer(queryset, many=True, context={'request': request})
-        return Response(serializer.data)
+# ========== 리뷰 상세 조회 ==========
+DETAIL_COMMENT_COUNT = 10
 
 
-# ========== 리뷰 상세 조회 ==========
 class ReviewDetailView(APIView):
     """
     GET /api/review/{review_id}/
-    리뷰 상세 조회 (공개 API, 댓글 포함)
+    리뷰 상세 조회 (공개 API, 첫 댓글 페이지 포함)
+    - 첫 DETAIL_COMMENT_COUNT개 댓글(오래된순) + 전체 댓글 수 + 나머지 댓글을 이어서 받을 comments_next
+    - is_liked를 제외한 응답은 리뷰별로 캐시 (리뷰/댓글/좋아요 변경 시 무효화)
     """
     permission_classes = [AllowAny]
 
     @extend_schema(
         summary="리뷰 상세 조회",
-        description="특정 리뷰의 상세 정보와 댓글 목록을 조회합니다.",
+        description="특정 리뷰의 상세 정보와 첫 댓글 페이지를 조회합니다. 나머지 댓글은 comments_next(댓글 목록 API)로 이어서 조회합니다.",
         responses=ReviewDetailSerializer
     )
     def get(self, request, review_id):
-        review = get_object_or_404(Review, id=review_id)
-        serializer = ReviewDetailSerializer(review, context={'request': request})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        payload = get_review_detail(review_id)
+        if payload is None:
+            payload = self.build_payload(review_id)
+            set_review_detail(review_id, payload)
+
+        data = dict(payload)
+        if request.user.is_authenticated:
+            data['is_liked'] = Review.like_users.through.objects.filter(review_id=review_id, user_id=request.user.id).exists()
+        return Response(data, status=status.HTTP_200_OK)
+
+    def build_payload(self, review_id):
+        """is_liked를 제외한 상세 응답 (캐시 대상)"""
+        review = get_object_or_404(Review.objects.select_related('user'), id=review_id)
+        comments, next_cursor = get_comment_page(review.id, page_size=DETAIL_COMMENT_COUNT)
+        data = ReviewDetailSerializer(review, context={'comments': comments}).data
+        data['comments_next'] = None
+        if next_cursor:
+            url = reverse('review-comment-list', kwargs={'review_id': review.id})
+            data['comments_next'] = f"{url}?{urlencode({'order': 'asc', 'cursor': next_cursor})}"
+        return data
 
 
 # ========== 리뷰 작성 ==========
@@ -123,8 +193,8 @@ class ReviewCreateView(APIView):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        # ---- 리뷰 저장 (user 자동 설정) ----
-        review = serializer.save(user=request.user)
+        # ---- 리뷰 저장 (user 자동 설정, movie_title → 영화 연결) ----
+        review = serializer.save(user=request.user, movie_id=resolve_movie_id(serializer.validated_data['movie_title']))
 
         # ---- 응답 데이터 생성 ----
         response_serializer = ReviewListSerializer(review, context={'request': request})
@@ -159,7 +229,12 @@ class ReviewUpdateView(APIView):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        updated_review = serializer.save()
+        # movie_title이 바뀌면 영화 연결도 다시 해석
+        extra = {}
+        if 'movie_title' in serializer.validated_data:
+            extra['movie_id'] = resolve_movie_id(serializer.validated_data['movie_title'])
+        updated_review = serializer.save(**extra)
+        invalidate_review_details([review.id])
 
         # ---- 응답 데이터 생성 ----
         response_serializer = ReviewListSerializer(updated_review, context={'request': request})
@@ -191,6 +266,7 @@ class ReviewDeleteView(APIView):
 
         title = review.title  # 삭제 전 제목 저장
         review.delete()
+        invalidate_review_details([review_id])
 
         return Response({
             "message": f'작성하신 게시글 "{title}"이(가) 성공적으로 삭제 되었습니다.'
@@ -212,18 +288,21 @@ class ReviewCommentCreateView(APIView):
         responses={200: ReviewCommentSerializer}  # or any specific response schema
     )
     def post(self, request, review_id):
-        review = get_object_or_404(Review, id=review_id)
-        
-        # request.data는 불변일 수 있으므로 copy() 사용
-        data = request.data.copy()
-        data['review'] = review.id
-        
-        serializer = ReviewCommentSerializer(data=data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        
-        comment = serializer.save(user=request.user, review=review)
-        
+        with transaction.atomic():
+            # 리뷰 행 잠금 → 댓글 저장 (comment_count/hot_score는 post_save 시그널이 같은 트랜잭션에서 갱신)
+            review = lock_review(review_id)
+
+            # request.data는 불변일 수 있으므로 copy() 사용
+            data = request.data.copy()
+            data['review'] = review.id
+
+            serializer = ReviewCommentSerializer(data=data)
+            if not serializer.is_valid():
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+            comment = serializer.save(user=request.user, review=review)
+        invalidate_review_details([review.id])
+
         return Response({
             "message": "댓글이 정상적으로 작성 됐습니다.",
             "comment": ReviewCommentSerializer(comment).data
@@ -234,43 +313,49 @@ class ReviewCommentCreateView(APIView):
 class ReviewCommentListView(APIView):
     """
     GET /api/review/{review_id}/comment/list/
-    댓글 목록 조회 (공개, 페이징 + 정렬)
+    댓글 목록 조회 (공개, 키셋 페이징 + 정렬)
+    - (review_id, created_at, id) 복합 인덱스 범위 조회, 리뷰 존재 확인 + 댓글 + 작성자를 쿼리 1회로
+    - 리뷰 상세의 comments_next(order=asc + cursor)로 이어서 조회
     """
     permission_classes = [AllowAny]
 
     @extend_schema(
         summary="댓글 목록 조회",
-        description="특정 리뷰의 댓글 목록을 조회합니다. (페이징, 정렬)",
+        description="특정 리뷰의 댓글 목록을 조회합니다. (키셋 페이징, 정렬)",
         parameters=[
-            OpenApiParameter(name='page', description='페이지 번호', required=False, type=int),
+            OpenApiParameter(name='cursor', description='다음 페이지 커서 (리뷰 상세 comments_next / 응답 next_cursor)', required=False, type=str),
+            OpenApiParameter(name='page_size', description='페이지 크기 (기본값 10, 최대 50)', required=False, type=int),
             OpenApiParameter(name='order', description='정렬 (asc: 오래된순, desc: 최신순)', required=False, type=str),
         ],
         responses=ReviewCommentSerializer(many=True)
     )
     def get(self, request, review_id):
-        # 리뷰 존재 여부 확인 (없으면 404)
-        review = get_object_or_404(Review, id=review_id)
-        
-        # 해당 리뷰의 댓글만 필터링
-        queryset = ReviewComment.objects.filter(review=review)
-
-        # ---- 정렬 ----
-        order = request.query_params.get('order', 'desc')  # 기본값: 최신순
-        if order == 'asc':
-            queryset = queryset.order_by('created_at')
-        else:
-            queryset = queryset.order_by('-created_at')
-
-        # ---- 페이징 ----
-        paginator = ReviewPagination()
-        page = paginator.paginate_queryset(queryset, request)
-
-        if page is not None:
-            serializer = ReviewCommentSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-
-        serializer = ReviewCommentSerializer(queryset, many=True)
-        return Response(serializer.data)
+        # ---- 정렬 (기본값: 최신순) ----
+        descending = request.query_params.get('order', 'desc') != 'asc'
+
+        try:
+            page_size = min(max(int(request.query_params.get('page_size', COMMENT_PAGE_SIZE)), 1), MAX_REVIEW_PAGE_SIZE)
+        except ValueError:
+            page_size = COMMENT_PAGE_SIZE
+
+        cursor = request.query_params.get('cursor')
+        position = None
+        if cursor:
+            position = decode_cursor(cursor, 'comments', descending, 'created_at')
+            if position is None:
+                return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # ---- 리뷰 존재 확인 + 댓글 페이지 (쿼리 1회, 리뷰가 없으면 404) ----
+        page = get_review_comment_page(review_id, descending, position, page_size)
+        if page is None:
+            raise Http404
+
+        count, comments, next_cursor = page
+        return Response({
+            "count": count,
+            "next_cursor": next_cursor,
+            "results": ReviewCommentSerializer(comments, many=True).data,
+        })
 
 
 # ========== 댓글 수정 (PUT) ==========
@@ -304,6 +389,7 @@ class ReviewCommentUpdateView(APIView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         updated_comment = serializer.save()
+        invalidate_review_details([review_id])
 
         # ---- 응답 데이터 생성 (수정된 댓글 정보 반환) ----
         return Response({
@@ -337,7 +423,11 @@ class ReviewCommentDeleteView(APIView):
         if comment.user != request.user:
             return Response({"error": "본인의 댓글만 삭제할 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        comment.delete()
+        with transaction.atomic():
+            # 잠근 뒤 실제로 지운 행만 post_delete 시그널로 감소 (같은 댓글 동시 삭제 시 두 번째 요청은 0건)
+            lock_review(review_id)
+            ReviewComment.objects.filter(pk=comment.pk).delete()
+        invalidate_review_details([review_id])
 
         return Response({
             "message": "댓글이 성공적으로 삭제되었습니다"
@@ -367,22 +457,13 @@ class ReviewLikeView(APIView):
         }
     )
     def post(self, request, review_id):
-        review = get_object_or_404(Review, id=review_id)
-        user = request.user
-
-        if review.like_users.filter(id=user.id).exists():
-            # 좋아요 취소
-            review.like_users.remove(user)
-            is_liked = False
-            message = "좋아요가 취소되었습니다."
-        else:
-            # 좋아요 등록
-            review.like_users.add(user)
-            is_liked = True
-            message = "좋아요가 등록되었습니다."
-        
+        # 행 잠금 + through INSERT/DELETE + like_count 증감을 한 트랜잭션에서 처리
+        is_liked, like_count = toggle_review_like(review_id, request.user.id)
+        invalidate_review_details([review_id])
+        message = "좋아요가 등록되었습니다." if is_liked else "좋아요가 취소되었습니다."
+
         return Response({
             "is_liked": is_liked,
-            "like_users_count": review.like_users.count(),
+            "like_users_count": like_count,
             "message": message
         }, status=status.HTTP_200_OK)
@@ -0,0 +1,42 @@
+"""
+앱 공용 DB 헬퍼 (PostgreSQL 전용 기능은 다른 DB에서 건너뜀)
+
+- estimated_row_count: pg_class.reltuples 통계로 COUNT(*) 없이 전체 행 수 추정 (목록 페이지네이션)
+- trigram_index_sql: icontains(UPPER(컬럼) LIKE UPPER('%검색어%'))가 타는 pg_trgm GIN 인덱스 DDL
+"""
+from django.db import connection
+
+
+def estimated_row_count(model):
+    """테이블 행 수 추정치 (PostgreSQL 통계) → 통계가 없거나 다른 DB면 None"""
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [model._meta.db_table])
+        row = cursor.fetchone()
+    if not row or row[0] < 0:
+        return None
+    return row[0]
+
+
+def trigram_index_name(table, field):
+    return f'{table}_{field}_trgm'
+
+
+def trigram_index_sql(indexes):
+    """{테이블: (컬럼, ...)} → pg_trgm 확장 + UPPER(컬럼) gin_trgm_ops 인덱스 생성 SQL 목록 (여러 번 실행해도 안전)"""
+    statements = ['CREATE EXTENSION IF NOT EXISTS pg_trgm']
+    for table, fields in indexes.items():
+        for field in fields:
+            statements.append(
+                f'CREATE INDEX IF NOT EXISTS {trigram_index_name(table, field)} '
+                f'ON {table} USING gin (UPPER({field}) gin_trgm_ops)'
+            )
+    return statements
+
+
+def drop_trigram_index_sql(indexes):
+    return [
+        f'DROP INDEX IF EXISTS {trigram_index_name(table, field)}'
+        for table, fields in indexes.items() for field in fields
+    ]
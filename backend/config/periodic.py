@@ -0,0 +1,28 @@
+"""
+주기 작업 관리 명령 공용 반복 실행 (--interval)
+
+- interval이 0이면 1회 실행 후 종료 (cron) — 예외는 그대로 올려 실패를 알림
+- 반복 실행 시 매 회차 앞뒤로 close_old_connections() → DB 재시작/CONN_MAX_AGE 초과로 끊긴 연결을 재사용하지 않음
+- 한 회차가 실패해도 로그만 남기고 다음 주기에 다시 실행 (프로세스 종료는 compose restart 정책이 처리)
+"""
+import logging
+import time
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+def run_periodically(task, interval):
+    if not interval:
+        task()
+        return
+    while True:
+        close_old_connections()
+        try:
+            task()
+        except Exception:
+            logger.exception("주기 작업 실패 — %s초 뒤 다시 실행", interval)
+        finally:
+            close_old_connections()
+        time.sleep(interval)
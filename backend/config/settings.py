@@ -99,6 +99,53 @@ DATABASES = {
     'default': env.db(default=f'sqlite:///{BASE_DIR / "db.sqlite3"}')
 }
 
+# 커뮤니티 리뷰 검색 백엔드 (community.search)
+# - 'auto'    : DB 종류로 선택 (PostgreSQL → pg_trgm GIN, SQLite → FTS5)
+# - 'postgres' / 'sqlite' / 'basic'(인덱스 없는 icontains)
+REVIEW_SEARCH_BACKEND = env('REVIEW_SEARCH_BACKEND', default='auto')
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# 운영: CACHE_URL=rediscache://redis:6379/1 (django-redis)
+
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://')
+}
+
+# Redis (쇼츠 플레이리스트, 시청 기록 큐)
+REDIS_URL = env('REDIS_URL', default='redis://redis:6379/0')
+
+# 시청 기록 수집 방식
+# - 'redis': Redis Stream에 적재 후 process_watch_history 워커가 배치 반영
+# - 'sync' : 큐 없이 요청 안에서 즉시 반영 (테스트/단일 노드)
+WATCH_HISTORY_QUEUE = env('WATCH_HISTORY_QUEUE', default='redis')
+
+# 유저별 시청 기록 보관 한도 — 초과분은 trim_watch_history 주기 작업이 정리 (조회는 항상 최신 N개만)
+WATCH_HISTORY_LIMIT = env.int('WATCH_HISTORY_LIMIT', default=500)
+
+# 보관 한도 밖으로 밀려난 시청 기록의 콜드 아카이브 (월별 gzip NDJSON, append-only)
+# - 오프라인 추천 학습은 accounts.history_archive.iter_archived_histories()로 핫 테이블 없이 스트리밍
+# - 비워 두면 아카이브 없이 삭제만
+WATCH_HISTORY_ARCHIVE_DIR = env('WATCH_HISTORY_ARCHIVE_DIR', default=str(BASE_DIR / 'archive' / 'watch_history'))
+
+# 같은 (유저, 영화) 시청 이벤트를 한 기록으로 합치는 구간 (초, 0이면 합치지 않음)
+# - 반복 재생(loop=1) 트레일러가 보관 한도를 채우지 않도록 마지막 시청 후 이 시간 안의 이벤트는 기존 행에 watch_time 누적
+WATCH_HISTORY_MERGE_WINDOW = env.int('WATCH_HISTORY_MERGE_WINDOW', default=600)
+
+# 시청 이벤트 최대 전달 횟수 — 반영에 계속 실패해 이 횟수만큼 재전달된 이벤트는 dead letter Stream으로 이동
+WATCH_EVENT_MAX_DELIVERIES = env.int('WATCH_EVENT_MAX_DELIVERIES', default=5)
+
+
+# 소셜 로그인 provider 호출 (accounts.social)
+# - 프로세스당 커넥션 풀을 재사용하고 (연결, 응답) 타임아웃을 짧게 잡아 provider 지연이 워커 풀을 묶지 않도록 함
+# - USERINFO_URL은 부하 테스트 시 로컬 스텁(manage.py social_provider_stub)으로 교체
+SOCIAL_PROVIDER_TIMEOUT = (env.float('SOCIAL_CONNECT_TIMEOUT', default=1.0), env.float('SOCIAL_READ_TIMEOUT', default=3.0))
+SOCIAL_PROVIDER_POOL_SIZE = env.int('SOCIAL_PROVIDER_POOL_SIZE', default=20)
+SOCIAL_USERINFO_CACHE_TIMEOUT = env.int('SOCIAL_USERINFO_CACHE_TIMEOUT', default=300)  # provider 토큰 수명(카카오 6시간, 구글 1시간)보다 짧게
+KAKAO_USERINFO_URL = env('KAKAO_USERINFO_URL', default='https://kapi.kakao.com/v2/user/me')
+GOOGLE_USERINFO_URL = env('GOOGLE_USERINFO_URL', default='https://www.googleapis.com/oauth2/v3/userinfo')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -147,7 +194,8 @@ CSRF_TRUSTED_ORIGINS = env.list('CORS_ALLOWED_ORIGINS', default=[])
 # REST Framework Settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # simplejwt JWTAuthentication + 유저 조회 캐시 (accounts.authentication)
+        'accounts.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'EXCEPTION_HANDLER': 'config.utils.custom_exception_handler',
@@ -169,4 +217,7 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': False,
     'AUTH_HEADER_TYPES': ('Bearer',),
     'UPDATE_LAST_LOGIN': True, # 이 줄을 추가하여 로그인 시 last_login 기록
-}
\ No newline at end of file
+}
+
+# JWT 인증 유저 캐시 유지 시간 (초) — 유저 변경 시에는 유저 버전으로 즉시 무효화
+AUTH_USER_CACHE_TIMEOUT = env.int('AUTH_USER_CACHE_TIMEOUT', default=600)
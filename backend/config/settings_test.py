@@ -15,3 +15,16 @@ DATABASES = {
         'NAME': ':memory:',
     }
 }
+
+# 테스트용 로컬 메모리 캐시 (Redis 연결 불필요)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# 시청 기록은 큐 없이 즉시 반영
+WATCH_HISTORY_QUEUE = 'sync'
+
+# 시청 기록 아카이브는 테스트에서 필요할 때만 임시 디렉터리로 지정
+WATCH_HISTORY_ARCHIVE_DIR = ''
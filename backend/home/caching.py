@@ -0,0 +1,66 @@
+"""
+홈/상세 API 캐시 키 및 무효화 헬퍼
+
+- 카테고리 버전: refresh_home 재구성, 관리자 영화 수정 시 증가 → 버전이 포함된 모든 키가 한 번에 무효화
+- 영화 상세 캐시: is_liked를 제외한 비개인화 응답을 영화(TMDB ID)별로 저장
+- 리뷰 첫 페이지 캐시: 리뷰 목록 API 첫 페이지 = 상세 응답의 ReviewItem (공유)
+"""
+import time
+
+from django.core.cache import cache
+
+CATEGORY_VERSION_KEY = 'home:category_version'
+MOVIE_DETAIL_TIMEOUT = 60 * 60  # 1시간
+REVIEW_PAGE_TIMEOUT = 60 * 60
+
+
+# ========== 카테고리 버전 ==========
+def get_category_version():
+    """현재 카테고리 버전 (캐시에서 사라졌다면 이전 값과 겹치지 않도록 현재 시각으로 초기화)"""
+    version = cache.get(CATEGORY_VERSION_KEY)
+    if version is None:
+        cache.add(CATEGORY_VERSION_KEY, int(time.time()), None)
+        version = cache.get(CATEGORY_VERSION_KEY)
+    return version
+
+
+def bump_category_version():
+    """카테고리 버전을 올려 버전 기반 캐시 전체를 무효화"""
+    try:
+        return cache.incr(CATEGORY_VERSION_KEY)
+    except ValueError:
+        get_category_version()
+        return cache.incr(CATEGORY_VERSION_KEY)
+
+
+# ========== 영화 상세 캐시 ==========
+def movie_detail_key(tmdb_id):
+    return f"home:movie_detail:{get_category_version()}:{tmdb_id}"
+
+
+def get_movie_detail(tmdb_id):
+    """캐시된 상세 payload ({"pk": ..., "data": {...}}) 또는 None"""
+    return cache.get(movie_detail_key(tmdb_id))
+
+
+def set_movie_detail(tmdb_id, payload):
+    cache.set(movie_detail_key(tmdb_id), payload, MOVIE_DETAIL_TIMEOUT)
+
+
+def invalidate_movie_detail(tmdb_id):
+    """리뷰 작성/수정/삭제, 관리자 리뷰 수정 시 해당 영화 상세 + 리뷰 첫 페이지 캐시 삭제"""
+    cache.delete_many([movie_detail_key(tmdb_id), review_first_page_key(tmdb_id)])
+
+
+# ========== 리뷰 첫 페이지 캐시 ==========
+def review_first_page_key(tmdb_id):
+    return f"home:movie_reviews:first:{tmdb_id}"
+
+
+def get_review_first_page(tmdb_id):
+    """캐시된 첫 페이지 ({"next_cursor": ..., "results": [...]}) 또는 None"""
+    return cache.get(review_first_page_key(tmdb_id))
+
+
+def set_review_first_page(tmdb_id, page):
+    cache.set(review_first_page_key(tmdb_id), page, REVIEW_PAGE_TIMEOUT)
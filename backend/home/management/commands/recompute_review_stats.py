@@ -0,0 +1,44 @@
+"""
+영화별 리뷰 통계(review_count, review_sum, review_average)를 MovieReview 기준으로 재계산하는 Management Command
+
+리뷰 작성/수정/삭제 API는 통계를 증분 갱신하므로, 회원 탈퇴 등으로 리뷰가 일괄 삭제된 경우
+이 명령으로 정합성을 맞춥니다.
+
+사용법:
+    uv run python manage.py recompute_review_stats
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+
+from movies.models import Movie
+from home.models import MovieReview
+
+
+class Command(BaseCommand):
+    help = 'MovieReview를 한 번의 그룹 쿼리로 집계하여 영화별 리뷰 통계를 재계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='bulk_update 배치 크기')
+
+    def handle(self, *args, **options):
+        # ---- 영화별 리뷰 수/합계 (단일 GROUP BY 쿼리) ----
+        stats = {
+            row['movie_id']: (row['count'], row['total'])
+            for row in MovieReview.objects.order_by().values('movie_id').annotate(
+                count=Count('id'), total=Sum('rating')
+            )
+        }
+
+        # ---- 값이 달라진 영화만 모아서 bulk_update ----
+        fields = ['review_count', 'review_sum', 'review_average']
+        changed = []
+        movies = Movie.objects.only('id', 'vote_average', *fields).order_by('id')
+        for movie in movies.iterator(chunk_size=options['batch_size']):
+            count, total = stats.get(movie.id, (0, 0))
+            average = round(total / count, 1) if count else movie.vote_average
+            if (movie.review_count, movie.review_sum, movie.review_average) != (count, total, average):
+                movie.review_count, movie.review_sum, movie.review_average = count, total, average
+                changed.append(movie)
+
+        Movie.objects.bulk_update(changed, fields, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'리뷰 통계 재계산 완료! ({len(changed)}개 영화 보정)'))
@@ -1,55 +1,120 @@
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 from movies.models import Movie, Genre
-from home.models import HomeCategory
-from django.db.models import Count, Q, Avg
-import itertools
+from home.models import HomeCategory, HomeRefreshLog
+from home.caching import bump_category_version
+from django.db.models import Count, Q, Min
 import random
 
+# 카테고리당 노출 영화 수
+CATEGORY_SIZE = 15
+
+# 감성 형용사 사전
+ADJ_MAP = {
+    '액션': ['심장 뛰는', '손에 땀을 쥐는', '강렬한 카타르시스,', '박진감 넘치는'],
+    '모험': ['장대한 스케일의', '미지의 세계로,', '가슴 벅찬', '모험심을 깨우는'],
+    '판타지': ['현실을 잊게 만드는', '신비로운', '상상 그 이상의', '몽환적인'],
+    '애니메이션': ['꿈과 희망의', '온 가족이 즐기는', '마음이 따뜻해지는', '창의적인'],
+    '드라마': ['깊은 울림을 주는', '현실보다 더 현실 같은', '인생의 의미를 담은', '감동적인'],
+    '공포': ['잠 못 이루는 밤,', '소름 끼치는', '숨 막히는 공포,', '등골 서늘한'],
+    '코미디': ['웃음 폭탄!', '유쾌한 에너지,', '기분 좋아지는', '배꼽 잡는'],
+    '역사': ['역사의 한 페이지,', '몰랐던 사실,', '시대를 넘나드는', '거대한 서사의'],
+    '서부': ['황야의 무법자,', '거친 매력의', '정의를 향한', '클래식한'],
+    '스릴러': ['긴박함이 가득한', '예측 불가능한', '치밀한 두뇌 싸움,', '심장 쫄깃한'],
+    '범죄': ['뒷골목의 진실,', '리얼한 범죄 세계,', '범죄와의 전쟁,', '치열한'],
+    '다큐멘 터리': ['기록의 힘,', '진실을 찾아서,', '세상을 보는 눈,', '생생한 현장의'],
+    'SF': ['우주 너머의 세계,', '미래를 예견하는', '최첨단 상상력,', '경이로운 스케일의'],
+    '미스터리': ['풀리지 않는 수수께끼,', '기묘한 이야기,', '진실은 어디에,', '안개 속의'],
+    '음악': ['귀가 즐거운', '음악에 취하다,', '선율의 감동,', '리듬을 타고'],
+    '로맨스': ['두근거리는 설렘,', '달달한', '애틋한 감성의', '사랑이 꽃피는'],
+    '가족': ['가족과 함께하는', '따스한 미소,', '행복한 시간,', '세대 공감'],
+    '전쟁': ['전쟁의 소용돌이,', '치열한 사투,', '평화를 바라는', '웅장한'],
+    'TV 영화': ['놓치면 아쉬운', '검증된 재미,', '안방극장의 명작,', '다시 보고 싶은']
+}
+
+# 스페셜 카테고리 (항상 상위 3개): (타이틀, genre_key, 정렬, 필터)
+SPECIAL_CATEGORIES = [
+    ("지금 뜨는 인기작 TOP 15", "special_trending", "-view_count", Q()),
+    ("영화관에서 바로 온 현재 상영작", "special_theaters", "-view_count", Q(is_in_theaters=True)),
+    ("실패 없는 최고 평점 명작", "special_top_rated", "-vote_average", Q(vote_average__gte=7.5)),
+]
+
+
+def genre_title(genre_name):
+    """단일 장르 카테고리 타이틀"""
+    adjs = ADJ_MAP.get(genre_name, ["인기"])
+    return f"{random.choice(adjs)} {genre_name} 영화"
+
+
+def combo_title(genre_names):
+    """혼합 장르 카테고리 타이틀 (넷플릭스 스타일)"""
+    primary_genre = genre_names[0]
+    adjs = ADJ_MAP.get(primary_genre, ["흥미진진한"])
+
+    if len(genre_names) == 2:
+        return f"{random.choice(adjs)} {genre_names[0]} & {genre_names[1]}"
+    elif len(genre_names) == 3:
+        return f"{primary_genre}와 함께 즐기는 {genre_names[1]}·{genre_names[2]}"
+    # 4개 이상일 경우 "외.." 대신 핵심 위주 요약
+    return f"다채로운 매력, {primary_genre} 중심의 {genre_names[1]} 컬렉션"
+
+
+def combo_queryset(genre_names):
+    """장르 조합이 정확히 genre_names와 일치하는 영화 쿼리셋"""
+    size = len(genre_names)
+    return Movie.objects.annotate(
+        genre_total=Count('genres', distinct=True),
+        genre_matched=Count('genres', filter=Q(genres__name__in=genre_names), distinct=True),
+    ).filter(genre_total=size, genre_matched=size)
+
+
 class Command(BaseCommand):
     help = '넷플릭스 스타일의 감성적인 타이틀로 471개 카테고리를 갱신합니다.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='마지막 실행 이후 변경된 영화(Movie.updated_at)에 영향받는 카테고리만 갱신합니다.',
+        )
+
     def handle(self, *args, **options):
+        # 실행 시작 시각을 워터마크로 사용 (실행 중 변경된 영화는 다음 실행에서 다시 확인)
+        started_at = timezone.now()
+        movie_count = Movie.objects.count()
+        last_log = HomeRefreshLog.objects.first()
+
+        if options['incremental'] and last_log and not self.has_deleted_movies(last_log, movie_count):
+            mode = 'incremental'
+            updated = self.refresh_incremental(last_log.watermark)
+        else:
+            if options['incremental']:
+                self.stdout.write("이전 실행 기록이 없거나 삭제된 영화가 있어 전체 갱신으로 전환합니다.")
+            mode = 'full'
+            updated = self.refresh_full()
+
+        HomeRefreshLog.objects.create(
+            mode=mode, watermark=started_at, movie_count=movie_count, updated_categories=updated
+        )
+        if updated:
+            # 추천 리스트가 바뀌었을 수 있으므로 카테고리 버전 기반 캐시(영화 상세 등) 무효화
+            bump_category_version()
+        count = HomeCategory.objects.count()
+        self.stdout.write(self.style.SUCCESS(f'[{mode}] {updated}개 갱신, 총 {count}개의 감성 카테고리 갱신 완료!'))
+
+    # ========== 전체 갱신 ==========
+    def refresh_full(self):
         HomeCategory.objects.all().delete()
         self.stdout.write("기존 카테고리를 초기화했습니다.")
 
-        # 감성 형용사 사전
-        adj_map = {
-            '액션': ['심장 뛰는', '손에 땀을 쥐는', '강렬한 카타르시스,', '박진감 넘치는'],
-            '모험': ['장대한 스케일의', '미지의 세계로,', '가슴 벅찬', '모험심을 깨우는'],
-            '판타지': ['현실을 잊게 만드는', '신비로운', '상상 그 이상의', '몽환적인'],
-            '애니메이션': ['꿈과 희망의', '온 가족이 즐기는', '마음이 따뜻해지는', '창의적인'],
-            '드라마': ['깊은 울림을 주는', '현실보다 더 현실 같은', '인생의 의미를 담은', '감동적인'],
-            '공포': ['잠 못 이루는 밤,', '소름 끼치는', '숨 막히는 공포,', '등골 서늘한'],
-            '코미디': ['웃음 폭탄!', '유쾌한 에너지,', '기분 좋아지는', '배꼽 잡는'],
-            '역사': ['역사의 한 페이지,', '몰랐던 사실,', '시대를 넘나드는', '거대한 서사의'],
-            '서부': ['황야의 무법자,', '거친 매력의', '정의를 향한', '클래식한'],
-            '스릴러': ['긴박함이 가득한', '예측 불가능한', '치밀한 두뇌 싸움,', '심장 쫄깃한'],
-            '범죄': ['뒷골목의 진실,', '리얼한 범죄 세계,', '범죄와의 전쟁,', '치열한'],
-            '다큐멘 터리': ['기록의 힘,', '진실을 찾아서,', '세상을 보는 눈,', '생생한 현장의'],
-            'SF': ['우주 너머의 세계,', '미래를 예견하는', '최첨단 상상력,', '경이로운 스케일의'],
-            '미스터리': ['풀리지 않는 수수께끼,', '기묘한 이야기,', '진실은 어디에,', '안개 속의'],
-            '음악': ['귀가 즐거운', '음악에 취하다,', '선율의 감동,', '리듬을 타고'],
-            '로맨스': ['두근거리는 설렘,', '달달한', '애틋한 감성의', '사랑이 꽃피는'],
-            '가족': ['가족과 함께하는', '따스한 미소,', '행복한 시간,', '세대 공감'],
-            '전쟁': ['전쟁의 소용돌이,', '치열한 사투,', '평화를 바라는', '웅장한'],
-            'TV 영화': ['놓치면 아쉬운', '검증된 재미,', '안방극장의 명작,', '다시 보고 싶은']
-        }
-
         # 1. 스페셜 카테고리 (항상 상위 3개)
-        specials = [
-            ("지금 뜨는 인기작 TOP 15", "special_trending", "-view_count", Q()),
-            ("영화관에서 바로 온 현재 상영작", "special_theaters", "-view_count", Q(is_in_theaters=True)),
-            ("실패 없는 최고 평점 명작", "special_top_rated", "-vote_average", Q(vote_average__gte=7.5)),
-        ]
-        for title, key, order, filters in specials:
+        for title, key, order, filters in SPECIAL_CATEGORIES:
             self.create_category(title, key, order, filters, 'special')
 
         # 2. 단일 장르 (19개)
         genres = Genre.objects.all()
         for genre in genres:
-            adjs = adj_map.get(genre.name, ["인기"])
-            title = f"{random.choice(adjs)} {genre.name} 영화"
-            self.create_category(title, genre.name, "-view_count", Q(genres=genre))
+            self.create_category(genre_title(genre.name), genre.name, "-view_count", Q(genres=genre))
 
         # 3. 혼합 장르 (분석 및 감성 타이틀 생성)
         all_movies = Movie.objects.prefetch_related('genres').all()
@@ -64,36 +129,103 @@ class Command(BaseCommand):
                 genre_combinations[combo_key].append(movie.id)
 
         for combo_key, movie_ids in genre_combinations.items():
-            genre_names = combo_key.split('|')
-            
-            # 넷플릭스 스타일 타이틀 조합 로직
-            primary_genre = genre_names[0]
-            adjs = adj_map.get(primary_genre, ["흥미진진한"])
-            
-            if len(genre_names) == 2:
-                title = f"{random.choice(adjs)} {genre_names[0]} & {genre_names[1]}"
-            elif len(genre_names) == 3:
-                title = f"{primary_genre}와 함께 즐기는 {genre_names[1]}·{genre_names[2]}"
-            else:
-                # 4개 이상일 경우 "외.." 대신 핵심 위주 요약
-                title = f"다채로운 매력, {primary_genre} 중심의 {genre_names[1]} 컬렉션"
-
             cat = HomeCategory.objects.create(
-                title=title,
+                title=combo_title(combo_key.split('|')),
                 genre_key=combo_key,
                 category_type='general'
             )
-            cat.movies.set(Movie.objects.filter(id__in=movie_ids).order_by('-vote_average')[:15])
-            cat.save()
+            cat.movies.set(Movie.objects.filter(id__in=movie_ids).order_by('-vote_average', 'id')[:CATEGORY_SIZE])
 
-        count = HomeCategory.objects.count()
-        self.stdout.write(self.style.SUCCESS(f'총 {count}개의 감성 카테고리 갱신 완료!'))
+        return HomeCategory.objects.count()
 
     def create_category(self, title, key, order, filters, cat_type='general'):
         movies = Movie.objects.filter(filters).distinct()
         if movies.exists():
             cat = HomeCategory.objects.create(title=title, genre_key=key, category_type=cat_type)
-            cat.movies.set(movies.order_by(order)[:15])
-            cat.save()
+            cat.movies.set(movies.order_by(order, 'id')[:CATEGORY_SIZE])
             return cat
         return None
+
+    # ========== 증분 갱신 ==========
+    def has_deleted_movies(self, last_log, movie_count):
+        """지난 실행 이후 삭제된 영화가 있으면 True (updated_at으로는 삭제를 추적할 수 없음)"""
+        created = Movie.objects.filter(created_at__gte=last_log.watermark).count()
+        return movie_count < last_log.movie_count + created
+
+    def refresh_incremental(self, watermark):
+        """
+        watermark 이후 변경된 영화가 상위 15개 구성을 바꿀 수 있는 카테고리만 다시 채웁니다.
+        조회수/좋아요 카운터 갱신도 updated_at을 함께 기록하므로 같은 워터마크로 감지됩니다.
+        (장르 변경은 movies.signals가 updated_at을 기록)
+        """
+        changed_movies = list(Movie.objects.filter(updated_at__gte=watermark).prefetch_related('genres'))
+        changed_ids = {movie.id for movie in changed_movies}
+        if not changed_ids:
+            return 0
+
+        updated = 0
+
+        # 1. 스페셜 카테고리
+        for title, key, order, filters in SPECIAL_CATEGORIES:
+            queryset = Movie.objects.filter(filters).distinct()
+            updated += self.sync_category(title, key, order, queryset, changed_ids, 'special')
+
+        # 2. 단일 장르
+        for genre in Genre.objects.all():
+            queryset = Movie.objects.filter(genres=genre).distinct()
+            updated += self.sync_category(genre_title(genre.name), genre.name, "-view_count", queryset, changed_ids)
+
+        # 3. 혼합 장르: 변경된 영화가 속해 있던 조합 + 현재 조합
+        combo_keys = set(
+            HomeCategory.objects.filter(
+                category_type='general', genre_key__contains='|', movies__id__in=changed_ids
+            ).values_list('genre_key', flat=True)
+        )
+        for movie in changed_movies:
+            movie_genres = sorted([g.name for g in movie.genres.all()])
+            if len(movie_genres) >= 2:
+                combo_keys.add("|".join(movie_genres))
+
+        for combo_key in combo_keys:
+            genre_names = combo_key.split('|')
+            updated += self.sync_category(
+                combo_title(genre_names), combo_key, "-vote_average", combo_queryset(genre_names), changed_ids
+            )
+
+        return updated
+
+    def sync_category(self, title, key, order, queryset, changed_ids, cat_type='general'):
+        """카테고리 구성이 바뀔 수 있을 때만 상위 15개를 다시 계산합니다. 갱신되면 1, 아니면 0 반환"""
+        cat = HomeCategory.objects.filter(genre_key=key, category_type=cat_type).first()
+        member_ids = set(cat.movies.values_list('id', flat=True)) if cat else set()
+
+        if not self.could_change(member_ids, queryset, order, changed_ids):
+            return 0
+
+        top_ids = list(queryset.order_by(order, 'id').values_list('id', flat=True)[:CATEGORY_SIZE])
+        if set(top_ids) == member_ids:
+            return 0
+        if not top_ids:
+            cat.delete()
+            return 1
+
+        if cat is None:
+            cat = HomeCategory.objects.create(title=title, genre_key=key, category_type=cat_type)
+        cat.movies.set(top_ids)
+        return 1
+
+    def could_change(self, member_ids, queryset, order, changed_ids):
+        """
+        변경된 영화가 기존 멤버이거나, 조건을 만족하면서 현재 최하위 점수 이상이면
+        상위 15개 구성이 바뀔 수 있습니다. (모든 정렬은 내림차순)
+        """
+        if member_ids & changed_ids:
+            return True
+
+        candidates = queryset.filter(id__in=changed_ids)
+        if len(member_ids) < CATEGORY_SIZE:
+            return candidates.exists()
+
+        field = order.lstrip('-')
+        floor = Movie.objects.filter(id__in=member_ids).aggregate(floor=Min(field))['floor']
+        return candidates.filter(**{f'{field}__gte': floor}).exists()
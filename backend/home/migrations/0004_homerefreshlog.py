@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0003_moviereview'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HomeRefreshLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mode', models.CharField(choices=[('full', 'Full'), ('incremental', 'Incremental')], default='full', max_length=20)),
+                ('watermark', models.DateTimeField(help_text='이번 실행 시작 시각 (이후 변경된 영화만 다음 증분 갱신 대상)')),
+                ('movie_count', models.PositiveIntegerField(default=0, help_text='실행 시점의 전체 영화 수 (삭제 감지용)')),
+                ('updated_categories', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-id'],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0004_homerefreshlog'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='homecategory',
+            name='genre_key',
+            field=models.CharField(blank=True, db_index=True, help_text="장르 이름들을 '|'로 연결 (예: 액션|코미디)", max_length=255, null=True),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.2 on 2026-10-19 10:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0005_alter_homecategory_genre_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='moviereview',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.2 on 2026-10-19 11:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0006_moviereview_updated_at'),
+        ('movies', '0005_alter_movie_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='moviereview',
+            options={'ordering': ['-created_at', '-id']},
+        ),
+        migrations.AddIndex(
+            model_name='moviereview',
+            index=models.Index(fields=['movie', 'created_at', 'id'], name='home_review_movie_created_idx'),
+        ),
+    ]
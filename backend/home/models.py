@@ -4,7 +4,7 @@ from django.conf import settings
 
 class HomeCategory(models.Model):
     title = models.CharField(max_length=200)
-    genre_key = models.CharField(max_length=255, blank=True, null=True, help_text="장르 이름들을 '|'로 연결 (예: 액션|코미디)")
+    genre_key = models.CharField(max_length=255, blank=True, null=True, db_index=True, help_text="장르 이름들을 '|'로 연결 (예: 액션|코미디)")
     category_type = models.CharField(max_length=20, default='general', help_text="special 또는 general")
     movies = models.ManyToManyField(Movie, related_name='home_categories')
     base_score = models.FloatField(default=0)
@@ -19,9 +19,33 @@ class MovieReview(models.Model):
     rating = models.IntegerField(default=5)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ['-created_at']
+        ordering = ['-created_at', '-id']
+        indexes = [
+            # 영화별 최신순 키셋 페이지네이션 (created_at, id)
+            models.Index(fields=['movie', 'created_at', 'id'], name='home_review_movie_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.author.username} - {self.movie.title} ({self.rating})"
+
+
+class HomeRefreshLog(models.Model):
+    """refresh_home 실행 기록 — 다음 증분 갱신의 워터마크(Movie.updated_at 기준)로 사용"""
+    MODE_CHOICES = [
+        ('full', 'Full'),
+        ('incremental', 'Incremental'),
+    ]
+    mode = models.CharField(max_length=20, choices=MODE_CHOICES, default='full')
+    watermark = models.DateTimeField(help_text="이번 실행 시작 시각 (이후 변경된 영화만 다음 증분 갱신 대상)")
+    movie_count = models.PositiveIntegerField(default=0, help_text="실행 시점의 전체 영화 수 (삭제 감지용)")
+    updated_categories = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-id']
+
+    def __str__(self):
+        return f"[{self.mode}] {self.watermark}"
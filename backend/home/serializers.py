@@ -41,6 +41,11 @@ class ReviewSerializer(serializers.ModelSerializer):
         full_name = f"{obj.author.first_name}{obj.author.last_name}".strip()
         return full_name if full_name else obj.author.username
 
+class ReviewPageResponseSerializer(serializers.Serializer):
+    """리뷰 목록 키셋 페이지 응답"""
+    next_cursor = serializers.CharField(allow_null=True, help_text="다음 페이지 조회용 커서 (마지막 페이지면 null)")
+    results = ReviewSerializer(many=True)
+
 class ReviewCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = MovieReview
@@ -0,0 +1,128 @@
+from django.core.cache import cache
+from django.db.models import F
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from movies.models import Genre, Movie
+from home.caching import bump_category_version, movie_detail_key
+
+User = get_user_model()
+
+
+class ConditionalGetTest(TestCase):
+    """홈/상세 API 조건부 GET (ETag / 304) 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='viewer', password='testpass1234!')
+        genre = Genre.objects.create(id=28, name='액션')
+        cls.movie = Movie.objects.create(movie_id='27205', title='인셉션', vote_average=8.4, review_average=8.4)
+        cls.movie.genres.set([genre])
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def login(self):
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def revalidate(self, url, etag, params=None):
+        return self.client.get(url, params or {}, HTTP_IF_NONE_MATCH=etag)
+
+    # ========== 1. 메인: 304는 쿼리 없음 ==========
+    def test_main_not_modified(self):
+        first = self.client.get('/api/home/main/')
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('ETag', first)
+
+        with self.assertNumQueries(0):
+            response = self.revalidate('/api/home/main/', first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        print('✅ [PASS] 메인 304 → 쿼리 0회')
+
+    # ========== 2. 메인: 카테고리 갱신(관리자 영화 수정) 시 200 ==========
+    def test_main_modified_after_movie_change(self):
+        first = self.client.get('/api/home/main/')
+        admin = User.objects.create_user(username='admin', password='testpass1234!', is_staff=True)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(admin).access_token}')
+        self.client.patch(f'/api/admin/movies/{self.movie.id}/', {'title': '인셉션 (리마스터)'}, format='json')
+        self.client.credentials()
+
+        response = self.revalidate('/api/home/main/', first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        print('✅ [PASS] 영화 변경 → 메인 200')
+
+    # ========== 2-1. 메인: 조회수 증가(updated_at 갱신)만으로는 304 유지 ==========
+    def test_main_not_modified_after_view_count_bump(self):
+        first = self.client.get('/api/home/main/')
+        self.movie.view_count = F('view_count') + 1
+        self.movie.save(update_fields=['view_count', 'updated_at'])  # 쇼츠 조회수 API와 같은 저장
+
+        response = self.revalidate('/api/home/main/', first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        print('✅ [PASS] 조회수 증가 → 메인 304 유지')
+
+    # ========== 3. 서브: 304는 쿼리 없음 ==========
+    def test_sub_not_modified_without_queries(self):
+        first = self.client.get('/api/home/sub/')
+        self.assertEqual(first.status_code, 200)
+
+        with self.assertNumQueries(0):
+            response = self.revalidate('/api/home/sub/', first['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        bump_category_version()
+        response = self.revalidate('/api/home/sub/', first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        print('✅ [PASS] 서브 304 → 쿼리 0회, 카테고리 갱신 → 200')
+
+    # ========== 4. 서브: 유저 취향이 다르면 다른 ETag ==========
+    def test_sub_etag_varies_by_user_prefs(self):
+        anonymous = self.client.get('/api/home/sub/')['ETag']
+        self.login()
+        before = self.client.get('/api/home/sub/')['ETag']
+        self.user.pref_action = 100
+        self.user.save(update_fields=['pref_action'])  # 저장 시 유저 버전 증가 → 인증 유저 캐시 무효화
+        after = self.client.get('/api/home/sub/')['ETag']
+
+        self.assertEqual(len({anonymous, before, after}), 3)
+        print('✅ [PASS] 유저/취향별 서브 ETag 분리')
+
+    # ========== 5. 상세: 캐시 적중 시 304는 쿼리 없음 ==========
+    def test_detail_not_modified(self):
+        params = {'id': '27205'}
+        first = self.client.get('/api/home/detail/', params)
+        self.assertEqual(first.status_code, 200)
+
+        with self.assertNumQueries(0):
+            response = self.revalidate('/api/home/detail/', first['ETag'], params)
+        self.assertEqual(response.status_code, 304)
+
+        # 상세 캐시가 비어 있어도 영화 1건 조회만으로 같은 ETag 계산
+        cache.delete(movie_detail_key('27205'))
+        with self.assertNumQueries(1):
+            response = self.revalidate('/api/home/detail/', first['ETag'], params)
+        self.assertEqual(response.status_code, 304)
+        print('✅ [PASS] 상세 304 → 캐시 적중 0회 / 미적중 1회 쿼리')
+
+    # ========== 6. 상세: 리뷰 작성 후 200 ==========
+    def test_detail_modified_after_review(self):
+        params = {'id': '27205'}
+        self.login()
+        first = self.client.get('/api/home/detail/', params)
+        self.client.post('/api/home/review/', {'movie_id': '27205', 'rating': 7, 'content': '좋아요'}, format='json')
+
+        response = self.revalidate('/api/home/detail/', first['ETag'], params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['ReviewItem']), 1)
+        print('✅ [PASS] 리뷰 작성 → 상세 200')
+
+    # ========== 7. 상세: 없는 영화는 404 ==========
+    def test_detail_missing_movie(self):
+        response = self.client.get('/api/home/detail/', {'id': 'nope'}, HTTP_IF_NONE_MATCH='"abc"')
+        self.assertEqual(response.status_code, 404)
+        print('✅ [PASS] 없는 영화 → 404')
@@ -0,0 +1,76 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from movies.models import Genre, Movie
+from home.caching import bump_category_version
+
+User = get_user_model()
+
+
+class MovieDetailCacheTest(TestCase):
+    """영화 상세 캐시 및 무효화 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='reviewer', password='testpass1234!')
+        genre = Genre.objects.create(id=28, name='액션')
+        cls.movie = Movie.objects.create(movie_id='27205', title='인셉션', vote_average=8.4, review_average=8.4)
+        cls.movie.genres.set([genre])
+        cls.url = '/api/home/detail/'
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def auth(self):
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    # ========== 1. 캐시 적중 시 쿼리 없음 ==========
+    def test_cached_detail_skips_queries(self):
+        first = self.client.get(self.url, {'id': '27205'})
+        self.assertEqual(first.status_code, 200)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, {'id': '27205'})
+        self.assertEqual(second.data, first.data)
+        print('✅ [PASS] 캐시 적중 → 쿼리 0회')
+
+    # ========== 2. is_liked는 캐시되지 않음 ==========
+    def test_is_liked_is_not_cached(self):
+        self.client.get(self.url, {'id': '27205'})
+        self.auth()
+        self.client.post(f'/api/movies/shorts/{self.movie.movie_id}/like/')
+
+        response = self.client.get(self.url, {'id': '27205'})
+        self.assertTrue(response.data['is_liked'])
+        print('✅ [PASS] is_liked 요청마다 계산')
+
+    # ========== 3. 리뷰 작성/삭제 시 무효화 ==========
+    def test_review_write_invalidates_detail(self):
+        self.client.get(self.url, {'id': '27205'})
+        self.auth()
+        created = self.client.post('/api/home/review/', {'movie_id': '27205', 'rating': 2, 'content': '별로'}, format='json')
+        self.assertEqual(created.status_code, 201)
+
+        response = self.client.get(self.url, {'id': '27205'})
+        self.assertEqual(response.data['rank'], '2.0')
+        self.assertEqual(len(response.data['ReviewItem']), 1)
+
+        self.client.delete(f"/api/home/review/{created.data['id']}/")
+        response = self.client.get(self.url, {'id': '27205'})
+        self.assertEqual(response.data['ReviewItem'], [])
+        print('✅ [PASS] 리뷰 작성/삭제 → 상세 캐시 무효화')
+
+    # ========== 4. 카테고리 버전 증가 시 무효화 ==========
+    def test_category_version_bump_invalidates_detail(self):
+        self.client.get(self.url, {'id': '27205'})
+        Movie.objects.filter(id=self.movie.id).update(title='인셉션 (리마스터)')
+        bump_category_version()
+
+        response = self.client.get(self.url, {'id': '27205'})
+        self.assertEqual(response.data['title'], '인셉션 (리마스터)')
+        print('✅ [PASS] 카테고리 버전 증가 → 상세 캐시 무효화')
@@ -0,0 +1,119 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from movies.models import Genre, Movie
+from home.models import HomeCategory, HomeRefreshLog
+
+
+class RefreshHomeIncrementalTest(TestCase):
+    """refresh_home 전체/증분 갱신 결과 비교 테스트"""
+
+    def setUp(self):
+        # ---- 장르 생성 ----
+        self.action = Genre.objects.create(id=28, name='액션')
+        self.comedy = Genre.objects.create(id=35, name='코미디')
+        self.sf = Genre.objects.create(id=878, name='SF')
+
+        # ---- 영화 20개 생성 (카테고리당 15개 제한을 넘도록) ----
+        self.movies = []
+        for i in range(1, 21):
+            movie = Movie.objects.create(
+                movie_id=str(20000 + i),
+                title=f'테스트 영화 {i}',
+                vote_average=5 + (i % 5) * 0.5,
+                view_count=i * 10,
+                is_in_theaters=(i % 4 == 0),
+            )
+            if i % 3 == 0:
+                movie.genres.set([self.action, self.sf])
+            elif i % 3 == 1:
+                movie.genres.set([self.action, self.comedy])
+            else:
+                movie.genres.set([self.comedy])
+            self.movies.append(movie)
+
+    def run_refresh(self, **options):
+        call_command('refresh_home', stdout=StringIO(), **options)
+        return HomeRefreshLog.objects.first()
+
+    def snapshot(self):
+        """(category_type, genre_key) → 소속 영화 ID 집합"""
+        return {
+            (cat.category_type, cat.genre_key): set(cat.movies.values_list('id', flat=True))
+            for cat in HomeCategory.objects.prefetch_related('movies')
+        }
+
+    # ========== 1. 이전 기록이 없으면 전체 갱신 ==========
+    def test_incremental_without_log_falls_back_to_full(self):
+        log = self.run_refresh(incremental=True)
+        self.assertEqual(log.mode, 'full')
+        self.assertGreater(HomeCategory.objects.count(), 0)
+        print('✅ [PASS] 이전 기록 없음 → 전체 갱신')
+
+    # ========== 2. 변경 없으면 갱신 0건 ==========
+    def test_incremental_without_changes_updates_nothing(self):
+        self.run_refresh()
+        before = self.snapshot()
+        log = self.run_refresh(incremental=True)
+        self.assertEqual(log.mode, 'incremental')
+        self.assertEqual(log.updated_categories, 0)
+        self.assertEqual(self.snapshot(), before)
+        print('✅ [PASS] 변경 없음 → 갱신 0건')
+
+    # ========== 3. 증분 갱신 결과 == 전체 갱신 결과 ==========
+    def test_incremental_matches_full_rebuild(self):
+        self.run_refresh()
+
+        # ---- 조회수 급상승 (트렌딩 진입) ----
+        low = self.movies[0]
+        low.view_count = 10000
+        low.save()
+
+        # ---- 장르 변경 (액션|코미디 → 액션|SF) ----
+        moved = self.movies[3]
+        moved.genres.set([self.action, self.sf])  # save() 없이 장르만 변경
+
+        # ---- 평점 변경 (최고 평점 명작 진입) ----
+        rated = self.movies[5]
+        rated.vote_average = 9.9
+        rated.save()
+
+        # ---- 새 영화 + 새 장르 조합 ----
+        new_movie = Movie.objects.create(movie_id='29999', title='새 영화', vote_average=8.0, view_count=5)
+        new_movie.genres.set([self.comedy, self.sf])
+
+        log = self.run_refresh(incremental=True)
+        self.assertEqual(log.mode, 'incremental')
+        self.assertGreater(log.updated_categories, 0)
+        incremental = self.snapshot()
+
+        self.run_refresh()
+        full = self.snapshot()
+
+        self.assertEqual(incremental, full)
+        print('✅ [PASS] 증분 갱신 결과 == 전체 갱신 결과')
+
+    # ========== 3-1. 장르만 변경 (save() 없음) → 증분 갱신이 감지 ==========
+    def test_incremental_detects_genre_only_change(self):
+        self.run_refresh()
+        moved = self.movies[3]
+        moved.genres.set([self.action, self.sf])
+        self.sf.movies.add(self.movies[4])  # 역방향 추가도 감지
+
+        log = self.run_refresh(incremental=True)
+        self.assertGreater(log.updated_categories, 0)
+        incremental = self.snapshot()
+        self.run_refresh()
+        self.assertEqual(incremental, self.snapshot())
+        self.assertTrue(any(moved.id in ids and self.movies[4].id in ids for ids in incremental.values()))
+        print('✅ [PASS] 장르만 변경 → 증분 갱신에 반영')
+
+    # ========== 4. 영화 삭제 시 전체 갱신으로 전환 ==========
+    def test_incremental_with_deleted_movie_falls_back_to_full(self):
+        self.run_refresh()
+        self.movies[-1].delete()
+        log = self.run_refresh(incremental=True)
+        self.assertEqual(log.mode, 'full')
+        print('✅ [PASS] 영화 삭제 → 전체 갱신')
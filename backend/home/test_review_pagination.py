@@ -0,0 +1,77 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from movies.models import Movie
+from home.models import MovieReview
+
+User = get_user_model()
+
+
+class MovieReviewPaginationTest(TestCase):
+    """영화 리뷰 목록 키셋 페이지네이션 + 첫 페이지 캐시 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='reviewer', password='testpass1234!')
+        cls.movie = Movie.objects.create(movie_id='27205', title='인셉션', vote_average=8.4)
+        # created_at이 같은 리뷰가 섞여도 id로 순서가 결정되어야 함
+        cls.reviews = [
+            MovieReview.objects.create(movie=cls.movie, author=cls.author, rating=i % 10 + 1, content=f'리뷰 {i}')
+            for i in range(25)
+        ]
+        cls.url = '/api/home/review/'
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    # ========== 1. 커서로 끝까지 순회 ==========
+    def test_walk_all_pages(self):
+        seen, cursor = [], None
+        while True:
+            params = {'id': '27205'}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 200)
+            seen.extend(item['id'] for item in response.data['results'])
+            cursor = response.data['next_cursor']
+            if cursor is None:
+                break
+
+        expected = list(MovieReview.objects.filter(movie=self.movie).order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+        print('✅ [PASS] 커서 순회 → 중복/누락 없음')
+
+    # ========== 2. 첫 페이지 캐시 (상세와 공유) ==========
+    def test_first_page_is_cached_and_shared_with_detail(self):
+        first = self.client.get(self.url, {'id': '27205'})
+        self.assertEqual(len(first.data['results']), 10)
+
+        with self.assertNumQueries(0):
+            again = self.client.get(self.url, {'id': '27205'})
+        self.assertEqual(again.data, first.data)
+
+        detail = self.client.get('/api/home/detail/', {'id': '27205'})
+        self.assertEqual(detail.data['ReviewItem'], first.data['results'])
+        print('✅ [PASS] 첫 페이지 캐시 + 상세 ReviewItem 공유')
+
+    # ========== 3. 리뷰 작성 시 첫 페이지 무효화 ==========
+    def test_review_create_invalidates_first_page(self):
+        self.client.get(self.url, {'id': '27205'})
+        writer = User.objects.create_user(username='writer', password='testpass1234!')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(writer).access_token}')
+        created = self.client.post(self.url, {'movie_id': '27205', 'rating': 8, 'content': '새 리뷰'}, format='json')
+
+        response = self.client.get(self.url, {'id': '27205'})
+        self.assertEqual(response.data['results'][0]['id'], created.data['id'])
+        print('✅ [PASS] 리뷰 작성 → 첫 페이지 캐시 무효화')
+
+    # ========== 4. 잘못된 커서 → 400 ==========
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'id': '27205', 'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+        print('✅ [PASS] 잘못된 커서 → 400')
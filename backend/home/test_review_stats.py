@@ -0,0 +1,95 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from movies.models import Movie
+from home.models import MovieReview
+
+User = get_user_model()
+
+
+class MovieReviewStatsTest(TestCase):
+    """영화 리뷰 통계(review_count / review_sum / review_average) 증분 갱신 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username='reviewer1', password='testpass1234!')
+        cls.user2 = User.objects.create_user(username='reviewer2', password='testpass1234!')
+        cls.movie = Movie.objects.create(movie_id='27205', title='인셉션', vote_average=8.4, review_average=8.4)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def login(self, user):
+        token = str(RefreshToken.for_user(user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def write_review(self, user, rating):
+        self.login(user)
+        response = self.client.post('/api/home/review/', {'movie_id': '27205', 'rating': rating, 'content': '리뷰'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response.data['id']
+
+    def assert_stats(self, count, total, average):
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.review_count, self.movie.review_sum), (count, total))
+        self.assertAlmostEqual(self.movie.review_average, average)
+
+    # ========== 1. 작성 → 수정 → 삭제 ==========
+    def test_stats_follow_review_writes(self):
+        first = self.write_review(self.user1, 9)
+        self.assert_stats(1, 9, 9.0)
+
+        self.write_review(self.user2, 4)
+        self.assert_stats(2, 13, 6.5)
+
+        self.login(self.user1)
+        self.client.put(f'/api/home/review/{first}/', {'rating': 6}, format='json')
+        self.assert_stats(2, 10, 5.0)
+
+        self.client.delete(f'/api/home/review/{first}/')
+        self.assert_stats(1, 4, 4.0)
+        print('✅ [PASS] 리뷰 작성/수정/삭제 → 통계 증분 갱신')
+
+    # ========== 2. 마지막 리뷰 삭제 → TMDB 평점 복귀 ==========
+    def test_last_review_delete_restores_vote_average(self):
+        review_id = self.write_review(self.user1, 3)
+        self.client.delete(f'/api/home/review/{review_id}/')
+        self.assert_stats(0, 0, 8.4)
+        print('✅ [PASS] 마지막 리뷰 삭제 → vote_average 복귀')
+
+    # ========== 3. recompute_review_stats 정합성 보정 ==========
+    def test_recompute_review_stats_reconciles(self):
+        MovieReview.objects.create(movie=self.movie, author=self.user1, rating=7, content='직접 생성')
+        MovieReview.objects.create(movie=self.movie, author=self.user2, rating=10, content='직접 생성')
+
+        call_command('recompute_review_stats', stdout=StringIO())
+        self.assert_stats(2, 17, 8.5)
+        print('✅ [PASS] recompute_review_stats → 통계 보정')
+
+    # ========== 4. 같은 리뷰 동시 삭제 → 통계는 한 번만 감소 ==========
+    def test_concurrent_delete_decrements_once(self):
+        self.write_review(self.user2, 4)
+        review_id = self.write_review(self.user1, 9)
+        stale = MovieReview.objects.get(pk=review_id)  # 두 요청이 각자 조회해 둔 같은 리뷰
+
+        self.login(self.user1)
+        with mock.patch('home.views.get_object_or_404', return_value=stale):
+            self.client.delete(f'/api/home/review/{review_id}/')
+            self.client.delete(f'/api/home/review/{review_id}/')
+        self.assert_stats(1, 4, 4.0)
+
+        admin = User.objects.create_user(username='admin', password='testpass1234!', is_staff=True)
+        review_id = self.write_review(self.user1, 8)
+        self.login(admin)
+        stale = MovieReview.objects.get(pk=review_id)
+        with mock.patch('management.views.AdminReviewViewSet.get_object', return_value=stale):
+            self.client.delete(f'/api/admin/reviews/{review_id}/')
+            self.client.delete(f'/api/admin/reviews/{review_id}/')
+        self.assert_stats(1, 4, 4.0)
+        print('✅ [PASS] 같은 리뷰 동시 삭제 → 통계 한 번만 감소')
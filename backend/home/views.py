@@ -1,12 +1,29 @@
 from rest_framework import views, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime
 from django.shortcuts import get_object_or_404
-from django.db.models import Avg, Case, When
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.db import transaction
+from django.db.models import Case, When, F, Q, FloatField, Max
+from django.db.models.functions import Cast, Round
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from movies.models import Movie
 from .models import HomeCategory, MovieReview
-from accounts.models import UserLikeList
+from .caching import (
+    get_movie_detail,
+    set_movie_detail,
+    invalidate_movie_detail,
+    get_category_version,
+    get_review_first_page,
+    set_review_first_page,
+)
+from accounts.models import UserLikeList, genre_key_score
 from .serializers import (
     HomeMovieSerializer, 
     MainResponseSerializer, 
@@ -15,22 +32,129 @@ from .serializers import (
     MovieMiniSerializer,
     ReviewSerializer,
     ReviewCreateSerializer,
-    ReviewCreateRequestSerializer
+    ReviewCreateRequestSerializer,
+    ReviewPageResponseSerializer
 )
 
-def update_movie_review_average(movie):
-    """영화의 평균 리뷰 점수를 갱신하는 헬퍼 함수"""
-    avg_rating = movie.reviews.aggregate(Avg('rating'))['rating__avg']
-    if avg_rating is not None:
-        movie.review_average = round(avg_rating, 1)
+def review_average_expression(count_delta, sum_delta):
+    """갱신 후 review_count/review_sum 기준 평균 (리뷰가 없으면 TMDB 평점)"""
+    new_count = F('review_count') + count_delta
+    new_sum = F('review_sum') + sum_delta
+    return Case(
+        When(review_count__lte=-count_delta, then=F('vote_average')),
+        default=Round(Cast(new_sum, FloatField()) / new_count, 1),
+        output_field=FloatField(),
+    )
+
+
+def update_movie_review_stats(movie, count_delta, sum_delta):
+    """
+    리뷰 작성/수정/삭제 시 영화의 리뷰 수·합계·평균을 단일 UPDATE로 증분 갱신하는 헬퍼 함수
+    (리뷰 저장과 같은 트랜잭션 안에서 호출)
+    """
+    Movie.objects.filter(pk=movie.pk).update(
+        review_count=F('review_count') + count_delta,
+        review_sum=F('review_sum') + sum_delta,
+        review_average=review_average_expression(count_delta, sum_delta),
+    )
+
+
+# ========== 리뷰 키셋 페이지네이션 (created_at, id) ==========
+REVIEW_PAGE_SIZE = 10
+
+
+def encode_review_cursor(review):
+    raw = json.dumps([review.created_at.isoformat(), review.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_review_cursor(cursor):
+    """커서 → (created_at, id), 잘못된 커서면 None"""
+    try:
+        created_at, review_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(review_id)
+    except (ValueError, TypeError, binascii.Error):
+        return None
+
+
+def get_review_page(movie_pk, position=None, page_size=REVIEW_PAGE_SIZE):
+    """최신순 리뷰 한 페이지 (position 이후부터) — OFFSET/COUNT 없이 인덱스 범위 조회"""
+    queryset = MovieReview.objects.filter(movie_id=movie_pk).select_related('author').order_by('-created_at', '-id')
+    if position:
+        created_at, review_id = position
+        queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=review_id))
+    reviews = list(queryset[:page_size + 1])
+    next_cursor = encode_review_cursor(reviews[page_size - 1]) if len(reviews) > page_size else None
+    return {"next_cursor": next_cursor, "results": ReviewSerializer(reviews[:page_size], many=True).data}
+
+
+def get_first_review_page(movie):
+    """리뷰 첫 페이지 (영화별 캐시) — 리뷰 목록 API와 상세 ReviewItem이 공유"""
+    page = get_review_first_page(movie.movie_id)
+    if page is None:
+        page = get_review_page(movie.id)
+        set_review_first_page(movie.movie_id, page)
+    return page
+
+
+# ========== 조건부 GET (ETag) ==========
+# 응답을 만들기 전에 콘텐츠 버전만으로 ETag를 계산하여, 변경이 없으면 직렬화 없이 304 반환
+
+def make_etag(*parts):
+    return hashlib.md5(":".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def main_etag(request):
+    """
+    메인 응답 버전 (카테고리 버전 + 유저) — 쿼리 없음
+    조회수/좋아요 카운터도 updated_at을 갱신하므로 Max(updated_at)을 쓰면 거의 매 요청 ETag가 바뀜
+    → refresh_home / 관리자 영화 수정 / 영화 적재 때만 오르는 카테고리 버전 사용 (그 사이 순위 변동은 다음 갱신에 반영)
+    """
+    return make_etag('main', get_category_version(), request.user.id, request.user.username)
+
+
+def sub_etag(request):
+    """서브 응답 버전 (카테고리 버전 + 유저 취향 점수) — 쿼리 없음"""
+    user = request.user
+    prefs = user.pref_vector if user.is_authenticated else ()
+    return make_etag('sub', get_category_version(), user.id, *prefs)
+
+
+def movie_detail_version(movie):
+    """상세 payload 버전 (last_review 어노테이션이 포함된 Movie 기준)"""
+    return make_etag(get_category_version(), movie.updated_at, movie.review_count, movie.review_sum, movie.last_review)
+
+
+def movie_is_liked(request, movie_pk):
+    """현재 유저의 좋아요 여부 — ETag 계산과 응답 생성에서 요청당 1회만 조회"""
+    if not request.user.is_authenticated:
+        return False
+    if not hasattr(request, '_movie_is_liked'):
+        request._movie_is_liked = UserLikeList.objects.filter(user=request.user, movie_id=movie_pk).exists()
+    return request._movie_is_liked
+
+
+def movie_detail_etag(request):
+    """상세 캐시 적중 시 저장된 버전을, 아니면 영화 1건 조회로 버전 계산"""
+    tmdb_id = request.query_params.get('id')
+    if not tmdb_id:
+        return None
+    cached = get_movie_detail(tmdb_id)
+    if cached:
+        movie_pk, version = cached["pk"], cached["version"]
     else:
-        movie.review_average = movie.vote_average
-    movie.save(update_fields=['review_average'])
+        movie = Movie.objects.annotate(last_review=Max('reviews__updated_at')).filter(movie_id=tmdb_id).first()
+        if movie is None:
+            return None
+        movie_pk, version = movie.id, movie_detail_version(movie)
+    return make_etag('detail', tmdb_id, version, request.user.id, movie_is_liked(request, movie_pk))
+
 
 class MainView(views.APIView):
     permission_classes = [AllowAny]
     serializer_class = MainResponseSerializer
     @extend_schema(responses={200: MainResponseSerializer})
+    @method_decorator(condition(etag_func=main_etag))
     def get(self, request):
         movies = Movie.objects.all().order_by('-vote_average', '-view_count')[:10]
         user_data = {"userid": request.user.id, "username": request.user.username} if request.user.is_authenticated else {}
@@ -40,25 +164,15 @@ class SubView(views.APIView):
     permission_classes = [AllowAny]
     serializer_class = SubResponseSerializer
     @extend_schema(responses={200: SubResponseSerializer})
+    @method_decorator(condition(etag_func=sub_etag))
     def get(self, request):
         user = request.user
         specials = HomeCategory.objects.filter(category_type='special').prefetch_related('movies')[:3]
         generals = HomeCategory.objects.filter(category_type='general').prefetch_related('movies')
-        genre_map = {
-            '액션': 'pref_action', '모험': 'pref_adventure', '애니메이션': 'pref_animation',
-            '코미디': 'pref_comedy', '범죄': 'pref_crime', '다큐멘 터리': 'pref_documentary',
-            '드라마': 'pref_drama', '가족': 'pref_family', '판타지': 'pref_fantasy',
-            '역사': 'pref_history', '공포': 'pref_horror', '음악': 'pref_music',
-            '미스터리': 'pref_mystery', '로맨스': 'pref_romance', 'SF': 'pref_science_fiction',
-            'TV 영화': 'pref_tv_movie', '스릴러': 'pref_thriller', '전쟁': 'pref_war', '서부': 'pref_western'
-        }
+        pref_vector = user.pref_vector if user.is_authenticated else None
         category_list = []
         for cat in generals:
-            user_score = 0
-            if user.is_authenticated and cat.genre_key:
-                genres = cat.genre_key.split('|')
-                scores = [getattr(user, genre_map.get(g, ''), 0) for g in genres if genre_map.get(g)]
-                user_score = sum(scores) / len(scores) if scores else 0
+            user_score = genre_key_score(pref_vector, cat.genre_key) if pref_vector else 0
             category_list.append({"obj": cat, "user_score": user_score})
         category_list.sort(key=lambda x: x['user_score'], reverse=True)
         final_sub = []
@@ -80,17 +194,25 @@ class MovieDetailView(views.APIView):
         parameters=[OpenApiParameter("id", type=str, description="영화의 고유 TMDB ID", required=True)],
         responses={200: MovieDetailResponseSerializer}
     )
+    @method_decorator(condition(etag_func=movie_detail_etag))
     def get(self, request):
         tmdb_id = request.query_params.get('id')
         if not tmdb_id:
             return Response({"error": "Movie ID required"}, status=status.HTTP_400_BAD_REQUEST)
-        
-        movie = get_object_or_404(Movie, movie_id=tmdb_id)
-        
-        is_liked = False
-        if request.user.is_authenticated:
-            is_liked = UserLikeList.objects.filter(user=request.user, movie=movie).exists()
 
+        # ---- 비개인화 payload는 영화별 캐시 사용 (is_liked만 요청마다 계산) ----
+        cached = get_movie_detail(tmdb_id)
+        if cached is None:
+            movie = get_object_or_404(Movie.objects.annotate(last_review=Max('reviews__updated_at')), movie_id=tmdb_id)
+            cached = {"pk": movie.id, "version": movie_detail_version(movie), "data": self.build_payload(movie)}
+            set_movie_detail(tmdb_id, cached)
+
+        response_data = dict(cached["data"])
+        response_data["is_liked"] = movie_is_liked(request, cached["pk"])
+        return Response(response_data, status=status.HTTP_200_OK)
+
+    def build_payload(self, movie):
+        """is_liked를 제외한 상세 응답 (캐시 대상)"""
         movie_genres = sorted([genre.name for genre in movie.genres.all()])
         exact_genre_key = "|".join(movie_genres)
         related_category = HomeCategory.objects.filter(genre_key=exact_genre_key).first()
@@ -103,10 +225,9 @@ class MovieDetailView(views.APIView):
         else:
             recommend_list = Movie.objects.filter(genres__in=movie.genres.all()).exclude(id=movie.id).distinct().order_by('-vote_average')[:10]
 
-        reviews = movie.reviews.all().select_related('author')[:10]
         year = str(movie.release_date.year) if movie.release_date else "미상"
-        
-        response_data = {
+
+        return {
             "trailer": movie.embed_url if movie.embed_url else movie.youtube_key,
             "title": movie.title,
             "rank": str(movie.review_average),
@@ -114,17 +235,16 @@ class MovieDetailView(views.APIView):
             "poster": movie.poster_path,
             "runtime": None,
             "ott_list": movie.ott_providers,
-            "is_liked": is_liked,
+            "is_liked": False,
             "MovieDetail": {
                 "overview": movie.overview,
                 "director": None,
                 "genres": movie_genres,
                 "year": int(year) if year.isdigit() else 0
             },
-            "ReviewItem": ReviewSerializer(reviews, many=True).data,
+            "ReviewItem": get_first_review_page(movie)["results"],
             "recommend_list": MovieMiniSerializer(recommend_list, many=True).data
         }
-        return Response(response_data, status=status.HTTP_200_OK)
 
 class MovieReviewListView(views.APIView):
     """
@@ -138,19 +258,41 @@ class MovieReviewListView(views.APIView):
         return [IsAuthenticated()]
 
     @extend_schema(
-        parameters=[OpenApiParameter("id", type=str, description="영화의 고유 TMDB ID", required=True)],
-        responses={200: ReviewSerializer(many=True)}
+        parameters=[
+            OpenApiParameter("id", type=str, description="영화의 고유 TMDB ID", required=True),
+            OpenApiParameter("cursor", type=str, description="다음 페이지 커서 (응답의 next_cursor)"),
+            OpenApiParameter("page_size", type=int, description="페이지 크기 (기본값 10, 최대 50)"),
+        ],
+        responses={200: ReviewPageResponseSerializer}
     )
     def get(self, request):
-        """특정 영화의 모든 리뷰 목록 조회"""
+        """특정 영화의 리뷰 목록 조회 (최신순, 키셋 페이지네이션)"""
         tmdb_id = request.query_params.get('id')
         if not tmdb_id:
             return Response({"error": "Movie ID required (?id=tt12345)"}, status=status.HTTP_400_BAD_REQUEST)
-        
+
+        try:
+            page_size = min(int(request.query_params.get('page_size', REVIEW_PAGE_SIZE)), 50)
+        except ValueError:
+            page_size = REVIEW_PAGE_SIZE
+
+        cursor = request.query_params.get('cursor')
+        position = None
+        if cursor:
+            position = decode_review_cursor(cursor)
+            if position is None:
+                return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # ---- 기본 크기의 첫 페이지는 캐시 (상세 ReviewItem과 공유) ----
+        if position is None and page_size == REVIEW_PAGE_SIZE:
+            page = get_review_first_page(tmdb_id)
+            if page is None:
+                movie = get_object_or_404(Movie, movie_id=tmdb_id)
+                page = get_first_review_page(movie)
+            return Response(page, status=status.HTTP_200_OK)
+
         movie = get_object_or_404(Movie, movie_id=tmdb_id)
-        reviews = movie.reviews.all().select_related('author').order_by('-created_at')
-        serializer = ReviewSerializer(reviews, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(get_review_page(movie.id, position, max(page_size, 1)), status=status.HTTP_200_OK)
 
     @extend_schema(request=ReviewCreateRequestSerializer, responses={201: ReviewSerializer})
     def post(self, request):
@@ -166,8 +308,10 @@ class MovieReviewListView(views.APIView):
             
         serializer = ReviewCreateSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save(author=request.user, movie=movie)
-            update_movie_review_average(movie)
+            with transaction.atomic():
+                review = serializer.save(author=request.user, movie=movie)
+                update_movie_review_stats(movie, 1, review.rating)
+            invalidate_movie_detail(movie.movie_id)
             return Response(ReviewSerializer(serializer.instance).data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -180,16 +324,23 @@ class MovieReviewDetailView(views.APIView):
 
     def put(self, request, review_id):
         review = get_object_or_404(MovieReview, id=review_id, author=request.user)
+        old_rating = review.rating
         serializer = ReviewCreateSerializer(review, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
-            update_movie_review_average(review.movie)
+            with transaction.atomic():
+                serializer.save()
+                update_movie_review_stats(review.movie, 0, review.rating - old_rating)
+            invalidate_movie_detail(review.movie.movie_id)
             return Response(ReviewSerializer(review).data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def delete(self, request, review_id):
         review = get_object_or_404(MovieReview, id=review_id, author=request.user)
         movie = review.movie
-        review.delete()
-        update_movie_review_average(movie)
+        with transaction.atomic():
+            # 동시 삭제 요청이 둘 다 통과해도 실제로 행을 지운 요청만 통계를 감소
+            deleted = MovieReview.objects.filter(pk=review.pk).delete()[0]
+            if deleted:
+                update_movie_review_stats(movie, -1, -review.rating)
+        invalidate_movie_detail(movie.movie_id)
         return Response({"message": "리뷰가 삭제되었습니다."}, status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,113 @@
+"""
+관리자 데이터 내보내기 (스트리밍)
+
+GET /api/admin/{accounts|movies|reviews}/export/?output=ndjson|csv&gzip=true
+- values_list().iterator(chunk_size) → PostgreSQL은 서버 사이드 커서로 chunk_size 행씩만 가져옴
+- 한 행씩 NDJSON/CSV 한 줄로 변환해 StreamingHttpResponse로 바로 전송 → 행 수와 무관하게 메모리 일정
+- gzip=true: zlib 스트림 압축으로 .gz 파일을 그대로 내려받음 (응답 전체를 모아 압축하지 않음)
+- 목록과 같은 search 조건 적용, id 순
+"""
+import csv
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+EXPORT_CHUNK_SIZE = 2000
+
+CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def export_columns(fields):
+    """export_fields 항목: '필드' 또는 ('컬럼명', '조회 경로') → (컬럼명 목록, 조회 경로 목록)"""
+    pairs = [(field, field) if isinstance(field, str) else field for field in fields]
+    return [label for label, _ in pairs], [lookup for _, lookup in pairs]
+
+
+def ndjson_lines(columns, rows):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(columns, row))) + '\n'
+
+
+class LineBuffer:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 버퍼"""
+
+    def write(self, value):
+        return value
+
+
+# 엑셀/시트가 수식으로 해석하는 시작 문자 (CSV formula injection)
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def csv_cell(value):
+    """사용자 입력 문자열이 수식 문자로 시작하면 ' 를 붙여 텍스트로 표시 (숫자/날짜 등은 그대로)"""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def csv_lines(columns, rows):
+    writer = csv.writer(LineBuffer())
+    yield '\ufeff' + writer.writerow(columns)  # BOM: 엑셀에서 한글이 깨지지 않도록
+    for row in rows:
+        yield writer.writerow([csv_cell(value) for value in row])
+
+
+def gzip_chunks(chunks):
+    """바이트 스트림 → gzip 스트림 (압축기가 내놓은 만큼만 전송)"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_stream(queryset, fields, output='ndjson', gzip=False, chunk_size=EXPORT_CHUNK_SIZE):
+    columns, lookups = export_columns(fields)
+    rows = queryset.values_list(*lookups).iterator(chunk_size=chunk_size)
+    lines = (ndjson_lines if output == 'ndjson' else csv_lines)(columns, rows)
+    chunks = (line.encode() for line in lines)
+    return gzip_chunks(chunks) if gzip else chunks
+
+
+class AdminExportMixin:
+    """관리자 ViewSet에 export 액션 추가 — export_fields / export_name 지정"""
+    export_fields = ()
+    export_name = None
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('output', OpenApiTypes.STR, enum=list(CONTENT_TYPES), description='ndjson(기본) / csv'),
+            OpenApiParameter('gzip', OpenApiTypes.BOOL, description='true면 gzip 압축 파일'),
+            OpenApiParameter('search', OpenApiTypes.STR, description='목록과 같은 검색 조건'),
+        ],
+        responses={(200, 'application/x-ndjson'): OpenApiTypes.BINARY, (200, 'text/csv'): OpenApiTypes.BINARY},
+    )
+    @action(detail=False, methods=['get'], pagination_class=None)
+    def export(self, request):
+        output = request.query_params.get('output', 'ndjson')
+        if output not in CONTENT_TYPES:
+            return Response({"error": "Invalid output format"}, status=status.HTTP_400_BAD_REQUEST)
+        gzip = request.query_params.get('gzip', 'false').lower() == 'true'
+
+        queryset = self.filter_queryset(self.get_queryset()).order_by('id')
+        filename = f'{self.export_name}-{timezone.now():%Y%m%d}.{output}'
+        response = StreamingHttpResponse(
+            export_stream(queryset, self.export_fields, output, gzip),
+            content_type='application/gzip' if gzip else CONTENT_TYPES[output],
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}{".gz" if gzip else ""}"'
+        response['X-Accel-Buffering'] = 'no'  # nginx가 응답 전체를 버퍼링하지 않고 바로 전달
+        return response
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:20
+
+from django.db import migrations
+
+# 이 시점의 관리자 검색 인덱스 정의를 그대로 고정 (management.search가 바뀌어도 마이그레이션 재실행 결과는 동일)
+ADMIN_SEARCH_INDEXES = {
+    'accounts_user': ('username', 'email'),
+    'movies_movie': ('title',),
+}
+
+
+def create_indexes(apps, schema_editor):
+    """관리자 검색용 pg_trgm GIN 인덱스 (PostgreSQL만)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, fields in ADMIN_SEARCH_INDEXES.items():
+        for field in fields:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {table}_{field}_trgm ON {table} USING gin (UPPER({field}) gin_trgm_ops)'
+            )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, fields in ADMIN_SEARCH_INDEXES.items():
+        for field in fields:
+            schema_editor.execute(f'DROP INDEX IF EXISTS {table}_{field}_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_user_deletion_requested_at'),
+        ('movies', '0006_movie_title_key'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,51 @@
+"""
+관리자 목록 키셋 페이지네이션
+
+DRF CursorPagination(-id 순) → OFFSET 없이 PK 범위 조회, 깊은 페이지도 첫 페이지와 같은 비용
+- 전체 개수: 첫 페이지에서만 (include_count=false로 생략 가능)
+  검색 조건이 없으면 PostgreSQL 통계(pg_class.reltuples) 추정치 사용 → count_estimated=true
+"""
+from rest_framework import pagination
+from rest_framework.response import Response
+
+from config.db import estimated_row_count
+
+
+class AdminCursorPagination(pagination.CursorPagination):
+    """관리자 목록 공통 키셋 페이지네이션 (10, 20, 50, 100)"""
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-id'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count, self.count_estimated = None, False
+        first_page = not request.query_params.get(self.cursor_query_param)
+        if first_page and request.query_params.get('include_count', 'true').lower() != 'false':
+            self.count, self.count_estimated = self.count_rows(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+    def count_rows(self, queryset):
+        """(count, count_estimated) — 필터 없는 전체 목록은 추정치 우선"""
+        if not queryset.query.has_filters():
+            estimate = estimated_row_count(queryset.model)
+            if estimate is not None:
+                return estimate, True
+        return queryset.count(), False
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.count,
+            'count_estimated': self.count_estimated,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties'].update({
+            'count': {'type': 'integer', 'nullable': True, 'description': '첫 페이지에서만 포함'},
+            'count_estimated': {'type': 'boolean'},
+        })
+        return response_schema
@@ -0,0 +1,32 @@
+"""
+관리자 목록 검색 인덱스
+
+SearchFilter의 icontains는 PostgreSQL에서 UPPER(컬럼) LIKE UPPER('%검색어%')로 실행되므로,
+같은 식에 pg_trgm GIN 인덱스를 만들어 전체 테이블 스캔 없이 처리합니다. (SQLite는 인덱스 없이 스캔)
+"""
+from config.db import drop_trigram_index_sql, trigram_index_sql
+
+ADMIN_SEARCH_INDEXES = {
+    'accounts_user': ('username', 'email'),
+    'movies_movie': ('title',),
+}
+
+
+def admin_search_index_sql():
+    return trigram_index_sql(ADMIN_SEARCH_INDEXES)
+
+
+def install_admin_search_indexes(connection):
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        for sql in admin_search_index_sql():
+            cursor.execute(sql)
+
+
+def drop_admin_search_indexes(connection):
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        for sql in drop_trigram_index_sql(ADMIN_SEARCH_INDEXES):
+            cursor.execute(sql)
@@ -24,7 +24,10 @@ class AdminUserSerializer(serializers.ModelSerializer):
             'last_login', 
             'is_superuser',
             'groups',
-            'user_permissions'
+            'user_permissions',
+            # 시청 기록/좋아요 경로가 증분 갱신하는 비정규화 통계
+            'total_watch_time',
+            'like_count',
         )
 
 class AdminUserCreateSerializer(serializers.ModelSerializer):
@@ -43,7 +46,7 @@ class AdminMovieSerializer(serializers.ModelSerializer):
     class Meta:
         model = Movie
         fields = '__all__'
-        read_only_fields = ('id', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'created_at', 'updated_at', 'review_count', 'review_sum')
 
 class AdminReviewSerializer(serializers.ModelSerializer):
     """관리자용 리뷰 관리 시리얼라이저"""
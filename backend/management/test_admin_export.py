@@ -0,0 +1,116 @@
+import csv
+import gzip
+import io
+import json
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from home.models import MovieReview
+from management.export import csv_lines, export_stream
+from movies.models import Movie
+
+User = get_user_model()
+
+
+class AdminExportTest(TestCase):
+    """관리자 스트리밍 내보내기 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username='admin', password='testpass1234!', is_staff=True)
+        cls.users = [
+            User.objects.create_user(username=f'member{i}', email=f'member{i}@test.com', password='testpass1234!')
+            for i in range(5)
+        ]
+        cls.movies = [Movie.objects.create(movie_id=str(1000 + i), title=f'영화 {i}') for i in range(3)]
+        MovieReview.objects.bulk_create([
+            MovieReview(movie=cls.movies[i % 3], author=cls.users[i % 5], rating=i % 5 + 1, content=f'리뷰, "{i}"\n둘째 줄')
+            for i in range(7)
+        ])
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def login(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+
+    def download(self, url, params=None):
+        response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content)
+
+    # ========== 1. NDJSON: 한 줄에 한 행, id 순, 비밀번호 제외 ==========
+    def test_ndjson_export(self):
+        self.login(self.admin)
+        response, body = self.download('/api/admin/accounts/export/')
+        rows = [json.loads(line) for line in body.decode().splitlines()]
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        self.assertIn('users-', response['Content-Disposition'])
+        self.assertEqual([row['username'] for row in rows], ['admin'] + [f'member{i}' for i in range(5)])
+        self.assertNotIn('password', rows[0])
+        print('✅ [PASS] 유저 NDJSON 내보내기 (id 순, 비밀번호 제외)')
+
+    # ========== 2. CSV: 헤더 + 따옴표/줄바꿈 이스케이프 + 관계 컬럼 ==========
+    def test_csv_export(self):
+        self.login(self.admin)
+        response, body = self.download('/api/admin/reviews/export/', {'output': 'csv'})
+        self.assertTrue(body.startswith('\ufeff'.encode()))
+        rows = list(csv.DictReader(io.StringIO(body.decode('utf-8-sig'))))
+
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(
+            (rows[0]['movie_id'], rows[0]['movie_title'], rows[0]['author_name'], rows[0]['content']),
+            ('1000', '영화 0', 'member0', '리뷰, "0"\n둘째 줄'),
+        )
+        print('✅ [PASS] 리뷰 CSV 내보내기 (영화/작성자 컬럼, 이스케이프)')
+
+    # ========== 2-1. CSV: 수식 문자로 시작하는 셀은 ' 접두어 (formula injection 차단) ==========
+    def test_csv_neutralizes_formulas(self):
+        MovieReview.objects.create(
+            movie=self.movies[0], author=self.users[0], rating=1, content='=HYPERLINK("http://evil.test","클릭")'
+        )
+        self.login(self.admin)
+        _, body = self.download('/api/admin/reviews/export/', {'output': 'csv'})
+        rows = list(csv.DictReader(io.StringIO(body.decode('utf-8-sig'))))
+        self.assertEqual(rows[-1]['content'], '\'=HYPERLINK("http://evil.test","클릭")')
+        self.assertEqual(rows[-1]['rating'], '1')
+
+        lines = list(csv_lines(['a', 'b', 'c', 'd', 'e'], [('+1', '-2', '@SUM(A1)', -3, '안전')]))
+        self.assertEqual(lines[1], "'+1,'-2,'@SUM(A1),-3,안전\r\n")
+        print('✅ [PASS] CSV formula injection 차단 (=, +, -, @ 접두어)')
+
+    # ========== 3. gzip + 검색 조건 ==========
+    def test_gzip_export_with_search(self):
+        self.login(self.admin)
+        response, body = self.download('/api/admin/movies/export/', {'gzip': 'true', 'search': '영화 2'})
+        rows = [json.loads(line) for line in gzip.decompress(body).decode().splitlines()]
+
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertTrue(response['Content-Disposition'].endswith('.ndjson.gz"'))
+        self.assertEqual([row['title'] for row in rows], ['영화 2'])
+        print('✅ [PASS] 영화 gzip 내보내기 + 검색 조건 적용')
+
+    # ========== 4. 청크 단위 조회 (iterator) → 전체 행이 그대로 ==========
+    def test_stream_reads_in_chunks(self):
+        stream = export_stream(User.objects.order_by('id'), ('id', 'username'), chunk_size=2)
+        with self.assertNumQueries(1):  # SQLite는 fetchmany(2)로 나눠 읽음, 쿼리는 1회
+            lines = list(stream)
+        self.assertEqual(len(lines), User.objects.count())
+        print('✅ [PASS] iterator(chunk_size) 기반 스트림')
+
+    # ========== 5. 권한 / 잘못된 형식 ==========
+    def test_requires_admin_and_valid_format(self):
+        self.login(self.users[0])
+        self.assertEqual(self.client.get('/api/admin/accounts/export/').status_code, 403)
+        self.login(self.admin)
+        response = self.client.get('/api/admin/accounts/export/', {'output': 'xml'})
+        self.assertEqual(response.status_code, 400)
+        print('✅ [PASS] 관리자 전용 + 잘못된 형식 400')
@@ -0,0 +1,106 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import get_user_model
+
+from community.search import POSTGRES_SETUP_SQL
+from home.models import MovieReview
+from management.search import admin_search_index_sql
+from movies.models import Movie
+
+User = get_user_model()
+
+
+class AdminKeysetPaginationTest(TestCase):
+    """관리자 목록 키셋 페이지네이션 + 검색 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username='admin', password='testpass1234!', is_staff=True)
+        cls.users = [
+            User.objects.create_user(username=f'member{i}', email=f'member{i}@test.com', password='testpass1234!')
+            for i in range(24)
+        ]
+        cls.movies = [Movie.objects.create(movie_id=str(1000 + i), title=f'영화 {i}') for i in range(24)]
+        Movie.objects.create(movie_id='27205', title='Inception')
+        MovieReview.objects.bulk_create([
+            MovieReview(movie=cls.movies[i % 24], author=cls.users[i % 24], rating=i % 5 + 1, content=f'리뷰 {i}')
+            for i in range(30)
+        ])
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.admin).access_token}')
+        self.client.get('/api/admin/accounts/', {'page_size': 1})  # 인증 유저 캐시 적재
+
+    def walk(self, url, params):
+        """next 링크를 끝까지 따라가며 id 수집 → (ids, 첫 페이지 응답)"""
+        response = self.client.get(url, params)
+        first, ids = response.data, []
+        while True:
+            self.assertEqual(response.status_code, 200)
+            ids += [row['id'] for row in response.data['results']]
+            if not response.data['next']:
+                return ids, first
+            response = self.client.get(response.data['next'])
+
+    # ========== 1. 커서로 끝까지 → 중복/누락 없이 -id 순 ==========
+    def test_cursor_walk_covers_all_rows(self):
+        for url, model in (
+            ('/api/admin/accounts/', User), ('/api/admin/movies/', Movie), ('/api/admin/reviews/', MovieReview),
+        ):
+            ids, first = self.walk(url, {'page_size': 7})
+            self.assertEqual(ids, list(model.objects.order_by('-id').values_list('id', flat=True)))
+            self.assertEqual((first['count'], first['count_estimated']), (len(ids), False))
+        print('✅ [PASS] 유저/영화/리뷰 목록 커서 순회 → 전체 행 -id 순')
+
+    # ========== 2. 다음 페이지는 count 생략 ==========
+    def test_count_only_on_first_page(self):
+        first = self.client.get('/api/admin/movies/', {'page_size': 10}).data
+        second = self.client.get(first['next']).data
+        self.assertEqual(first['count'], 25)
+        self.assertIsNone(second['count'])
+        self.assertIsNone(self.client.get('/api/admin/movies/', {'include_count': 'false'}).data['count'])
+        print('✅ [PASS] count는 첫 페이지에서만')
+
+    # ========== 3. 리뷰 목록 쿼리 수는 페이지 크기와 무관 ==========
+    def test_review_list_query_count_is_fixed(self):
+        for page_size in (5, 30):
+            with self.assertNumQueries(2):
+                response = self.client.get('/api/admin/reviews/', {'page_size': page_size})
+            self.assertEqual(len(response.data['results']), page_size)
+        row = response.data['results'][-1]
+        self.assertEqual((row['author_name'], row['movie_title']), ('member0', '영화 0'))
+        print('✅ [PASS] 관리자 리뷰 목록 → page_size 5/30 모두 쿼리 2회 (작성자·영화 JOIN)')
+
+    # ========== 4. 검색: username/email, 영화 제목 ==========
+    def test_search(self):
+        users = self.client.get('/api/admin/accounts/', {'search': 'member1', 'page_size': 50}).data
+        self.assertEqual(
+            sorted(row['username'] for row in users['results']),
+            ['member1'] + [f'member{i}' for i in range(10, 20)],
+        )
+        by_email = self.client.get('/api/admin/accounts/', {'search': 'member23@TEST'}).data
+        self.assertEqual([row['username'] for row in by_email['results']], ['member23'])
+
+        movies = self.client.get('/api/admin/movies/', {'search': 'incep'}).data
+        self.assertEqual((movies['count'], movies['results'][0]['title']), (1, 'Inception'))
+
+        reviews = self.client.get('/api/admin/reviews/', {'search': 'member5'}).data
+        self.assertEqual(reviews['count'], 2)  # 작성자 member5 (i=5, 29)
+        print('✅ [PASS] 관리자 목록 검색 (username/email/영화 제목)')
+
+    # ========== 5. 관리자/커뮤니티 검색 인덱스는 같은 trigram DDL 헬퍼로 생성 ==========
+    def test_trigram_index_sql(self):
+        self.assertIn(
+            'CREATE INDEX IF NOT EXISTS accounts_user_email_trgm ON accounts_user USING gin (UPPER(email) gin_trgm_ops)',
+            admin_search_index_sql(),
+        )
+        self.assertIn(
+            'CREATE INDEX IF NOT EXISTS community_review_content_trgm ON community_review USING gin (UPPER(content) gin_trgm_ops)',
+            POSTGRES_SETUP_SQL,
+        )
+        self.assertEqual(POSTGRES_SETUP_SQL[0], 'CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        print('✅ [PASS] trigram 인덱스 DDL (관리자/커뮤니티 공용)')
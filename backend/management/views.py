@@ -1,8 +1,13 @@
-from rest_framework import viewsets, permissions, pagination, filters
+from rest_framework import viewsets, permissions, filters
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from movies.models import Movie
 from home.models import MovieReview
+from home.caching import bump_category_version, invalidate_movie_detail
+from home.views import update_movie_review_stats
+from .export import AdminExportMixin
+from .pagination import AdminCursorPagination
 from .serializers import (
     AdminUserSerializer, 
     AdminUserCreateSerializer, 
@@ -12,22 +17,23 @@ from .serializers import (
 
 User = get_user_model()
 
-# ========== Pagination ==========
-
-class AdminMoviePagination(pagination.PageNumberPagination):
-    """영화 관리용 가변 페이지네이션 (10, 20, 50, 100)"""
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 100
-
 # ========== Admin ViewSets ==========
 
 @extend_schema(tags=['Admin - Accounts'])
-class AdminUserViewSet(viewsets.ModelViewSet):
+class AdminUserViewSet(AdminExportMixin, viewsets.ModelViewSet):
     """관리자용 유저 CRUD (PATCH만 허용)"""
     queryset = User.objects.all().order_by('-id')
     serializer_class = AdminUserSerializer
     permission_classes = [permissions.IsAdminUser]
+    pagination_class = AdminCursorPagination
+    filter_backends = [filters.SearchFilter]
+    search_fields = ['username', 'email']
+    # 비밀번호 해시 제외
+    export_name = 'users'
+    export_fields = (
+        'id', 'username', 'email', 'first_name', 'last_name', 'login_type',
+        'is_staff', 'is_active', 'is_onboarding_completed', 'date_joined', 'last_login',
+    )
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
 
     def get_serializer_class(self):
@@ -40,20 +46,61 @@ class AdminUserViewSet(viewsets.ModelViewSet):
         return super().create(request, *args, **kwargs)
 
 @extend_schema(tags=['Admin - Movies'])
-class AdminMovieViewSet(viewsets.ModelViewSet):
+class AdminMovieViewSet(AdminExportMixin, viewsets.ModelViewSet):
     """관리자용 영화 CRUD (PATCH만 허용)"""
     queryset = Movie.objects.all().order_by('-id')
     serializer_class = AdminMovieSerializer
     permission_classes = [permissions.IsAdminUser]
-    pagination_class = AdminMoviePagination
+    pagination_class = AdminCursorPagination
     filter_backends = [filters.SearchFilter]
     search_fields = ['title']
+    export_name = 'movies'
+    export_fields = (
+        'id', 'movie_id', 'title', 'release_date', 'vote_average', 'review_average', 'review_count',
+        'view_count', 'like_count', 'is_in_theaters', 'created_at', 'updated_at',
+    )
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
 
+    # 영화 정보는 다른 영화의 추천 리스트에도 노출되므로 카테고리 버전 기반 캐시 전체 무효화
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        bump_category_version()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        bump_category_version()
+
 @extend_schema(tags=['Admin - Reviews'])
-class AdminReviewViewSet(viewsets.ModelViewSet):
+class AdminReviewViewSet(AdminExportMixin, viewsets.ModelViewSet):
     """관리자용 리뷰 CRUD (PATCH만 허용)"""
-    queryset = MovieReview.objects.all().order_by('-id')
+    # author_name / movie_title 표시용 작성자·영화 JOIN (행마다 추가 조회 방지)
+    queryset = MovieReview.objects.select_related('author', 'movie').order_by('-id')
     serializer_class = AdminReviewSerializer
     permission_classes = [permissions.IsAdminUser]
+    pagination_class = AdminCursorPagination
+    filter_backends = [filters.SearchFilter]
+    search_fields = ['movie__title', 'author__username']
+    export_name = 'reviews'
+    export_fields = (
+        'id', ('movie_id', 'movie__movie_id'), ('movie_title', 'movie__title'),
+        ('author_name', 'author__username'), 'rating', 'content', 'created_at', 'updated_at',
+    )
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+
+    # ---- 리뷰 변경 시 영화 리뷰 통계 갱신 + 상세 캐시 무효화 ----
+    def perform_update(self, serializer):
+        old_rating = serializer.instance.rating
+        with transaction.atomic():
+            super().perform_update(serializer)
+            review = serializer.instance
+            update_movie_review_stats(review.movie, 0, review.rating - old_rating)
+        invalidate_movie_detail(serializer.instance.movie.movie_id)
+
+    def perform_destroy(self, instance):
+        movie = instance.movie
+        with transaction.atomic():
+            # 동시 삭제 요청이 둘 다 통과해도 실제로 행을 지운 요청만 통계를 감소
+            deleted = MovieReview.objects.filter(pk=instance.pk).delete()[0]
+            if deleted:
+                update_movie_review_stats(movie, -1, -instance.rating)
+        invalidate_movie_detail(movie.movie_id)
@@ -11,6 +11,7 @@ from datetime import datetime
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from movies.models import Genre, Movie
+from home.caching import bump_category_version
 
 
 class Command(BaseCommand):
@@ -86,3 +87,6 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(
             f'영화 {movie_count}개 로드 완료!'
         ))
+
+        # ---- 영화 정보가 바뀌었으므로 카테고리 버전 기반 캐시(홈/상세) 무효화 ----
+        bump_category_version()
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.2 on 2026-10-19 10:00
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_review_stats(apps, schema_editor):
+    """기존 리뷰 기준으로 review_count / review_sum 초기값 채우기"""
+    Movie = apps.get_model('movies', 'Movie')
+    MovieReview = apps.get_model('home', 'MovieReview')
+    stats = MovieReview.objects.order_by().values('movie_id').annotate(count=Count('id'), total=Sum('rating'))
+    for row in stats:
+        Movie.objects.filter(pk=row['movie_id']).update(review_count=row['count'], review_sum=row['total'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0003_alter_comment_options_movie_review_average_and_more'),
+        ('home', '0003_moviereview'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='review_sum',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_review_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.2 on 2026-10-19 16:20
+
+import unicodedata
+
+from django.db import migrations, models
+
+# 이 시점의 제목 정규화 규칙을 그대로 고정 (movies.titles가 바뀌어도 마이그레이션 재실행 결과는 동일)
+TITLE_KEY_LENGTH = 200
+
+
+def normalize_title(title):
+    text = unicodedata.normalize('NFKC', title or '').casefold()
+    return ''.join(char for char in text if char.isalnum())[:TITLE_KEY_LENGTH]
+
+
+def backfill_title_key(apps, schema_editor):
+    """기존 영화 정규화 제목 채우기"""
+    Movie = apps.get_model('movies', 'Movie')
+    movies = list(Movie.objects.only('id', 'title'))
+    for movie in movies:
+        movie.title_key = normalize_title(movie.title)
+    Movie.objects.bulk_update(movies, ['title_key'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_alter_movie_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='title_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=200),
+        ),
+        migrations.RunPython(backfill_title_key, migrations.RunPython.noop),
+    ]
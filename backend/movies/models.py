@@ -1,6 +1,8 @@
 from django.db import models
 from django.conf import settings
 
+from .titles import normalize_title
+
 
 # ========== Genre 모델 ==========
 class Genre(models.Model):
@@ -20,6 +22,7 @@ class Movie(models.Model):
     """영화 모델 — movie_info.json 데이터 기반"""
     movie_id = models.CharField(max_length=20, unique=True, db_index=True)
     title = models.CharField(max_length=200)
+    title_key = models.CharField(max_length=200, blank=True, db_index=True, editable=False)  # 정규화 제목 (movies.titles)
     youtube_key = models.CharField(max_length=50, blank=True)
     embed_url = models.URLField(max_length=500, blank=True)
     release_date = models.DateField(null=True, blank=True)
@@ -31,6 +34,8 @@ class Movie(models.Model):
     vote_average = models.FloatField(default=0)   # TMDB 평점
     star_rating = models.FloatField(default=0)     # 내부 별점
     review_average = models.FloatField(default=0) # 사용자 리뷰 평균 평점 (추가)
+    review_count = models.PositiveIntegerField(default=0)  # 리뷰 수 (review_average 증분 계산용)
+    review_sum = models.IntegerField(default=0)            # 리뷰 평점 합계
 
     # ---- 부가 정보 ----
     ott_providers = models.JSONField(default=list, blank=True)
@@ -43,7 +48,7 @@ class Movie(models.Model):
     like_count = models.PositiveIntegerField(default=0)
 
     # ---- 시간 ----
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -52,6 +57,13 @@ class Movie(models.Model):
     def __str__(self):
         return f"[{self.movie_id}] {self.title}"
 
+    def save(self, *args, **kwargs):
+        self.title_key = normalize_title(self.title)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'title' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'title_key'}
+        super().save(*args, **kwargs)
+
 
 # ========== Comment 모델 (쇼츠 댓글용) ==========
 class Comment(models.Model):
@@ -2,30 +2,19 @@ import random
 from django.db.models import Avg
 from home.models import HomeCategory
 from .models import Movie
-from accounts.models import UserMovieHistory
+from accounts.models import genre_key_score
+from accounts.watch_history import recent_watch_histories
 
 def get_ranked_categories(user):
     """유저 점수 기반으로 471개 카테고리의 우선순위를 정렬하여 반환 (홈 로직 재사용)"""
-    genre_map = {
-        '액션': 'pref_action', '모험': 'pref_adventure', '애니메이션': 'pref_animation',
-        '코미디': 'pref_comedy', '범죄': 'pref_crime', '다큐멘 터리': 'pref_documentary',
-        '드라마': 'pref_drama', '가족': 'pref_family', '판타지': 'pref_fantasy',
-        '역사': 'pref_history', '공포': 'pref_horror', '음악': 'pref_music',
-        '미스터리': 'pref_mystery', '로맨스': 'pref_romance', 'SF': 'pref_science_fiction',
-        'TV 영화': 'pref_tv_movie', '스릴러': 'pref_thriller', '전쟁': 'pref_war', '서부': 'pref_western'
-    }
-    
+    pref_vector = user.pref_vector
+
     # 일반/혼합 카테고리만 대상으로 정렬
     generals = HomeCategory.objects.filter(category_type='general').prefetch_related('movies')
     cat_list = []
     
     for cat in generals:
-        user_score = 0
-        if cat.genre_key:
-            genres = cat.genre_key.split('|')
-            scores = [getattr(user, genre_map.get(g, ''), 0) for g in genres if genre_map.get(g)]
-            user_score = sum(scores) / len(scores) if scores else 0
-        cat_list.append({"obj": cat, "score": user_score})
+        cat_list.append({"obj": cat, "score": genre_key_score(pref_vector, cat.genre_key)})
     
     # 유저 점수 높은 순으로 정렬
     cat_list.sort(key=lambda x: x['score'], reverse=True)
@@ -51,8 +40,8 @@ def pick_movies_round_robin(categories, count, exclude_ids):
 
 def generate_personalized_playlist(user):
     """Top(12) + Mid(4) + Special(4) = 20개 믹스 추천 리스트 생성"""
-    # 1. 최근 시청한 500개 영화 제외 대상 수집
-    watched_ids = list(UserMovieHistory.objects.filter(user=user).values_list('movie_id', flat=True)[:500])
+    # 1. 최근 시청한 영화(보관 한도만큼) 제외 대상 수집
+    watched_ids = list(recent_watch_histories(user).values_list('movie_id', flat=True))
     
     # 2. 카테고리 확보
     sorted_cats = get_ranked_categories(user)
@@ -0,0 +1,28 @@
+"""
+Movie.genres 변경 → Movie.updated_at 갱신
+
+genres.set() / add() / remove() / clear()는 중간 테이블만 바꾸고 save()를 거치지 않으므로,
+refresh_home 증분 갱신(updated_at 워터마크)이 장르 이동을 감지하도록 여기서 updated_at을 기록합니다.
+"""
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Movie
+
+
+@receiver(m2m_changed, sender=Movie.genres.through)
+def touch_movies_on_genre_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        # genre.movies.add/remove(...) → pk_set이 영화 ID, clear는 지우기 전에 소속 영화를 기록
+        if action in ('post_add', 'post_remove'):
+            movies = Movie.objects.filter(pk__in=pk_set)
+        elif action == 'pre_clear':
+            movies = instance.movies.all()
+        else:
+            return
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        movies = Movie.objects.filter(pk=instance.pk)
+    else:
+        return
+    movies.update(updated_at=timezone.now())
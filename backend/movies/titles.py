@@ -0,0 +1,38 @@
+"""
+영화 제목 → Movie 해석 (커뮤니티 리뷰의 자유 입력 movie_title 연결용)
+
+Movie.title_key = normalize_title(title) 컬럼(인덱스)에 정규화 제목을 저장하고,
+입력 제목도 같은 방식으로 정규화해 인덱스 일치 조회로 찾습니다.
+- 정규화: NFKC → casefold → 글자/숫자 외 문자(공백, 콜론, 하이픈 등) 제거
+  ('어벤져스: 엔드게임' == '어벤져스 엔드게임' == '어벤져스엔드게임')
+- 같은 제목의 영화가 여러 개면 리뷰가 많은 영화 → 먼저 등록된 영화 순으로 선택
+"""
+import unicodedata
+
+TITLE_KEY_LENGTH = 200
+
+
+def normalize_title(title):
+    text = unicodedata.normalize('NFKC', title or '').casefold()
+    return ''.join(char for char in text if char.isalnum())[:TITLE_KEY_LENGTH]
+
+
+def resolve_movie_ids(titles, chunk_size=500):
+    """제목 목록 → {정규화 제목: Movie pk} (일치하는 영화가 없는 제목은 제외)"""
+    from .models import Movie
+
+    keys = sorted({normalize_title(title) for title in titles} - {''})
+    resolved = {}
+    for start in range(0, len(keys), chunk_size):
+        rows = (
+            Movie.objects.filter(title_key__in=keys[start:start + chunk_size])
+            .order_by('title_key', '-review_count', 'id').values_list('title_key', 'id')
+        )
+        for title_key, movie_pk in rows:
+            resolved.setdefault(title_key, movie_pk)
+    return resolved
+
+
+def resolve_movie_id(title):
+    """제목 하나 → Movie pk 또는 None"""
+    return resolve_movie_ids([title]).get(normalize_title(title))
@@ -19,7 +19,8 @@ from .serializers import (
     ShortsResponseSerializer,
     ShortsDetailResponseSerializer
 )
-from accounts.models import UserLikeList
+from accounts.models import User, UserLikeList
+from accounts.caching import invalidate_mypage_lists, bump_user_versions
 from .recommendation import generate_personalized_playlist
 
 # Redis 직접 연결 (도커 호스트명 'redis' 사용)
@@ -246,16 +247,19 @@ class ShortsLikeView(APIView):
         )
 
         if created:
-            # 좋아요 등록 → like_count +1
-            movie.like_count = F('like_count') + 1
-            movie.save(update_fields=['like_count'])
+            # 좋아요 등록 → 영화/유저 like_count +1
+            delta = 1
             is_liked, message = True, "좋아요가 등록되었습니다."
         else:
-            # 좋아요 취소 → like_count -1
+            # 좋아요 취소 → 영화/유저 like_count -1
             like.delete()
-            movie.like_count = F('like_count') - 1
-            movie.save(update_fields=['like_count'])
+            delta = -1
             is_liked, message = False, "좋아요가 취소되었습니다."
+        movie.like_count = F('like_count') + delta
+        movie.save(update_fields=['like_count', 'updated_at'])
+        User.objects.filter(pk=request.user.pk).update(like_count=F('like_count') + delta)
+        invalidate_mypage_lists([request.user.pk])
+        bump_user_versions([request.user.pk])
 
         movie.refresh_from_db()
 
@@ -281,9 +285,9 @@ class ShortsViewCountView(APIView):
         # ---- 영화 조회 ----
         movie = get_object_or_404(Movie, movie_id=movie_id)
 
-        # ---- 조회수 증가 ----
+        # ---- 조회수 증가 (updated_at 동시 기록 → refresh_home 증분 갱신 감지) ----
         movie.view_count = F('view_count') + 1
-        movie.save(update_fields=['view_count'])
+        movie.save(update_fields=['view_count', 'updated_at'])
         movie.refresh_from_db()
 
         # ---- 응답 ----
@@ -77,17 +77,27 @@ export type AdminMovieItem = {
 	[key: string]: unknown;
 };
 
-export type AdminMovieListResponse = {
-	count: number;
+// 관리자 목록은 키셋(커서) 페이지네이션 — count는 첫 페이지에서만 내려옴
+export type AdminCursorPage<T> = {
+	count: number | null;
+	count_estimated: boolean;
 	next: string | null;
 	previous: string | null;
-	results: AdminMovieItem[];
+	results: T[];
+};
+
+// next/previous 링크에서 cursor 값만 추출
+export function cursorOf(link: string | null) {
+	if (!link) return undefined;
+	return new URL(link).searchParams.get("cursor") ?? undefined;
+}
 
+export type AdminMovieListResponse = AdminCursorPage<AdminMovieItem> & {
 	admin_stats?: Record<string, unknown>;
 };
 
 export type AdminMovieListParams = {
-	page?: number;
+	cursor?: string;
 	page_size?: number;
 	search?: string;
 	genre?: string;
@@ -120,10 +130,18 @@ export type AdminUserItem = {
 	[key: string]: unknown;
 };
 
-export type AdminUserListResponse = AdminUserItem[];
+export type AdminUserListResponse = AdminCursorPage<AdminUserItem>;
 
-export async function getAdminUserList() {
-	const res = await api.get<AdminUserListResponse>("/admin/accounts/");
+export type AdminUserListParams = {
+	cursor?: string;
+	page_size?: number;
+	search?: string;
+};
+
+export async function getAdminUserList(params?: AdminUserListParams) {
+	const res = await api.get<AdminUserListResponse>("/admin/accounts/", {
+		params,
+	});
 	return res.data;
 }
 
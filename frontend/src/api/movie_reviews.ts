@@ -32,21 +32,34 @@ function toReviewItem(r: BackendReview): ReviewItem {
 	};
 }
 
+export type MovieReviewPage = {
+	reviews: ReviewItem[];
+	nextCursor: string | null;
+};
+
+// 리뷰 목록은 10개씩 키셋 페이지 — 다음 페이지는 next_cursor로 요청
 export async function getMovieReviews(
 	movieId: string | number,
-): Promise<ReviewItem[]> {
-	const res = await api.get<BackendReview[] | { results?: BackendReview[] }>(
-		"/home/review/",
-		{
-			params: {
-				id: movieId,
-			},
+	cursor?: string | null,
+): Promise<MovieReviewPage> {
+	const res = await api.get<{
+		next_cursor?: string | null;
+		results?: BackendReview[];
+	}>("/home/review/", {
+		params: {
+			id: movieId,
+			...(cursor ? { cursor } : {}),
 		},
-	);
+	});
 
-	const raw = Array.isArray(res.data) ? res.data : (res.data?.results ?? []);
+	const raw = res.data?.results ?? [];
 
-	return raw.map(toReviewItem).filter((x) => x.content.trim().length > 0);
+	return {
+		reviews: raw
+			.map(toReviewItem)
+			.filter((x) => x.content.trim().length > 0),
+		nextCursor: res.data?.next_cursor ?? null,
+	};
 }
 
 export type CreateReviewPayload = {
@@ -2,7 +2,7 @@
 
 import { useRouter } from "next/navigation";
 import { useCallback, useEffect, useMemo, useState } from "react";
-import { type AdminUserItem, getAdminUserList } from "@/api/admin";
+import { type AdminUserItem, cursorOf, getAdminUserList } from "@/api/admin";
 import { Button } from "@/components/ui/button";
 import { Card } from "@/components/ui/card";
 import AddMemberDialog from "./AddMemberDialog";
@@ -50,9 +50,13 @@ function RoleBadge({ role }: { role: Member["role"] }) {
 export default function MembersPanel() {
 	const router = useRouter();
 	const [page, setPage] = useState(1);
+	const [cursor, setCursor] = useState<string | undefined>(undefined);
 	const pageSize = 10;
 
 	const [rawUsers, setRawUsers] = useState<AdminUserItem[]>([]);
+	const [count, setCount] = useState(0);
+	const [next, setNext] = useState<string | null>(null);
+	const [previous, setPrevious] = useState<string | null>(null);
 	const [loading, setLoading] = useState(false);
 	const [err, setErr] = useState<string | null>(null);
 
@@ -60,28 +64,36 @@ export default function MembersPanel() {
 		setLoading(true);
 		setErr(null);
 		try {
-			const data = await getAdminUserList();
-			setRawUsers(Array.isArray(data) ? data : []);
+			const data = await getAdminUserList({ cursor, page_size: pageSize });
+			setRawUsers(Array.isArray(data.results) ? data.results : []);
+			// 총 개수는 첫 페이지 응답에만 포함
+			if (typeof data.count === "number") setCount(data.count);
+			setNext(data.next ?? null);
+			setPrevious(data.previous ?? null);
 		} catch {
 			setErr("회원 목록을 불러오지 못했습니다.");
 		} finally {
 			setLoading(false);
 		}
-	}, []);
+	}, [cursor]);
 
 	useEffect(() => {
 		fetchUsers();
 	}, [fetchUsers]);
 
 	const totalPages = useMemo(() => {
-		return Math.max(1, Math.ceil(rawUsers.length / pageSize));
-	}, [rawUsers.length]);
+		return Math.max(1, Math.ceil(count / pageSize));
+	}, [count]);
+
+	const goTo = (link: string | null, delta: number) => {
+		setCursor(cursorOf(link));
+		setPage((p) => Math.max(1, p + delta));
+	};
 
 	const members: Member[] = useMemo(() => {
 		const start = (page - 1) * pageSize;
-		const sliced = rawUsers.slice(start, start + pageSize);
 
-		return sliced.map((u, idx) => {
+		return rawUsers.map((u, idx) => {
 			const fullName = `${u.first_name ?? ""} ${u.last_name ?? ""}`.trim();
 			const joinedAt = (u.date_joined ?? "").slice(0, 10) || "-";
 
@@ -116,7 +128,7 @@ export default function MembersPanel() {
 						<div className="text-sm font-medium text-zinc-200">
 							회원 목록{" "}
 							<span className="ml-2 text-xs text-zinc-500">
-								총 {rawUsers.length}명
+								총 {count}명
 							</span>
 						</div>
 
@@ -217,8 +229,8 @@ export default function MembersPanel() {
 					<Button
 						variant="secondary"
 						className="border border-zinc-800 bg-zinc-900 hover:bg-zinc-800 text-zinc-200"
-						onClick={() => setPage((p) => Math.max(1, p - 1))}
-						disabled={page <= 1 || loading}
+						onClick={() => goTo(previous, -1)}
+						disabled={!previous || loading || page <= 1}
 					>
 						이전
 					</Button>
@@ -235,8 +247,8 @@ export default function MembersPanel() {
 					<Button
 						variant="secondary"
 						className="border border-zinc-800 bg-zinc-900 hover:bg-zinc-800 text-zinc-200"
-						onClick={() => setPage((p) => Math.min(totalPages, p + 1))}
-						disabled={page >= totalPages || loading}
+						onClick={() => goTo(next, 1)}
+						disabled={!next || loading}
 					>
 						다음
 					</Button>
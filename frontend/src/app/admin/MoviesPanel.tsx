@@ -2,7 +2,7 @@
 
 import { useRouter } from "next/navigation";
 import { useEffect, useMemo, useState } from "react";
-import { type AdminMovieItem, getAdminMovieList } from "@/api/admin";
+import { type AdminMovieItem, cursorOf, getAdminMovieList } from "@/api/admin";
 import { Button } from "@/components/ui/button";
 import { Card } from "@/components/ui/card";
 import { Input } from "@/components/ui/input";
@@ -10,6 +10,7 @@ import { Input } from "@/components/ui/input";
 export default function MoviesPanel() {
 	const router = useRouter();
 	const [page, setPage] = useState(1);
+	const [cursor, setCursor] = useState<string | undefined>(undefined);
 	const [pageSize, setPageSize] = useState(10);
 	const [search, setSearch] = useState("");
 	const [searchInput, setSearchInput] = useState("");
@@ -30,14 +31,15 @@ export default function MoviesPanel() {
 			setErr(null);
 			try {
 				const data = await getAdminMovieList({
-					page,
+					cursor,
 					page_size: pageSize,
 					search,
 				});
 				if (!mounted) return;
 
 				setMovies(Array.isArray(data.results) ? data.results : []);
-				setCount(typeof data.count === "number" ? data.count : 0);
+				// 총 개수는 첫 페이지 응답에만 포함
+				if (typeof data.count === "number") setCount(data.count);
 				setNext(data.next ?? null);
 				setPrevious(data.previous ?? null);
 			} catch {
@@ -54,7 +56,17 @@ export default function MoviesPanel() {
 		return () => {
 			mounted = false;
 		};
-	}, [page, pageSize, search]);
+	}, [cursor, pageSize, search]);
+
+	const goTo = (link: string | null, delta: number) => {
+		setCursor(cursorOf(link));
+		setPage((p) => Math.max(1, p + delta));
+	};
+
+	const resetPage = () => {
+		setCursor(undefined);
+		setPage(1);
+	};
 
 	const totalPages = useMemo(() => {
 		return Math.max(1, Math.ceil(count / pageSize));
@@ -104,7 +116,7 @@ export default function MoviesPanel() {
 								value={pageSize}
 								onChange={(e) => {
 									setPageSize(Number(e.target.value));
-									setPage(1);
+									resetPage();
 								}}
 							>
 								<option value={10}>10개씩</option>
@@ -118,7 +130,7 @@ export default function MoviesPanel() {
 									onChange={(e) => setSearchInput(e.target.value)}
 									onKeyDown={(e) => {
 										if (e.key === "Enter") {
-											setPage(1);
+											resetPage();
 											setSearch(searchInput);
 										}
 									}}
@@ -128,7 +140,7 @@ export default function MoviesPanel() {
 									variant="secondary"
 									className="h-9 border border-zinc-800 bg-zinc-900 text-zinc-200 hover:bg-zinc-800"
 									onClick={() => {
-										setPage(1);
+										resetPage();
 										setSearch(searchInput);
 									}}
 								>
@@ -228,7 +240,7 @@ export default function MoviesPanel() {
 					<Button
 						variant="secondary"
 						className="border border-zinc-800 bg-zinc-900 hover:bg-zinc-800 text-zinc-200"
-						onClick={() => setPage((p) => Math.max(1, p - 1))}
+						onClick={() => goTo(previous, -1)}
 						disabled={!previous || loading || page <= 1}
 					>
 						이전
@@ -246,7 +258,7 @@ export default function MoviesPanel() {
 					<Button
 						variant="secondary"
 						className="border border-zinc-800 bg-zinc-900 hover:bg-zinc-800 text-zinc-200"
-						onClick={() => setPage((p) => p + 1)}
+						onClick={() => goTo(next, 1)}
 						disabled={!next || loading}
 					>
 						다음
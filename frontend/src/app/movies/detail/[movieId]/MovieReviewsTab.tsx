@@ -27,7 +27,9 @@ export default function MovieReviewsTab({
 }) {
 	const params = useParams<ReviewTabParams>();
 	const [reviews, setReviews] = useState<ReviewItem[]>([]);
+	const [nextCursor, setNextCursor] = useState<string | null>(null);
 	const [loading, setLoading] = useState(false);
+	const [loadingMore, setLoadingMore] = useState(false);
 
 	const [open, setOpen] = useState(false);
 	const [submitting, setSubmitting] = useState(false);
@@ -43,10 +45,26 @@ export default function MovieReviewsTab({
 	async function refetchReviews() {
 		if (!normalizedMovieId) {
 			setReviews([]);
+			setNextCursor(null);
 			return;
 		}
 		const data = await getMovieReviews(normalizedMovieId);
-		setReviews(data);
+		setReviews(data.reviews);
+		setNextCursor(data.nextCursor);
+	}
+
+	async function loadMoreReviews() {
+		if (!normalizedMovieId || !nextCursor) return;
+		try {
+			setLoadingMore(true);
+			const data = await getMovieReviews(normalizedMovieId, nextCursor);
+			setReviews((prev) => [...prev, ...data.reviews]);
+			setNextCursor(data.nextCursor);
+		} catch (e) {
+			console.error("getMovieReviews failed", e);
+		} finally {
+			setLoadingMore(false);
+		}
 	}
 
 	useEffect(() => {
@@ -54,6 +72,7 @@ export default function MovieReviewsTab({
 
 		if (!normalizedMovieId) {
 			setReviews([]);
+			setNextCursor(null);
 			setLoading(false);
 			return () => {
 				alive = false;
@@ -64,10 +83,16 @@ export default function MovieReviewsTab({
 			try {
 				setLoading(true);
 				const data = await getMovieReviews(normalizedMovieId);
-				if (alive) setReviews(data);
+				if (alive) {
+					setReviews(data.reviews);
+					setNextCursor(data.nextCursor);
+				}
 			} catch (e) {
 				console.error("getMovieReviews failed", e);
-				if (alive) setReviews([]);
+				if (alive) {
+					setReviews([]);
+					setNextCursor(null);
+				}
 			} finally {
 				if (alive) setLoading(false);
 			}
@@ -149,6 +174,18 @@ export default function MovieReviewsTab({
 					</div>
 				))
 			)}
+
+			{nextCursor && (
+				<Button
+					type="button"
+					variant="secondary"
+					className="w-full rounded-xl border border-zinc-800 bg-zinc-900 text-zinc-200 hover:bg-zinc-800"
+					onClick={loadMoreReviews}
+					disabled={loadingMore}
+				>
+					{loadingMore ? "불러오는 중.." : "리뷰 더보기"}
+				</Button>
+			)}
 		</div>
 	);
 }